@@ -0,0 +1,158 @@
+"""Compare selectolax backends (Modest vs Lexbor) on the fixture pages.
+
+For every parser module, each matching fixture page under tests/test_html
+is parsed into a document (parse throughput) and then run through the
+module's parser (selector throughput), once per backend.
+
+Usage:
+    python scripts/download_fixtures.py         # once, to fetch fixtures
+    python scripts/bench_html_backends.py
+    python scripts/bench_html_backends.py --repeat 20 --only series
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from selectolax.lexbor import LexborHTMLParser
+from selectolax.parser import HTMLParser
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from vlrdevapi._event.info.parser import parse_event_info
+from vlrdevapi._event.list.parser import parse_event_list
+from vlrdevapi._event.matches.parser import parse_event_matches
+from vlrdevapi._event.stages.parser import parse_event_page_dates, parse_event_stages
+from vlrdevapi._event.standings.parser import parse_standings
+from vlrdevapi._event.teams.parser import parse_teams
+from vlrdevapi._matches.completed.parser import parse_completed_matches
+from vlrdevapi._matches.live.parser import parse_live_listing
+from vlrdevapi._matches.upcoming.parser import parse_upcoming_matches
+from vlrdevapi._player.agents.parser import parse_agent_stats
+from vlrdevapi._player.info.parser import parse_player_info
+from vlrdevapi._player.matches.parser import parse_player_matches
+from vlrdevapi._player.profile.parser import parse_player_profile
+from vlrdevapi._player.teams.parser import parse_player_teams
+from vlrdevapi._series.economy.parser import parse_economy_data
+from vlrdevapi._series.info.parser import parse_series_info
+from vlrdevapi._series.performance.parser import parse_performance_data
+from vlrdevapi._series.players.parser import parse_players_stats
+from vlrdevapi._series.rounds.parser import parse_rounds_data
+from vlrdevapi._series.vods.parser import parse_series_vods
+from vlrdevapi._team.completed_matches.parser import parse_team_completed_matches
+from vlrdevapi._team.info.parser import parse_team_info
+from vlrdevapi._team.placements.parser import parse_team_placements
+from vlrdevapi._team.roster.parser import parse_team_roster
+from vlrdevapi._team.stats.parser import parse_team_stats
+from vlrdevapi._team.transactions.parser import parse_team_transactions
+from vlrdevapi._team.upcoming_matches.parser import parse_team_upcoming_matches
+
+FIXTURES_DIR = REPO_ROOT / "tests" / "test_html"
+
+BACKENDS: dict[str, Callable[[bytes], Any]] = {
+    "modest": lambda body: HTMLParser(body, detect_encoding=False),
+    "lexbor": LexborHTMLParser,
+}
+
+
+def _listing(parse: Callable[..., Any]) -> Callable[[Any], Any]:
+    # Listing parsers enrich teams over the network; skip that part.
+    return lambda html: parse(html, None, None, 0, None, None)
+
+
+# (parser module, fixture glob, parser call)
+CASES: list[tuple[str, str, Callable[[Any], Any]]] = [
+    ("event.info", "event/*/overview.html", lambda html: parse_event_info(html, 0)),
+    ("event.list", "events/*.html", lambda html: parse_event_list(html, {})),
+    ("event.matches", "event/*/matches_*.html", lambda html: parse_event_matches(html, 0)),
+    ("event.stages", "event/*/matches_all.html", lambda html: parse_event_stages(html, 0)),
+    ("event.stages.dates", "event/*/overview.html", parse_event_page_dates),
+    ("event.standings", "event/*/overview.html", parse_standings),
+    ("event.teams", "event/*/overview.html", parse_teams),
+    ("matches.completed", "matches/results*.html", _listing(parse_completed_matches)),
+    ("matches.live", "matches/matches*.html", parse_live_listing),
+    ("matches.upcoming", "matches/matches*.html", _listing(parse_upcoming_matches)),
+    ("player.agents", "player/*/overview.html", parse_agent_stats),
+    ("player.info", "player/*/overview.html", parse_player_info),
+    ("player.matches", "player/*/matches*.html", parse_player_matches),
+    ("player.profile", "player/*/overview.html", parse_player_profile),
+    ("player.teams", "player/*/overview.html", parse_player_teams),
+    ("series.economy", "series/*/game_*_economy.html", parse_economy_data),
+    ("series.info", "series/*/overview.html", parse_series_info),
+    ("series.performance", "series/*/game_*_performance.html", parse_performance_data),
+    ("series.players", "series/*/game_*_overview.html", parse_players_stats),
+    ("series.rounds", "series/*/game_*_rounds.html", parse_rounds_data),
+    ("series.vods", "series/*/overview.html", parse_series_vods),
+    ("team.completed_matches", "team/*/completed_matches.html", lambda html: parse_team_completed_matches(html, 0)),
+    ("team.info", "team/*/overview_light.html", lambda html: parse_team_info(html, html)),
+    ("team.placements", "team/*/overview_light.html", lambda html: parse_team_placements(html, 0)),
+    ("team.roster", "team/*/overview_light.html", parse_team_roster),
+    ("team.stats", "team/*/stats*.html", lambda html: parse_team_stats(html, 0)),
+    ("team.transactions", "team/*/transactions.html", lambda html: parse_team_transactions(html, 0)),
+    ("team.upcoming_matches", "team/*/overview_light.html", lambda html: parse_team_upcoming_matches(html, 0)),
+]
+
+
+def _bench(bodies: list[bytes], build: Callable[[bytes], Any], parse: Callable[[Any], Any], repeat: int) -> tuple[float, float]:
+    """Return the best (document build, parser run) seconds for one pass over ``bodies``."""
+    best_build = best_parse = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        docs = [build(body) for body in bodies]
+        built = time.perf_counter()
+        for doc in docs:
+            parse(doc)
+        done = time.perf_counter()
+        best_build = min(best_build, built - start)
+        best_parse = min(best_parse, done - built)
+    return best_build, best_parse
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5, help="passes per case; the best is reported (default 5)")
+    ap.add_argument("--only", default="", help="only run parser modules containing this substring")
+    args = ap.parse_args()
+
+    if not FIXTURES_DIR.exists():
+        print(f"No fixtures at {FIXTURES_DIR}; run scripts/download_fixtures.py first.")
+        return 1
+
+    header = f"{'parser':<24}{'pages':>6}{'MB':>7}" + "".join(
+        f"{name + ' MB/s':>14}{name + ' parses/s':>18}" for name in BACKENDS
+    )
+    print(header)
+    print("-" * len(header))
+
+    totals = dict.fromkeys(BACKENDS, 0.0)
+    with patch("vlrdevapi._matches.common.enrich_team_data_sync"):
+        for label, pattern, parse in CASES:
+            if args.only not in label:
+                continue
+            bodies = [path.read_bytes() for path in sorted(FIXTURES_DIR.glob(pattern))]
+            if not bodies:
+                print(f"{label:<24}{'-':>6}  (no fixtures for {pattern})")
+                continue
+            megabytes = sum(map(len, bodies)) / 1e6
+            row = f"{label:<24}{len(bodies):>6}{megabytes:>7.2f}"
+            for name, build in BACKENDS.items():
+                build_s, parse_s = _bench(bodies, build, parse, args.repeat)
+                totals[name] += build_s + parse_s
+                row += f"{megabytes / build_s:>14.1f}{len(bodies) / parse_s:>18.1f}"
+            print(row)
+
+    print("-" * len(header))
+    for name, seconds in totals.items():
+        print(f"{name}: {seconds * 1000:.1f} ms total (best pass per case)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
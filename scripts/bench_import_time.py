@@ -0,0 +1,77 @@
+"""Measure how long ``import vlrdevapi`` and first namespace use take.
+
+Every step runs in a fresh interpreter, as a CLI run or serverless cold
+start would, and the median of several runs is reported. The script exits
+non-zero when a bare ``import vlrdevapi`` takes longer than
+``--max-import-ms`` (50 ms by default; 0 disables the check), for use as a
+regression check. tests/test_lazy_imports.py asserts a looser bound.
+
+Usage:
+    python scripts/bench_import_time.py
+    python scripts/bench_import_time.py --runs 15 --max-import-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Each step's setup runs untimed, then its statement is timed.
+STEPS: list[tuple[str, str, str]] = [
+    ("import vlrdevapi", "", "import vlrdevapi"),
+    ("VLRClient()", "import vlrdevapi", "vlrdevapi.VLRClient()"),
+    ("first namespace", "import vlrdevapi; c = vlrdevapi.VLRClient()", "c.team"),
+    ("all namespaces", "import vlrdevapi; c = vlrdevapi.VLRClient()", "c.team; c.player; c.series; c.matches; c.event"),
+]
+
+_PROBE = """
+import json, sys, time
+{setup}
+before = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, len(set(sys.modules) - before)]))
+"""
+
+
+def _run(setup: str, statement: str) -> tuple[float, int]:
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT / "src")}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(setup=setup, statement=statement)],
+        capture_output=True, text=True, check=True, env=env,
+    ).stdout
+    elapsed, modules = json.loads(out.splitlines()[-1])
+    return elapsed, modules
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=7, help="fresh interpreters per step (default 7)")
+    ap.add_argument("--max-import-ms", type=float, default=50.0,
+                    help="fail if `import vlrdevapi` takes longer, 0 to disable (default 50)")
+    args = ap.parse_args()
+
+    print(f"{'step':<20}{'median ms':>11}{'modules':>9}")
+    medians: dict[str, float] = {}
+    for label, setup, statement in STEPS:
+        results = [_run(setup, statement) for _ in range(args.runs)]
+        medians[label] = statistics.median(t for t, _ in results) * 1000
+        print(f"{label:<20}{medians[label]:>11.1f}{results[-1][1]:>9}")
+
+    limit = args.max_import_ms
+    if limit and medians["import vlrdevapi"] > limit:
+        print(f"import vlrdevapi took {medians['import vlrdevapi']:.1f} ms, over the {limit:g} ms threshold")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+"""Measure how much memory interning repeated names saves on parsed results.
+
+Parses many pages, keeps every result, and reports the memory they retain
+(via ``tracemalloc``) with the parsers' ``intern_text`` calls enabled and
+with them replaced by a no-op. Fixture pages are parsed repeatedly when
+present; otherwise synthetic pages are used for ``series.players`` and
+``team.completed_matches``, with agents, team tags, events and stages drawn
+from a small vocabulary as on the site.
+
+Usage:
+    python scripts/bench_interning.py
+    python scripts/bench_interning.py --pages 5000 --only series
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from selectolax.parser import HTMLParser
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from bench_html_backends import CASES, FIXTURES_DIR
+
+from vlrdevapi._series.players.parser import parse_players_stats
+from vlrdevapi._team.completed_matches.parser import parse_team_completed_matches
+from vlrdevapi._utils import intern
+
+AGENTS = ["jett", "raze", "omen", "sova", "killjoy", "viper", "skye", "kay/o", "fade", "gekko", "clove", "tejo"]
+MAPS = ["Ascent", "Bind", "Haven", "Split", "Lotus", "Sunset", "Icebox", "Pearl", "Abyss", "Fracture"]
+TAGS = ["FNC", "SEN", "PRX", "EDG", "TH", "G2", "DRX", "LOUD", "NRG", "T1", "GEN", "BLG"]
+EVENTS = [
+    "Champions Tour 2025: Masters Toronto", "Champions Tour 2025: EMEA Stage 2",
+    "Champions Tour 2025: Americas Stage 1", "Valorant Champions 2025", "Esports World Cup 2025",
+]
+STAGES = ["Group Stage", "Playoffs", "Swiss Stage", "Regular Season", "Main Event"]
+
+
+def _synthetic_players_page(seed: int, games: int = 4) -> bytes:
+    def side_cell(value: Any) -> str:
+        return '<td class="mod-stat">' + "".join(
+            f'<span class="side {side}">{value}</span>' for side in ("mod-both", "mod-t", "mod-ct")
+        ) + "</td>"
+
+    stats = "".join(side_cell(v) for v in ("1.10", 220, 17, 12, 3, "+5", "75%", 140, "25%", 2, 1, "+1"))
+
+    def table(team: int) -> str:
+        tag = TAGS[(seed + team) % len(TAGS)]
+        return '<table class="wf-table-inset mod-overview"><tbody>' + "".join(
+            f'<tr><td class="mod-player"><a href="/player/{seed * 10 + team * 5 + i}/p">'
+            f'<div class="text-of">Player{seed}x{team}x{i}</div><div class="ge-text-light">{tag}</div></a>'
+            f'<i class="flag mod-us"></i></td>'
+            f'<td class="mod-agents"><img alt="{AGENTS[(seed + team * 5 + i) % len(AGENTS)]}"></td>{stats}</tr>'
+            for i in range(5)
+        ) + "</tbody></table>"
+
+    body = []
+    for g in ["all", *range(1, games)]:
+        header = "" if g == "all" else (
+            f'<div class="vm-stats-game-header"><div class="map"><div style="font-weight: 700">'
+            f'<span>{MAPS[(seed + g) % len(MAPS)]}</span></div></div></div>'
+        )
+        body.append(f'<div class="vm-stats-game" data-game-id="{g}">{header}{table(0)}{table(1)}</div>')
+    return ("<html><body>" + "".join(body) + "</body></html>").encode()
+
+
+def _synthetic_team_matches_page(seed: int, rows: int = 50) -> bytes:
+    items = "".join(
+        f'<a class="wf-card fc-flex m-item" href="/{seed * rows + i + 1}/a-vs-b">'
+        f'<div class="m-item-event"><div style="font-weight: 700">{EVENTS[(seed + i) % len(EVENTS)]}</div>'
+        f'{STAGES[i % len(STAGES)]}</div>'
+        f'<div class="m-item-result mod-win"><span>2</span><span>1</span></div>'
+        f'<div class="m-item-date"><div>2025/06/{i % 28 + 1:02d}</div>3:00 pm</div></a>'
+        for i in range(rows)
+    )
+    return f"<html><body>{items}</body></html>".encode()
+
+
+@contextmanager
+def _interning(enabled: bool) -> Iterator[None]:
+    """Run with the parsers' ``intern_text`` as is, or swapped for ``str``."""
+    intern.clear_interned()
+    shared = intern.intern_text
+    modules = [] if enabled else [
+        m for m in list(sys.modules.values()) if m is not intern and getattr(m, "intern_text", None) is shared
+    ]
+    for m in modules:
+        m.intern_text = str  # type: ignore[attr-defined]
+    try:
+        yield
+    finally:
+        for m in modules:
+            m.intern_text = shared  # type: ignore[attr-defined]
+        intern.clear_interned()
+
+
+def _retained(parse: Callable[[Any], Any], bodies: list[bytes], enabled: bool) -> tuple[int, int]:
+    """Return (bytes retained by the results, number of results)."""
+    with _interning(enabled):
+        gc.collect()
+        tracemalloc.start()
+        results = [parse(HTMLParser(body)) for body in bodies]
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    del results
+    return size, len(bodies)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", type=int, default=1000, help="pages parsed per case (default 1000)")
+    ap.add_argument("--only", default="", help="only measure parser modules containing this substring")
+    args = ap.parse_args()
+
+    cases: list[tuple[str, list[bytes], Callable[[Any], Any]]] = []
+    if FIXTURES_DIR.exists():
+        for label, pattern, parse in CASES:
+            paths = sorted(FIXTURES_DIR.glob(pattern)) if args.only in label else []
+            if paths:
+                bodies = [p.read_bytes() for p in paths]
+                cases.append((label, [bodies[i % len(bodies)] for i in range(args.pages)], parse))
+    else:
+        print(f"No fixtures at {FIXTURES_DIR}; using synthetic pages.")
+        synthetic: list[tuple[str, Callable[[int], bytes], Callable[[Any], Any]]] = [
+            ("series.players", _synthetic_players_page, parse_players_stats),
+            ("team.completed_matches", _synthetic_team_matches_page, lambda doc: parse_team_completed_matches(doc, team_id=1)),
+        ]
+        for label, page, parse in synthetic:
+            if args.only in label:
+                cases.append((label, [page(i) for i in range(args.pages)], parse))
+
+    print(f"{'parser':<24}{'pages':>7}{'plain KiB':>12}{'interned KiB':>14}{'saved':>8}")
+    with patch("vlrdevapi._matches.common.enrich_team_data_sync"):
+        for label, bodies, parse in cases:
+            plain, n = _retained(parse, bodies, enabled=False)
+            interned, _ = _retained(parse, bodies, enabled=True)
+            saved = 1 - interned / plain if plain else 0.0
+            print(f"{label:<24}{n:>7}{plain / 1024:>12.0f}{interned / 1024:>14.0f}{saved * 100:>7.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+"""Compare indexed ``KillMatrix`` lookups against the previous linear scans.
+
+A synthetic players x players matrix is built, then every query method is
+timed through the model (dict index, built on first use) and through the
+scan the methods used before, rebuilt here for comparison.
+
+Usage:
+    python scripts/bench_kill_matrix.py
+    python scripts/bench_kill_matrix.py --players 5 10 20 --number 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from vlrdevapi._series.performance.models import KillEntry, KillMatrix
+
+
+def scan_lookup(m: KillMatrix, killer: str, victim: str) -> KillEntry | None:
+    for e in m.entries:
+        if e.killer == killer and e.victim == victim:
+            return e
+    return None
+
+
+def scan_by_killer(m: KillMatrix, name: str) -> list[KillEntry]:
+    return [e for e in m.entries if e.killer == name]
+
+
+def scan_by_team(m: KillMatrix, team: str) -> list[KillEntry]:
+    return [e for e in m.entries if e.killer_team == team or e.victim_team == team]
+
+
+def _matrix(players: int) -> KillMatrix:
+    return KillMatrix(entries=[
+        KillEntry(killer=f"k{i}", killer_team="T1", victim=f"v{j}", victim_team="T2", kills=i + j)
+        for i in range(players)
+        for j in range(players)
+    ])
+
+
+def _best(fn: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--players", type=int, nargs="+", default=[5, 10], help="players per side (default 5 10)")
+    ap.add_argument("--number", type=int, default=50000, help="calls per timing (default 50000)")
+    args = ap.parse_args()
+
+    print(f"{'case':<28}{'scan ns':>10}{'index ns':>10}{'speedup':>9}")
+    for players in args.players:
+        m = _matrix(players)
+        k, v = f"k{players - 1}", f"v{players - 1}"
+        cases = [
+            ("lookup (last pair)", lambda m=m, k=k, v=v: scan_lookup(m, k, v), lambda m=m, k=k, v=v: m.lookup(k, v)),
+            ("by_killer", lambda m=m, k=k: scan_by_killer(m, k), lambda m=m, k=k: m.by_killer(k)),
+            ("by_team", lambda m=m: scan_by_team(m, "T2"), lambda m=m: m.by_team("T2")),
+        ]
+        for label, scan, indexed in cases:
+            assert scan() == indexed()
+            before, after = _best(scan, args.number), _best(indexed, args.number)
+            name = f"{players}x{players} {label}"
+            print(f"{name:<28}{before * 1e9:>10.0f}{after * 1e9:>10.0f}{before / after:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
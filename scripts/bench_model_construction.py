@@ -0,0 +1,176 @@
+"""Measure what building pydantic models costs the parsers.
+
+Part one times each row model built three ways from already-typed values:
+the validating constructor, ``model_construct``, and a bare builder that
+only sets the instance ``__dict__`` (the floor for any trusted path that
+keeps ``model_fields_set`` correct).
+
+Part two profiles every parser over the fixture pages and reports the share
+of parse time spent constructing models. Without fixtures, a synthetic
+series overview page is used for ``series.players``.
+
+Usage:
+    python scripts/bench_model_construction.py
+    python scripts/bench_model_construction.py --only series --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import pstats
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from pydantic import BaseModel
+from selectolax.parser import HTMLParser
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from bench_html_backends import CASES, FIXTURES_DIR
+
+from vlrdevapi._matches.completed.models import (
+    CompletedMatchEntry,
+    TeamInCompletedMatch,
+)
+from vlrdevapi._series.performance.models import KillEntry
+from vlrdevapi._series.players.models import PlayerGameStats, PlayerStats, SideStats
+from vlrdevapi._series.players.parser import parse_players_stats
+from vlrdevapi._series.rounds.models import RoundData
+
+_SIDE = SideStats(
+    rating=1.1, acs=220.0, kills=17, deaths=12, assists=3, kd_diff=5, kast=0.75,
+    adr=140.0, hs_percent=0.25, first_kills=2, first_deaths=1, fk_fd_diff=1,
+)
+_TEAM = TeamInCompletedMatch(id=2593, name="FNATIC", tag="FNC", country_name="Europe", score=2, is_winner=True)
+
+SAMPLES: list[BaseModel] = [
+    _SIDE,
+    PlayerGameStats(
+        player_id=9, name="Boaster", country_code="gb", country="United Kingdom", team_short="FNC",
+        agents=["Astra"], stats=PlayerStats(overall=_SIDE, attack=_SIDE, defend=_SIDE),
+    ),
+    CompletedMatchEntry(
+        match_id=427991, url="/427991/a-vs-b", event="Champions", stage="Playoffs",
+        team1=_TEAM, team2=_TEAM, status="completed", datetime=datetime(2025, 1, 1, tzinfo=UTC),
+    ),
+    KillEntry(killer="a", killer_id=1, killer_team="A", victim="b", victim_id=2, victim_team="B", kills=4, deaths=3, diff=1),
+    RoundData(round_number=1, winner_team_name="A", winner_team_id=1, win_type="Elimination", side="Attack", team1_score=1),
+]
+
+
+def _bare(cls: type[BaseModel]) -> Callable[..., BaseModel]:
+    defaults = {name: field.default for name, field in cls.model_fields.items()}
+    setattr_ = object.__setattr__
+
+    def build(**values: Any) -> BaseModel:
+        data = defaults.copy()
+        data.update(values)
+        obj = cls.__new__(cls)
+        setattr_(obj, "__dict__", data)
+        setattr_(obj, "__pydantic_fields_set__", set(values))
+        setattr_(obj, "__pydantic_extra__", None)
+        setattr_(obj, "__pydantic_private__", None)
+        return obj
+
+    return build
+
+
+def _best(fn: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def bench_models(number: int) -> None:
+    print(f"{'model':<24}{'validate µs':>14}{'construct µs':>15}{'bare µs':>10}")
+    for sample in SAMPLES:
+        cls, values = type(sample), dict(sample.__dict__)
+        bare = _bare(cls)
+        times = [
+            _best(lambda cls=cls, values=values: cls(**values), number),
+            _best(lambda cls=cls, values=values: cls.model_construct(**values), number),
+            _best(lambda bare=bare, values=values: bare(**values), number),
+        ]
+        print(f"{cls.__name__:<24}" + "".join(f"{t * 1e6:>{w}.2f}" for t, w in zip(times, (14, 15, 10), strict=True)))
+
+
+def _synthetic_players_page(games: int = 5) -> str:
+    def cell(values: tuple[Any, Any, Any], cls: str = "") -> str:
+        return f'<td class="mod-stat {cls}">' + "".join(
+            f'<span class="side {side}">{v}</span>' for side, v in zip(("mod-both", "mod-t", "mod-ct"), values, strict=True)
+        ) + "</td>"
+
+    stats = "".join((
+        cell(("1.10", "1.2", "1.0")), cell((220, 230, 210)), cell((17, 9, 8)), cell((12, 6, 6)), cell((3, 1, 2)),
+        cell(("+5", "+3", "+2"), "mod-kd-diff"), cell(("75%", "70%", "80%")), cell((140, 150, 130)),
+        cell(("25%", "20%", "30%")), cell((2, 1, 1)), cell((1, 0, 1)), cell(("+1", "+1", "0"), "mod-fk-diff"),
+    ))
+    rows = "".join(
+        f'<tr><td class="mod-player"><a href="/player/{100 + i}/p{i}"><div class="text-of">Player{i}</div>'
+        f'<div class="ge-text-light">TM</div></a><i class="flag mod-us"></i></td>'
+        f'<td class="mod-agents"><img alt="jett"></td>{stats}</tr>'
+        for i in range(5)
+    )
+    table = f'<table class="wf-table-inset mod-overview"><tbody>{rows}</tbody></table>'
+    return "<html><body>" + "".join(
+        f'<div class="vm-stats-game" data-game-id="{g}">{table}{table}</div>' for g in ["all", *range(1, games)]
+    ) + "</body></html>"
+
+
+def _pydantic_share(parse: Callable[[Any], Any], docs: list[Any], repeat: int) -> tuple[float, float]:
+    """Return (seconds per pass, share of it inside model construction)."""
+    profile = cProfile.Profile()
+    profile.enable()
+    for _ in range(repeat):
+        for doc in docs:
+            parse(doc)
+    profile.disable()
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    total = sum(tt for _, _, tt, _, _ in stats.values())
+    construction = sum(
+        ct for (path, _, name), (_, _, _, ct, _) in stats.items()
+        if name == "__init__" and path.endswith(("pydantic/main.py", "pydantic\\main.py"))
+    )
+    return total / repeat, construction / total if total else 0.0
+
+
+def bench_parsers(only: str, repeat: int) -> None:
+    cases: list[tuple[str, list[Any], Callable[[Any], Any]]] = []
+    if FIXTURES_DIR.exists():
+        for label, pattern, parse in CASES:
+            if only in label:
+                docs = [HTMLParser(p.read_bytes()) for p in sorted(FIXTURES_DIR.glob(pattern))]
+                if docs:
+                    cases.append((label, docs, parse))
+    elif only in "series.players":
+        print(f"No fixtures at {FIXTURES_DIR}; using a synthetic series.players page.")
+        cases.append(("series.players", [HTMLParser(_synthetic_players_page())], parse_players_stats))
+
+    print(f"{'parser':<24}{'pages':>6}{'ms/pass':>10}{'models %':>10}")
+    with patch("vlrdevapi._matches.common.enrich_team_data_sync"):
+        for label, docs, parse in cases:
+            seconds, share = _pydantic_share(parse, docs, repeat)
+            print(f"{label:<24}{len(docs):>6}{seconds * 1000:>10.2f}{share * 100:>10.1f}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--number", type=int, default=10000, help="constructions per model timing (default 10000)")
+    ap.add_argument("--repeat", type=int, default=20, help="profiled passes per parser (default 20)")
+    ap.add_argument("--only", default="", help="only profile parser modules containing this substring")
+    args = ap.parse_args()
+
+    bench_models(args.number)
+    print()
+    bench_parsers(args.only, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""Benchmark ``parse_team_stats`` on a long date-range stats page.
+
+Uses ``--page`` when given. Otherwise a synthetic page is generated with
+``--maps`` map rows and ``--games`` games per map, shaped like a team stats
+page covering several years (every game has a toggle row and a
+composition), which is where per-map whole-document queries used to
+dominate.
+
+Usage:
+    python scripts/bench_team_stats.py
+    python scripts/bench_team_stats.py --games 400 --repeat 20
+    python scripts/bench_team_stats.py --page tests/test_html/team/1034/stats.html
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from selectolax.parser import HTMLParser
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from vlrdevapi._team.stats.parser import parse_team_stats
+
+MAPS = ["Ascent", "Bind", "Haven", "Split", "Lotus", "Sunset", "Icebox", "Breeze", "Pearl", "Fracture", "Abyss", "Corrode"]
+AGENTS = ["jett", "sova", "omen", "killjoy", "kay-o", "raze", "viper", "skye", "breach", "cypher"]
+
+
+def _comp_hash(map_idx: int, comp: int) -> str:
+    return f"{map_idx:06x}{comp:06x}"
+
+
+def synthetic_page(maps: int, games: int, comps: int = 4) -> str:
+    """Build a team stats page with ``maps`` maps of ``games`` games each."""
+    rows: list[str] = []
+    for m in range(maps):
+        name = MAPS[m % len(MAPS)] + ("" if m < len(MAPS) else str(m))
+        aggs = "".join(
+            f'<div class="agent-comp-agg" data-agent-comp-hash="{_comp_hash(m, c)}"><span>({games // comps})</span>'
+            + "".join(f'<img src="/img/vlr/game/agents/{AGENTS[(c + a) % len(AGENTS)]}.png">' for a in range(5))
+            + "</div>"
+            for c in range(comps)
+        )
+        numbers = "".join(f"<td>{v}</td>" for v in ("55%", 11, 9, 10, 10, "48%", 120, 130, "52%", 131, 121))
+        rows.append(f'<tr><td>{name} ({games})</td><td></td>{numbers}<td>{aggs}</td></tr>')
+        for g in range(games):
+            result = "mod-win" if g % 2 else "mod-loss"
+            rows.append(
+                f'<tr class="mod-toggle mod-{name}" style="display: none;">'
+                f'<td class="{result}"><a href="/{100000 + m * 1000 + g}/a-vs-b">'
+                f'<div>2024/0{1 + g % 9}/1{g % 10}</div><div class="text-of">Opponent {g % 30}</div>'
+                f'<div class="game-score">13/{g % 12}</div>'
+                f'<div class="game-half"><div class="game-half-label">atk</div><div>7/5</div></div>'
+                f'<div class="game-half"><div class="game-half-label">def</div><div>6/{g % 7}</div></div>'
+                f"</a></td><td class=\"{_comp_hash(m, g % comps)}\"></td><td></td></tr>"
+            )
+    return (
+        '<html><body><table class="wf-table mod-team-maps"><thead><tr><th>Map</th></tr></thead>'
+        f"<tbody>{''.join(rows)}</tbody></table></body></html>"
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--page", type=Path, help="stats page to parse instead of a synthetic one")
+    ap.add_argument("--maps", type=int, default=12, help="synthetic map rows (default 12)")
+    ap.add_argument("--games", type=int, default=150, help="synthetic games per map (default 150)")
+    ap.add_argument("--repeat", type=int, default=10, help="runs per level; the best is reported (default 10)")
+    args = ap.parse_args()
+
+    body = args.page.read_text(encoding="utf-8") if args.page else synthetic_page(args.maps, args.games)
+    html = HTMLParser(body)
+    print(f"page: {len(body) / 1e6:.2f} MB, {len(html.css('tr.mod-toggle'))} game rows")
+
+    for level in ("none", "basic", "detailed"):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            # Detailed enrichment without network: no series info lookups.
+            parse_team_stats(html, 0, agent_composition=level, series_info_fn=None)
+            best = min(best, time.perf_counter() - start)
+        print(f"{level:<9} {best * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
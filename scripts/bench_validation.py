@@ -0,0 +1,102 @@
+"""Measure the per-call cost of ``sanitize_and_validate``.
+
+Each case calls a namespace method whose body only returns a stored result,
+as a cache hit does, so the timings are the wrapper's own overhead. The
+previous wrapper (``Signature.bind``, ``apply_defaults`` and pydantic's
+``validate_call`` on every call, and again on curried forwarding methods)
+is rebuilt here for comparison.
+
+Usage:
+    python scripts/bench_validation.py
+    python scripts/bench_validation.py --number 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import date
+from functools import wraps
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import validate_call
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from vlrdevapi.validators import _validate_bound_args, forwarded, sanitize_and_validate
+
+_RESULT = object()
+
+
+def previous(func: Callable[..., Any]) -> Callable[..., Any]:
+    """The wrapper as it was: bind, apply defaults and validate every call."""
+    pydantic_validated = validate_call(validate_return=False)(func)
+    sig = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        bound = _validate_bound_args(sig, args, kwargs)
+        return pydantic_validated(*bound.args, **bound.kwargs)
+
+    return wrapper
+
+
+def _namespaces(decorate: Callable[..., Any], forward: Callable[..., Any]) -> tuple[Any, Any]:
+    class Stats:
+        _sync = None
+
+        @decorate
+        def __call__(
+            self,
+            team_id: int,
+            date_start: date | None = None,
+            event_id: int | None = None,
+            agent_composition: Literal["none", "basic", "detailed"] = "none",
+        ) -> object:
+            return _RESULT
+
+    class Curried:
+        def __init__(self, stats: Stats):
+            self._stats = stats
+
+        @forward
+        def stats(self, date_start: date | None = None) -> object:
+            return self._stats(4568, date_start=date_start)
+
+    stats = Stats()
+    return stats, Curried(stats)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--number", type=int, default=20000, help="calls per timing (default 20000)")
+    args = ap.parse_args()
+
+    old_stats, old_curried = _namespaces(previous, previous)
+    new_stats, new_curried = _namespaces(sanitize_and_validate, forwarded)
+    day = date(2025, 1, 1)
+    cases: list[tuple[str, Callable[[Any, Any], Any]]] = [
+        ("positional id", lambda s, _: s(4568)),
+        ("keywords", lambda s, _: s(4568, date_start=day, event_id=2283, agent_composition="basic")),
+        ("coerced keywords", lambda s, _: s(4568, date_start="2025-01-01", agent_composition=" basic ")),
+        ("curried", lambda _, c: c.stats(date_start=day)),
+    ]
+
+    def best(fn: Callable[[], Any]) -> float:
+        return min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number
+
+    print(f"{'call':<20}{'previous µs':>13}{'current µs':>12}{'speedup':>9}")
+    for label, call in cases:
+        before = best(lambda call=call: call(old_stats, old_curried))
+        after = best(lambda call=call: call(new_stats, new_curried))
+        print(f"{label:<20}{before * 1e6:>13.2f}{after * 1e6:>12.2f}{before / after:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -23,15 +23,21 @@ Examples:
     >>> matches.matches[0].score
     '2-1'
 
+    Tuning the default client:
+
+    >>> vlrdevapi.configure(requests_per_second=1.0, parse_memo_size=512)
+
 """
 
 import atexit as _atexit
-from typing import TYPE_CHECKING
-
-from vlrdevapi._client import VLRClient
-import contextlib
+import contextlib as _contextlib
+import importlib as _importlib
+import os as _os
+import threading as _threading
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from vlrdevapi._client import VLRClient
     from vlrdevapi._event.namespace import EventNamespace
     from vlrdevapi._matches.namespace import MatchesNamespace
     from vlrdevapi._player.namespace import PlayerNamespace
@@ -48,33 +54,124 @@ if TYPE_CHECKING:
 __version__ = "2.0.0"
 
 _default_client: "VLRClient | None" = None
+_default_options: dict[str, Any] = {}
+_default_client_lock = _threading.Lock()
 
 
 def _get_default_client() -> "VLRClient":
-    global _default_client  # noqa: PLW0603
-    if _default_client is None:
-        _default_client = VLRClient()
-    return _default_client
+    global _default_client
+    client = _default_client
+    if client is None:
+        with _default_client_lock:
+            # Another thread may have created it while this one waited.
+            if _default_client is None:
+                from vlrdevapi._client import VLRClient
+
+                _default_client = VLRClient(**_default_options)
+            client = _default_client
+    return client
+
+
+def configure(
+    *,
+    parse_memo_size: int | None = None,
+    document_cache_size: int | None = None,
+    **client_options: Any,
+) -> None:
+    """Configure the default client used by ``vlrdevapi.team``, ``vlrdevapi.player`` and so on.
+
+    Options are merged with those of earlier calls and a new default client
+    is created from them right away, so invalid options raise here. Calls
+    already running on the previous default client finish on it, and its
+    connections are closed once nothing uses it any more.
+
+    Examples:
+        >>> vlrdevapi.configure(requests_per_second=1.0, max_retries=5)
+
+        >>> vlrdevapi.configure(limits=httpx.Limits(max_connections=20))
+
+        >>> vlrdevapi.configure(model_backend="slots", parse_memo_size=0)
+
+    Args:
+        parse_memo_size: How many parsed results of unchanged pages to keep
+            for reuse (shared by all clients). ``0`` disables the memo.
+            Defaults to ``128``.
+        document_cache_size: How many parsed documents of byte-identical
+            responses to keep for reuse (shared by all clients). ``0``
+            disables the cache. Defaults to ``16``.
+        **client_options: ``VLRClient`` arguments, such as
+            ``requests_per_second``, ``max_retries``, ``timeout`` or
+            ``model_backend``. ``httpx.Client`` arguments such as ``limits``
+            set the size of the connection pool.
+
+    Raises:
+        ValueError: If a cache size is negative, or a client option is invalid.
+        TypeError: If a client option is unknown.
+
+    """
+    global _default_client
+    for name, size in (("parse_memo_size", parse_memo_size), ("document_cache_size", document_cache_size)):
+        if size is not None and size < 0:
+            msg = f"{name} must be >= 0, got {size}"
+            raise ValueError(msg)
+
+    from vlrdevapi._client import VLRClient
+
+    with _default_client_lock:
+        options = {**_default_options, **client_options}
+        client = VLRClient(**options)
+        _default_options.clear()
+        _default_options.update(options)
+        previous, _default_client = _default_client, client
+    if previous is not None:
+        previous._close_when_unused()
+
+    if parse_memo_size is not None:
+        from vlrdevapi._memo import _PARSE_MEMO
+
+        _PARSE_MEMO.resize(parse_memo_size)
+    if document_cache_size is not None:
+        from vlrdevapi.fetcher import _DOCUMENTS
+
+        _DOCUMENTS.resize(document_cache_size)
 
 
 def _cleanup_default_client() -> None:
-    global _default_client  # noqa: PLW0603
-    if _default_client is not None:
-        with contextlib.suppress(OSError):
-            _default_client.close()
-        _default_client = None
+    global _default_client
+    with _default_client_lock:
+        client, _default_client = _default_client, None
+    if client is not None:
+        with _contextlib.suppress(OSError):
+            client.close()
+
+
+def _reset_default_client_lock() -> None:
+    # The parent's lock may have been held at the fork. The default client
+    # itself gives the child its own connections (see ``VLRClient``).
+    global _default_client_lock
+    _default_client_lock = _threading.Lock()
 
 
 _atexit.register(_cleanup_default_client)
+if hasattr(_os, "register_at_fork"):
+    _os.register_at_fork(after_in_child=_reset_default_client_lock)
 
 _BOUND_NAMES = frozenset({"event", "series", "player", "team", "matches"})
 
+# Public submodules, reachable as attributes after a bare ``import vlrdevapi``.
+_SUBMODULES = frozenset({"commons", "exceptions", "fetcher", "validators"})
+
 
 def __getattr__(name: str) -> object:
     if name in _BOUND_NAMES:
         return getattr(_get_default_client(), name)
-    if name == "client":
+    if name in ("client", "VLRClient"):
+        # Imported on first use so ``import vlrdevapi`` stays cheap.
+        from vlrdevapi._client import VLRClient
+
         return VLRClient
+    if name in _SUBMODULES:
+        return _importlib.import_module(f"{__name__}.{name}")
     msg = f"module {__name__!r} has no attribute {name!r}"
     raise AttributeError(msg)
 
@@ -87,6 +184,7 @@ __all__ = [
     "VLRClient",
     "__version__",
     "client",
+    "configure",
     "event",
     "matches",
     "player",
@@ -1,3 +1,5 @@
+from typing import Any
+
 from vlrdevapi._client import VLRClient
 from vlrdevapi._event.namespace import EventNamespace
 from vlrdevapi._matches.namespace import MatchesNamespace
@@ -84,3 +86,31 @@ Examples:
     >>> with vlrdevapi.client() as c:
     ...     result = c.series.vods(123)
 """
+
+def configure(
+    *,
+    parse_memo_size: int | None = None,
+    document_cache_size: int | None = None,
+    **client_options: Any,
+) -> None:
+    """Configure the default client used by the module-level namespaces.
+
+    Options are merged with those of earlier calls and a new default
+    client is created from them right away. Calls already running on the
+    previous default client finish on it, and its connections are closed
+    once nothing uses it any more.
+
+    Args:
+        parse_memo_size: How many parsed results of unchanged pages to keep
+            for reuse. ``0`` disables the memo. Defaults to ``128``.
+        document_cache_size: How many parsed documents of byte-identical
+            responses to keep for reuse. ``0`` disables the cache.
+            Defaults to ``16``.
+        **client_options: ``VLRClient`` arguments (``requests_per_second``,
+            ``max_retries``, ``model_backend``, ...) and ``httpx.Client``
+            arguments such as ``limits``.
+
+    Examples:
+        >>> vlrdevapi.configure(requests_per_second=1.0, max_retries=5)
+        >>> vlrdevapi.configure(limits=httpx.Limits(max_connections=20))
+    """
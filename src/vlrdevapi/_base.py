@@ -16,6 +16,10 @@ from vlrdevapi.fetcher import (
     RateLimiter,
     RetryConfig,
     fetch_sync,
+    get_html_backend,
+    get_html_trimming,
+    set_html_backend,
+    set_html_trimming,
 )
 
 
@@ -72,16 +76,37 @@ class SyncNamespace:
 
         Returns:
             httpx.Client: A new client instance configured with the base URL,
-                default headers, and redirect following enabled.
+                default headers, redirect following enabled, and the same
+                HTML backend and trimming as the shared client.
 
         """
         headers = {**DEFAULT_HEADERS, **(self._extra_headers or {})}
-        return httpx.Client(
+        client = httpx.Client(
             base_url=BASE_URL,
             headers=headers,
             follow_redirects=True,
             verify=False,
         )
+        set_html_backend(client, get_html_backend(self._client))
+        set_html_trimming(client, get_html_trimming(self._client))
+        return client
+
+    def _fetch_isolated(self, path: str) -> HTMLParser:
+        """Fetch a path on a short-lived client owned by the calling thread.
+
+        Args:
+            path: URL path to append to the base URL.
+
+        Returns:
+            HTMLParser: Parsed HTML document from the response.
+
+        """
+        with self._make_client() as client:
+            return fetch_sync(
+                client, path, self._timeout,
+                retry_config=self._retry_config,
+                rate_limiter=self._rate_limiter,
+            )
 
     def _parallel_fetch(
         self,
@@ -106,12 +131,7 @@ class SyncNamespace:
         results: list[HTMLParser | None] = [None] * len(paths)
 
         def _do_fetch(idx: int, path: str) -> tuple[int, HTMLParser]:
-            with self._make_client() as client:
-                return idx, fetch_sync(
-                    client, path, self._timeout,
-                    retry_config=self._retry_config,
-                    rate_limiter=self._rate_limiter,
-                )
+            return idx, self._fetch_isolated(path)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
             for idx, html in pool.map(lambda x: _do_fetch(*x), enumerate(paths)):
@@ -4,19 +4,25 @@ import threading
 from collections import OrderedDict
 from typing import Generic, TypeVar
 
+from vlrdevapi import _fork
+
 K = TypeVar("K")
 V = TypeVar("V")
 
 
 class LRUCache(Generic[K, V]):
-    """Thread-safe Least-Recently-Used cache with bounded size."""
+    """Thread-safe Least-Recently-Used cache with bounded size.
+
+    Emptied in processes forked from the one that created it.
+    """
 
-    __slots__ = ("_cache", "_lock", "_maxsize")
+    __slots__ = ("__weakref__", "_cache", "_lock", "_maxsize")
 
     def __init__(self, maxsize: int = 256) -> None:
         self._cache: OrderedDict[K, V] = OrderedDict()
         self._maxsize = maxsize
         self._lock = threading.Lock()
+        _fork.track(self)
 
     def get(self, key: K) -> V | None:
         with self._lock:
@@ -44,3 +50,15 @@ class LRUCache(Generic[K, V]):
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
+
+    def resize(self, maxsize: int) -> None:
+        """Change the size bound, evicting the least recently used entries."""
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._cache) > maxsize:
+                self._cache.popitem(last=False)
+
+    def _reset_after_fork(self) -> None:
+        # The parent's lock may have been held mid-update at the fork.
+        self._lock = threading.Lock()
+        self._cache.clear()
@@ -1,40 +1,87 @@
 """Synchronous HTTP client for vlr.gg."""
 
+import importlib
 import logging
+import weakref
 from datetime import tzinfo
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
 __all__ = ["VLRClient"]
 
 import httpx
 
+from vlrdevapi import _fork
 from vlrdevapi.commons.timezone import REFERENCE_MATCH_PATH, detect_vlr_timezone
-from vlrdevapi._event.namespace import EventNamespace
-from vlrdevapi._matches.namespace import MatchesNamespace
-from vlrdevapi._player.namespace import PlayerNamespace
-from vlrdevapi._series.namespace import SeriesNamespace
-from vlrdevapi._team.namespace import TeamNamespace
 from vlrdevapi.exceptions import HTTPError, NotFoundError, RateLimitError, RequestError
 from vlrdevapi.fetcher import (
     BASE_URL,
     DEFAULT_HEADERS,
     DEFAULT_RATE_LIMIT,
     DEFAULT_TIMEOUT,
+    HTML_BACKENDS,
+    MODEL_BACKENDS,
     BackoffStrategy,
+    HTMLBackend,
+    ModelBackend,
     RateLimiter,
     RetryConfig,
     fetch_sync,
+    get_html_backend,
+    get_html_trimming,
+    get_model_backend,
+    set_html_backend,
+    set_html_trimming,
+    set_model_backend,
 )
 
+if TYPE_CHECKING:
+    from vlrdevapi._event.namespace import EventNamespace
+    from vlrdevapi._matches.namespace import MatchesNamespace
+    from vlrdevapi._player.namespace import PlayerNamespace
+    from vlrdevapi._series.namespace import SeriesNamespace
+    from vlrdevapi._team.namespace import TeamNamespace
+
 logger = logging.getLogger(__name__)
 
 
+class _LazyNamespace:
+    """A client namespace imported and created on first attribute access.
+
+    The instance is then stored on the client, so later lookups are plain
+    attribute reads and the namespace's modules (parsers, models) are only
+    imported by clients that use it.
+    """
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.attr = ""
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, client: "VLRClient | None", owner: type | None = None) -> Any:
+        if client is None:
+            return self
+        cls = getattr(importlib.import_module(self.module), self.name)
+        namespace = cls(
+            client._client, client.timeout, client.retry_config, client._rate_limiter, client._headers, client._source_tz,
+        )
+        # setdefault keeps one instance if two threads get here at once.
+        return client.__dict__.setdefault(self.attr, namespace)
+
+
 class VLRClient:
     """Synchronous client for scraping data from vlr.gg.
 
     Provides access to namespace attributes for players, series, matches,
-    teams, and events.
+    teams, and events. Each namespace is imported on first access.
+
+    A client may be shared between threads. In a process forked from the
+    one that created it, the client opens a new connection pool and
+    rebuilds its namespaces on next access, so namespace objects kept from
+    before the fork should be looked up again from the client.
 
     Examples:
         >>> with VLRClient() as client:
@@ -45,6 +92,10 @@ class VLRClient:
 
         >>> client = VLRClient(requests_per_second=2.0)
 
+        >>> client = VLRClient(html_backend="lexbor")
+
+        >>> client = VLRClient(model_backend="slots")
+
     Args:
         base_url: Base URL for vlr.gg. Defaults to ``"https://www.vlr.gg"``.
         headers: Additional HTTP headers to merge with defaults.
@@ -64,10 +115,35 @@ class VLRClient:
             a reference match on init to detect the viewer timezone. Defaults
             to ``False`` (opt-in) to avoid a hidden network call in
             ``__init__``.
+        html_backend: selectolax engine used to parse pages, ``"modest"``
+            (``HTMLParser``) or ``"lexbor"`` (``LexborHTMLParser``).
+            Defaults to ``"modest"``. See ``scripts/bench_html_backends.py``
+            to compare them on your workload.
+        trim_html: When ``True``, strip scripts, styles and comments from
+            pages and cut routes such as series pages down to the part their
+            parsers read before parsing. Defaults to ``False``.
+        model_backend: ``"pydantic"`` to return pydantic models, or
+            ``"slots"`` to return ``__slots__`` dataclasses with the same
+            class names and fields. Slots results use a fraction of the
+            memory, for holding large crawls, but have no pydantic API
+            (``model_dump`` and so on). Defaults to ``"pydantic"``.
         **httpx_kwargs: Additional keyword arguments passed to ``httpx.Client``.
 
     """
 
+    if TYPE_CHECKING:
+        player: PlayerNamespace
+        series: SeriesNamespace
+        matches: MatchesNamespace
+        team: TeamNamespace
+        event: EventNamespace
+    else:
+        player = _LazyNamespace("vlrdevapi._player.namespace", "PlayerNamespace")
+        series = _LazyNamespace("vlrdevapi._series.namespace", "SeriesNamespace")
+        matches = _LazyNamespace("vlrdevapi._matches.namespace", "MatchesNamespace")
+        team = _LazyNamespace("vlrdevapi._team.namespace", "TeamNamespace")
+        event = _LazyNamespace("vlrdevapi._event.namespace", "EventNamespace")
+
     def __init__(
         self,
         base_url: str = BASE_URL,
@@ -79,8 +155,17 @@ class VLRClient:
         requests_per_second: float = DEFAULT_RATE_LIMIT,
         source_tz: str | ZoneInfo | tzinfo | None = None,
         auto_detect_tz: bool = False,
+        html_backend: HTMLBackend = "modest",
+        trim_html: bool = False,
+        model_backend: ModelBackend = "pydantic",
         **httpx_kwargs: Any,
     ) -> None:
+        if html_backend not in HTML_BACKENDS:
+            msg = f"invalid html_backend {html_backend!r}, valid options: {list(HTML_BACKENDS)}"
+            raise ValueError(msg)
+        if model_backend not in MODEL_BACKENDS:
+            msg = f"invalid model_backend {model_backend!r}, valid options: {list(MODEL_BACKENDS)}"
+            raise ValueError(msg)
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retry_config = RetryConfig(
@@ -90,13 +175,13 @@ class VLRClient:
         )
         self._rate_limiter = RateLimiter(requests_per_second) if requests_per_second > 0 else None
         merged_headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._headers = merged_headers
+        self._httpx_kwargs = httpx_kwargs
 
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            headers=merged_headers,
-            follow_redirects=True,
-            **httpx_kwargs,
-        )
+        self._client = self._new_http_client()
+        set_html_backend(self._client, html_backend)
+        set_html_trimming(self._client, trim_html)
+        set_model_backend(self._client, model_backend)
 
         if isinstance(source_tz, str):
             self._source_tz: ZoneInfo | tzinfo | None = ZoneInfo(source_tz)
@@ -106,11 +191,44 @@ class VLRClient:
         if self._source_tz is None and auto_detect_tz:
             self._source_tz = self._detect_timezone()
 
-        self.player = PlayerNamespace(self._client, self.timeout, self.retry_config, self._rate_limiter, merged_headers, self._source_tz)
-        self.series = SeriesNamespace(self._client, self.timeout, self.retry_config, self._rate_limiter, merged_headers, self._source_tz)
-        self.matches = MatchesNamespace(self._client, self.timeout, self.retry_config, self._rate_limiter, merged_headers, self._source_tz)
-        self.team = TeamNamespace(self._client, self.timeout, self.retry_config, self._rate_limiter, merged_headers, self._source_tz)
-        self.event = EventNamespace(self._client, self.timeout, self.retry_config, self._rate_limiter, merged_headers, self._source_tz)
+        _fork.track(self)
+
+    def _new_http_client(self) -> httpx.Client:
+        return httpx.Client(
+            base_url=self.base_url,
+            headers=self._headers,
+            follow_redirects=True,
+            **self._httpx_kwargs,
+        )
+
+    def _reset_after_fork(self) -> None:
+        """Give a forked child its own connection pool.
+
+        The parent's sockets and any responses it had in flight are left
+        alone, not closed, as the parent still owns them. Namespaces hold the
+        old ``httpx.Client``, so they are dropped and rebuilt on next access.
+        """
+        old = self._client
+        if old.is_closed:
+            return
+        self._client = self._new_http_client()
+        set_html_backend(self._client, get_html_backend(old))
+        set_html_trimming(self._client, get_html_trimming(old))
+        set_model_backend(self._client, get_model_backend(old))
+        for attr, value in vars(type(self)).items():
+            if isinstance(value, _LazyNamespace):
+                self.__dict__.pop(attr, None)
+
+    def _close_when_unused(self) -> None:
+        """Close the connection pool once nothing uses the ``httpx.Client``.
+
+        Namespaces hold the ``httpx.Client`` rather than this client, so
+        calls already running, and namespaces kept by callers, keep the
+        pool open until they release it.
+        """
+        http_client = self._client
+        transports = [http_client._transport, *(t for t in http_client._mounts.values() if t is not None)]
+        weakref.finalize(http_client, _close_transports, transports)
 
     def _detect_timezone(self) -> ZoneInfo | tzinfo | None:
         """Detect the viewer timezone VLR.gg renders for this client session."""
@@ -136,3 +254,8 @@ class VLRClient:
 
     def __exit__(self, *exc: Any) -> None:
         self.close()
+
+
+def _close_transports(transports: list[httpx.BaseTransport]) -> None:
+    for transport in transports:
+        transport.close()
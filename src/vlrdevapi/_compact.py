@@ -0,0 +1,115 @@
+"""Compact ``__slots__`` copies of result models for large in-memory crawls."""
+
+import dataclasses
+from contextvars import ContextVar
+from datetime import date, datetime, time
+from enum import Enum
+from types import FunctionType
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+ModelBackend = Literal["pydantic", "slots"]
+MODEL_BACKENDS: tuple[ModelBackend, ...] = ("pydantic", "slots")
+
+# Values returned as they are, without a conversion lookup.
+_PLAIN = frozenset({str, int, float, bool, type(None), bytes, date, datetime, time})
+
+# Dunder methods the dataclass provides itself or that only make sense on a
+# pydantic model; any other dunder defined on a model (``__len__``,
+# ``__iter__``, ``__getitem__`` on list wrappers) is copied over.
+_NOT_COPIED = frozenset({
+    "__init__", "__repr__", "__eq__", "__hash__", "__setattr__", "__delattr__",
+    "__getstate__", "__setstate__", "__reduce__", "__copy__", "__deepcopy__",
+})
+
+# model class -> (slots dataclass, field names)
+_SLOTS_CLASSES: dict[type[BaseModel], tuple[type, tuple[str, ...]]] = {}
+
+# Set while a public call that converts its own result is running, so the
+# namespace calls it makes internally keep returning pydantic models.
+converting: ContextVar[bool] = ContextVar("vlrdevapi_compact_converting", default=False)
+
+
+def slots_class(model: type[BaseModel]) -> type:
+    """Return the ``__slots__`` dataclass standing in for ``model``.
+
+    It has the model's name and fields in the same order, plus the
+    properties and methods defined on the model itself. Pydantic's own API
+    (``model_dump``, ``model_copy`` and so on) is not available; use
+    ``dataclasses.asdict`` instead of ``model_dump``.
+
+    Args:
+        model: The pydantic model class.
+
+    Returns:
+        type: The generated dataclass, created once per model.
+
+    """
+    entry = _SLOTS_CLASSES.get(model)
+    if entry is None:
+        entry = _SLOTS_CLASSES[model] = _make_slots_class(model)
+    return entry[0]
+
+
+def to_slots(value: Any) -> Any:
+    """Convert models in a result into their ``__slots__`` dataclasses.
+
+    Models nested in fields, lists, tuples and dicts are converted too.
+    Anything else is returned unchanged.
+
+    Args:
+        value: A model, a container of models, or any other value.
+
+    Returns:
+        Any: The converted value.
+
+    """
+    kind = type(value)
+    if kind in _PLAIN or isinstance(value, Enum):
+        return value
+    if isinstance(value, BaseModel):
+        entry = _SLOTS_CLASSES.get(kind)
+        if entry is None:
+            entry = _SLOTS_CLASSES[kind] = _make_slots_class(kind)
+        cls, names = entry
+        data = value.__dict__
+        return cls(*[to_slots(data[name]) for name in names])
+    if kind is list:
+        return [to_slots(item) for item in value]
+    if kind is tuple:
+        return tuple(to_slots(item) for item in value)
+    if kind is dict:
+        return {key: to_slots(item) for key, item in value.items()}
+    return value
+
+
+def _rebuild(model: type[BaseModel], values: tuple[Any, ...]) -> Any:
+    return slots_class(model)(*values)
+
+
+def _make_slots_class(model: type[BaseModel]) -> tuple[type, tuple[str, ...]]:
+    names = tuple(model.model_fields)
+    namespace: dict[str, Any] = {
+        name: attr
+        for name, attr in vars(model).items()
+        if isinstance(attr, (FunctionType, property))
+        and name not in _NOT_COPIED
+        and not name.startswith(("model_", "__pydantic_", "__get_pydantic_"))
+    }
+
+    def __reduce__(self: Any) -> tuple[Any, ...]:
+        # Pickled by the model it stands for, which is importable by name.
+        return _rebuild, (model, tuple(getattr(self, name) for name in names))
+
+    namespace["__reduce__"] = __reduce__
+    cls = dataclasses.make_dataclass(
+        model.__name__,
+        [(name, field.annotation) for name, field in model.model_fields.items()],
+        namespace=namespace,
+        slots=True,
+        module=__name__,
+    )
+    cls.__qualname__ = model.__qualname__
+    cls.__doc__ = model.__doc__
+    return cls, names
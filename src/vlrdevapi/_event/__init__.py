@@ -1,5 +1,6 @@
 """Event/tournament data: info, stages, teams, matches, standings, listings."""
 
+from vlrdevapi._event.bundle.namespace import EventBundleNamespace
 from vlrdevapi._event.list.namespace import EventListNamespace
 from vlrdevapi._event.matches.namespace import EventMatchesNamespace
 from vlrdevapi._event.namespace import EventNamespace
@@ -8,6 +9,7 @@ from vlrdevapi._event.standings.namespace import EventStandingsNamespace
 from vlrdevapi._event.teams.namespace import EventTeamsNamespace
 
 __all__ = [
+    "EventBundleNamespace",
     "EventListNamespace",
     "EventMatchesNamespace",
     "EventNamespace",
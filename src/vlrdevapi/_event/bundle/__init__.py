@@ -0,0 +1,4 @@
+from vlrdevapi._event.bundle.models import EventBundle
+from vlrdevapi._event.bundle.namespace import EventBundleNamespace
+
+__all__ = ["EventBundle", "EventBundleNamespace"]
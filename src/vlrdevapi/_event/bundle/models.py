@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from vlrdevapi._event.info.models import EventInfo
+from vlrdevapi._event.stages.models import EventStages
+from vlrdevapi._event.standings.models import EventStandings
+from vlrdevapi._event.teams.models import EventTeams
+
+
+class EventBundle(BaseModel):
+    """Event info, stages, standings, and teams built from shared page fetches."""
+
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
+            "description": "Event info, stages, standings, and teams built from shared page fetches.",
+        },
+    )
+
+    event_id: int = Field(default=0, description="Unique event identifier on vlr.gg")
+    info: EventInfo = Field(default_factory=EventInfo, description="General event information")
+    stages: EventStages = Field(
+        default_factory=EventStages, description="Event stages with date ranges",
+    )
+    standings: EventStandings = Field(
+        default_factory=EventStandings, description="Standings grouped by stage",
+    )
+    teams: EventTeams = Field(
+        default_factory=EventTeams, description="Participating teams grouped by stage",
+    )
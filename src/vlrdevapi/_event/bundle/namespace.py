@@ -0,0 +1,106 @@
+"""Event bundle namespace."""
+
+from datetime import tzinfo
+from zoneinfo import ZoneInfo
+
+import httpx
+
+from vlrdevapi._base import SyncNamespace
+from vlrdevapi._event._common import _filter_stages
+from vlrdevapi._event.bundle.models import EventBundle
+from vlrdevapi._event.info.parser import parse_event_info
+from vlrdevapi._event.stages.parser import (
+    merge_dates_into_stages,
+    parse_event_page_dates,
+    parse_event_stages,
+)
+from vlrdevapi._event.standings.namespace import (
+    _standings_from_main,
+    _standings_from_stages,
+)
+from vlrdevapi._event.standings.parser import parse_subnav
+from vlrdevapi._event.teams.namespace import _teams_from_main, _teams_from_stages
+from vlrdevapi._utils.paths import event as event_path
+from vlrdevapi._utils.paths import event_matches
+from vlrdevapi.fetcher import (
+    DEFAULT_RETRY_CONFIG,
+    DEFAULT_TIMEOUT,
+    RateLimiter,
+    RetryConfig,
+)
+from vlrdevapi.validators import sanitize_and_validate
+
+
+class EventBundleNamespace:
+    """Fetch the event pages once and build info, stages, standings, and teams from them."""
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        timeout: int = DEFAULT_TIMEOUT,
+        retry_config: RetryConfig = DEFAULT_RETRY_CONFIG,
+        rate_limiter: RateLimiter | None = None,
+        extra_headers: dict[str, str] | None = None,
+        source_tz: ZoneInfo | tzinfo | None = None,
+    ):
+        self._source_tz = source_tz
+        self._sync = SyncNamespace(client, timeout, retry_config, rate_limiter, extra_headers)
+
+    @sanitize_and_validate
+    def __call__(self, event_id: int, stage: str | None = None) -> EventBundle:
+        """Get info, stages, standings, and teams for an event in one pass.
+
+        The event page and the event matches page are fetched concurrently,
+        then every stage page from the event subnav is fetched exactly once
+        and shared by the standings and teams parsers.
+
+        Args:
+            event_id: The unique event identifier on vlr.gg.
+            stage: Optional stage name or path to filter standings and teams
+                by (e.g. ``"playoffs"``). Stages are always returned in full.
+
+        Returns:
+            EventBundle: An object with ``event_id``, ``info``
+            (``EventInfo``), ``stages`` (``EventStages``), ``standings``
+            (``EventStandings``), and ``teams`` (``EventTeams``).
+
+        Raises:
+            ValidationError: If ``event_id`` is not a valid positive integer.
+            NotFoundError: If the event page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> result = vlrdevapi.event.bundle(event_id=123)
+            >>> result.info.name
+            'VCT Masters Tokyo'
+            >>> result.standings.stages[0].standings[0].team.name
+            'FNATIC'
+
+        """
+        main_html, matches_html = self._sync._parallel_fetch(
+            [event_path(event_id), event_matches(event_id)], max_workers=2,
+        )
+
+        stages = parse_event_stages(matches_html, event_id)
+        if stages.stages:
+            merge_dates_into_stages(stages, parse_event_page_dates(main_html))
+
+        subnav = parse_subnav(main_html)
+        if not subnav:
+            standings = _standings_from_main(main_html)
+            teams = _teams_from_main(main_html)
+        else:
+            filtered = _filter_stages(subnav, stage)
+            hrefs = [href for href, _ in filtered]
+            stage_htmls = self._sync._parallel_fetch(hrefs, max_workers=5)
+            standings = _standings_from_stages(filtered, stage_htmls)
+            teams = _teams_from_stages(filtered, stage_htmls)
+
+        return EventBundle(
+            event_id=event_id,
+            info=parse_event_info(main_html, event_id),
+            stages=stages,
+            standings=standings,
+            teams=teams,
+        )
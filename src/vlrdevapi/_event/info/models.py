@@ -8,6 +8,7 @@ class EventSeriesLink(BaseModel):
     """A breadcrumb link above the event title (series/tournament)."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A breadcrumb link above the event title (series/tournament).",
         },
@@ -24,6 +25,7 @@ class EventPrize(BaseModel):
     """Prize information for an event."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Prize information for an event."},
     )
 
@@ -54,6 +56,7 @@ class EventRegion(BaseModel):
     """Region information inferred from breadcrumb tags."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Region information inferred from breadcrumb tags.",
         },
@@ -70,6 +73,7 @@ class EventStageTag(BaseModel):
     """Stage tag from breadcrumb."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Stage tag from breadcrumb."},
     )
 
@@ -81,6 +85,7 @@ class EventLocation(BaseModel):
     """Location/venue information for an event."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Location/venue information for an event."},
     )
 
@@ -98,6 +103,7 @@ class EventInfo(BaseModel):
     """Event information from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Event information from vlr.gg."},
     )
 
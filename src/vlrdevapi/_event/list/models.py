@@ -11,6 +11,7 @@ class EventListItem(BaseModel):
     """A single event from the events listing page."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A single event from the events listing page.",
         },
@@ -33,6 +34,7 @@ class EventListPagination(BaseModel):
     """Pagination metadata for event listings."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Pagination metadata for event listings."},
     )
 
@@ -54,6 +56,7 @@ class EventListFilters(BaseModel):
     """Filters applied to the event listing."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Filters applied to the event listing."},
     )
 
@@ -67,6 +70,7 @@ class EventList(BaseModel):
     """Paginated list of events from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Paginated list of events from vlr.gg."},
     )
 
@@ -1,14 +1,15 @@
 """Event list namespace."""
 
+from collections.abc import Iterator
 from datetime import tzinfo
 from zoneinfo import ZoneInfo
 
 import httpx
 
 from vlrdevapi._base import SyncNamespace
-from vlrdevapi._event.list.models import EventList
-from vlrdevapi._event.list.parser import parse_event_list
-from vlrdevapi._utils.pagination import collect_all_pages_sync
+from vlrdevapi._event.list.models import EventList, EventListItem
+from vlrdevapi._event.list.parser import _parse_pagination, parse_event_list
+from vlrdevapi._utils.pagination import collect_all_pages_concurrent, iter_pages_sync
 from vlrdevapi.commons.mappings import (
     REGION_MAPPINGS,
     TIER_MAPPINGS,
@@ -88,6 +89,7 @@ class EventListNamespace:
             page: Page number (1-indexed). Ignored when return_all=True.
             max_page: Maximum pages to fetch when return_all=True. 0 means no limit.
             return_all: If True, fetches all pages and returns combined results.
+                Pages after the first are fetched concurrently.
 
         Returns:
             EventList: List of events with ``events`` (each containing ``id``,
@@ -107,29 +109,19 @@ class EventListNamespace:
             'vct'
 
         """
-        tier_val = resolve_tier(tier)
-        region_val = resolve_region(region)
-        if page < 1:
-            msg = "page must be >= 1"
-            raise ValidationError(msg)
-
-        canonical_tier = next(
-            (k for k, v in TIER_MAPPINGS.items() if v == tier_val), tier.lower(),
-        )
-        canonical_region = next(
-            (k for k, v in REGION_MAPPINGS.items() if v == region_val), region.lower(),
-        )
-        filters = {"tier": canonical_tier, "region": canonical_region, "status": status, "page": page}
+        tier_val, region_val, filters = _resolve_filters(tier, region, status, page)
 
         if return_all:
-            result = collect_all_pages_sync(
+            result = collect_all_pages_concurrent(
                 fetch_fn=self._sync._fetch,
+                fetch_page_fn=self._sync._fetch_isolated,
                 build_url=lambda p: _build_events_path(tier_val, region_val, p),
                 parse_fn=parse_event_list,
+                last_page_fn=lambda html: _parse_pagination(html).total_pages,
                 max_page=max_page,
                 parse_extra=(filters,),
             )
-            # collect_all_pages_sync sets .matches but not .events
+            # collect_all_pages_concurrent sets .matches but not .events
             result.events = result.matches
             return result
 
@@ -137,6 +129,82 @@ class EventListNamespace:
         html = self._sync._fetch(path)
         return parse_event_list(html, filters)
 
+    @sanitize_and_validate
+    def iter_events(
+        self,
+        tier: TierType = "all",
+        region: RegionType = "all",
+        status: StatusType | None = None,
+        page: int = 1,
+        max_page: int = 0,
+    ) -> Iterator[EventListItem]:
+        """Stream events from vlr.gg one at a time across listing pages.
+
+        Events are yielded as each page is parsed while the next page is
+        prefetched in the background, so memory stays flat on full crawls.
+
+        Args:
+            tier: Tier filter. One of: all, vct, vcl, t3, gc, collegiate, offseason.
+            region: Region filter. One of: all, americas, amer, emea, pacific, pac, china.
+            status: Optional status filter. One of: ongoing, upcoming, completed, paused.
+                    If None, yields events of all statuses.
+            page: First page number to read (1-indexed).
+            max_page: Last page number to fetch. 0 means no limit.
+
+        Yields:
+            EventListItem: Each event, in listing order.
+
+        Raises:
+            ValidationError: If ``page`` is not a valid positive integer.
+            RequestError: If the HTTP request fails.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> for event in vlrdevapi.event.list.iter_events(tier="vct"):
+            ...     print(event.name)
+
+        """
+        tier_val, region_val, filters = _resolve_filters(tier, region, status, page)
+        pages = iter_pages_sync(
+            fetch_fn=self._sync._fetch,
+            fetch_page_fn=self._sync._fetch_isolated,
+            build_url=lambda p: _build_events_path(tier_val, region_val, p),
+            parse_fn=parse_event_list,
+            has_next_fn=lambda html, p: p < _parse_pagination(html).total_pages,
+            start_page=page,
+            max_page=max_page,
+            parse_extra=(filters,),
+        )
+        return (event for result in pages for event in result.events)
+
+
+def _resolve_filters(
+    tier: TierType, region: RegionType, status: StatusType | None, page: int,
+) -> tuple[str, str, dict]:
+    """Resolve tier/region aliases into URL values and the canonical filters dict.
+
+    Returns:
+        Tuple of (tier URL value, region URL value, filters dict for the parser).
+
+    Raises:
+        ValidationError: If ``page`` is less than 1 or a filter is unknown.
+
+    """
+    tier_val = resolve_tier(tier)
+    region_val = resolve_region(region)
+    if page < 1:
+        msg = "page must be >= 1"
+        raise ValidationError(msg)
+
+    canonical_tier = next(
+        (k for k, v in TIER_MAPPINGS.items() if v == tier_val), tier.lower(),
+    )
+    canonical_region = next(
+        (k for k, v in REGION_MAPPINGS.items() if v == region_val), region.lower(),
+    )
+    filters = {"tier": canonical_tier, "region": canonical_region, "status": status, "page": page}
+    return tier_val, region_val, filters
+
 
 
 def _build_events_path(tier_val: str, region_val: str, page: int) -> str:
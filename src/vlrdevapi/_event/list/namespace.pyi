@@ -1,4 +1,6 @@
-from vlrdevapi._event.list.models import EventList
+from collections.abc import Iterator
+
+from vlrdevapi._event.list.models import EventList, EventListItem
 from vlrdevapi.commons.mappings import RegionType, StatusType, TierType
 import httpx
 from vlrdevapi.fetcher import RateLimiter, RetryConfig
@@ -25,3 +27,13 @@ class EventListNamespace:
         return_all: bool = False,
     ) -> EventList:
         """Get a list of events from vlr.gg."""
+
+    def iter_events(
+        self,
+        tier: TierType = "all",
+        region: RegionType = "all",
+        status: StatusType | None = None,
+        page: int = 1,
+        max_page: int = 0,
+    ) -> Iterator[EventListItem]:
+        """Stream events from vlr.gg one at a time across listing pages."""
@@ -19,6 +19,7 @@ class MatchTeam(BaseModel):
     """Team participating in a match."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Team participating in a match."},
     )
 
@@ -44,6 +45,7 @@ class EventMatch(BaseModel):
     """Match data from vlr.gg event matches page."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Match data from vlr.gg event matches page."},
     )
 
@@ -74,6 +76,7 @@ class EventMatches(BaseModel):
     """Collection of matches for an event."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Collection of matches for an event."},
     )
 
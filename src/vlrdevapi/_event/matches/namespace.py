@@ -36,7 +36,7 @@ def _enrich_match_teams(match: EventMatch, series_info_ns: SeriesInfoNamespace)
 
     """
     try:
-        series_info = series_info_ns(match.match_id)
+        series_info = series_info_ns(match.match_id, fields={"teams"})
         teams = [t for t in (series_info.team1, series_info.team2) if t is not None]
         for i, series_team in enumerate(teams):
             if i < len(match.teams) and series_team.id:
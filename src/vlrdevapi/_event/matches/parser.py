@@ -10,6 +10,7 @@ from vlrdevapi._event.matches.models import (
     MatchStatus,
     MatchTeam,
 )
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.commons.datetime import (
     parse_vlr_date,
     parse_vlr_datetime,
@@ -237,4 +238,4 @@ def _parse_match_stage_phase(match_link: Node) -> tuple[str, str]:
     if phase and phase in full_text:
         stage = full_text.replace(phase, "").strip()
 
-    return stage, phase
+    return intern_text(stage), intern_text(phase)
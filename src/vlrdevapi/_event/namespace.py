@@ -6,6 +6,8 @@ from zoneinfo import ZoneInfo
 
 import httpx
 
+from vlrdevapi._event.bundle.models import EventBundle
+from vlrdevapi._event.bundle.namespace import EventBundleNamespace
 from vlrdevapi._event.info.models import EventInfo
 from vlrdevapi._event.info.namespace import EventInfoNamespace
 from vlrdevapi._event.list.namespace import EventListNamespace
@@ -23,7 +25,7 @@ from vlrdevapi.fetcher import (
     RateLimiter,
     RetryConfig,
 )
-from vlrdevapi.validators import sanitize_and_validate
+from vlrdevapi.validators import forwarded, sanitize_and_validate
 
 
 class EventMatchNamespace:
@@ -42,6 +44,7 @@ class EventMatchNamespace:
         teams: EventTeamsNamespace,
         matches: EventMatchesNamespace,
         standings: EventStandingsNamespace,
+        bundle: EventBundleNamespace,
     ):
         self._event_id = event_id
         self._info = info
@@ -49,8 +52,9 @@ class EventMatchNamespace:
         self._teams = teams
         self._matches = matches
         self._standings = standings
+        self._bundle = bundle
 
-    @sanitize_and_validate
+    @forwarded
     def info(self) -> EventInfo:
         """Get general info for this event.
 
@@ -70,7 +74,7 @@ class EventMatchNamespace:
         """
         return self._info(self._event_id)
 
-    @sanitize_and_validate
+    @forwarded
     def stages(self) -> EventStages:
         """Get stage information for this event.
 
@@ -90,7 +94,7 @@ class EventMatchNamespace:
         """
         return self._stages(self._event_id)
 
-    @sanitize_and_validate
+    @forwarded
     def teams(self, stage: str | None = None) -> EventTeams:
         """Get teams participating in this event, grouped by stage.
 
@@ -116,7 +120,7 @@ class EventMatchNamespace:
         """
         return self._teams(self._event_id, stage=stage)
 
-    @sanitize_and_validate
+    @forwarded
     def matches(self, stage_id: str | None = None, state: Literal["all", "completed", "live", "upcoming"] = "all") -> EventMatches:
         """Get matches for this event, with optional stage and status filters.
 
@@ -144,7 +148,7 @@ class EventMatchNamespace:
         """
         return self._matches(self._event_id, stage_id=stage_id, state=state)
 
-    @sanitize_and_validate
+    @forwarded
     def standings(self, stage: str | None = None) -> EventStandings:
         """Get standings for this event, grouped by stage.
 
@@ -168,6 +172,31 @@ class EventMatchNamespace:
         """
         return self._standings(self._event_id, stage=stage)
 
+    @forwarded
+    def bundle(self, stage: str | None = None) -> EventBundle:
+        """Get info, stages, standings, and teams for this event in one pass.
+
+        Args:
+            stage: Optional stage name or path to filter standings and teams
+                by (e.g. ``"playoffs"``).
+
+        Returns:
+            EventBundle: An object with ``info``, ``stages``, ``standings``,
+            and ``teams`` built from shared page fetches.
+
+        Raises:
+            NotFoundError: If the event page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> ns = vlrdevapi.event(123)
+            >>> ns.bundle().info.name
+            'VCT Masters Tokyo'
+
+        """
+        return self._bundle(self._event_id, stage=stage)
+
 
 class EventNamespace:
     """Top-level namespace for event/tournament data.
@@ -199,6 +228,7 @@ class EventNamespace:
         self._matches = EventMatchesNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
         self._standings = EventStandingsNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
         self._list = EventListNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
+        self._bundle = EventBundleNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
 
     @property
     def info(self) -> EventInfoNamespace:
@@ -290,6 +320,21 @@ class EventNamespace:
         """
         return self._list
 
+    @property
+    def bundle(self) -> EventBundleNamespace:
+        """Access info, stages, standings, and teams built from shared page fetches.
+
+        Usage::
+
+            bundle = vlrdevapi.event.bundle(event_id=123)
+
+        Returns:
+            An ``EventBundleNamespace`` instance. Call with an ``event_id``
+            and optional ``stage`` to return an ``EventBundle`` model.
+
+        """
+        return self._bundle
+
     @sanitize_and_validate
     def __call__(self, event_id: int) -> EventMatchNamespace:
         """Create a curried namespace bound to a specific event.
@@ -302,8 +347,8 @@ class EventNamespace:
 
         Returns:
             EventMatchNamespace: A namespace object with methods ``.info()``,
-            ``.stages()``, ``.teams()``, ``.matches()``, and
-            ``.standings()`` — all pre-bound to the given ``event_id``.
+            ``.stages()``, ``.teams()``, ``.matches()``, ``.standings()``,
+            and ``.bundle()`` — all pre-bound to the given ``event_id``.
 
         Raises:
             ValidationError: If ``event_id`` is not a valid positive integer.
@@ -323,4 +368,5 @@ class EventNamespace:
             teams=self._teams,
             matches=self._matches,
             standings=self._standings,
+            bundle=self._bundle,
         )
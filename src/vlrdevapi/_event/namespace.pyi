@@ -1,5 +1,7 @@
 from typing import Literal
 
+from vlrdevapi._event.bundle.models import EventBundle
+from vlrdevapi._event.bundle.namespace import EventBundleNamespace
 from vlrdevapi._event.info.models import EventInfo
 from vlrdevapi._event.info.namespace import EventInfoNamespace
 from vlrdevapi._event.list.namespace import EventListNamespace
@@ -24,6 +26,7 @@ class EventMatchNamespace:
         teams: EventTeamsNamespace,
         matches: EventMatchesNamespace,
         standings: EventStandingsNamespace,
+        bundle: EventBundleNamespace,
     ) -> None: ...
 
     def info(self) -> EventInfo: ...
@@ -40,6 +43,8 @@ class EventMatchNamespace:
 
     def standings(self, stage: str | None = None) -> EventStandings: ...
 
+    def bundle(self, stage: str | None = None) -> EventBundle: ...
+
 
 class EventNamespace:
     def __init__(
@@ -69,4 +74,7 @@ class EventNamespace:
     @property
     def list(self) -> EventListNamespace: ...
 
+    @property
+    def bundle(self) -> EventBundleNamespace: ...
+
     def __call__(self, event_id: int) -> EventMatchNamespace: ...
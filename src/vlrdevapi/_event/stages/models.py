@@ -8,6 +8,7 @@ class EventStage(BaseModel):
     """Stage information for an event from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Stage information for an event from vlr.gg."},
     )
 
@@ -32,6 +33,7 @@ class EventStages(BaseModel):
     """Collection of stages for an event."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Collection of stages for an event."},
     )
 
@@ -5,6 +5,7 @@ class TeamStanding(BaseModel):
     """Team information in standings from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Team information in standings from vlr.gg."},
     )
 
@@ -30,6 +31,7 @@ class StandingEntry(BaseModel):
     """A single standing entry from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A single standing entry from vlr.gg."},
     )
 
@@ -63,6 +65,7 @@ class EventStageStandings(BaseModel):
     """Standings for an event stage from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Standings for an event stage from vlr.gg."},
     )
 
@@ -83,6 +86,7 @@ class EventStandings(BaseModel):
     """Wrapper for standings grouped by stage."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Wrapper for event standings."},
     )
     stages: list[EventStageStandings] = Field(
@@ -4,6 +4,7 @@ from datetime import tzinfo
 from zoneinfo import ZoneInfo
 
 import httpx
+from selectolax.parser import HTMLParser
 
 from vlrdevapi._base import SyncNamespace
 from vlrdevapi._event._common import _filter_stages
@@ -62,35 +63,45 @@ class EventStandingsNamespace:
         stages = parse_subnav(main_html)
 
         if not stages:
-            standings = parse_standings(main_html)
-            if standings:
-                return EventStandings(
-                    stages=[
-                        EventStageStandings(
-                            stage_path="",
-                            stage_name="All Stages",
-                            standings=standings,
-                        ),
-                    ],
-                )
-            return EventStandings(stages=[])
+            return _standings_from_main(main_html)
 
         filtered = _filter_stages(stages, stage)
         hrefs = [href for href, _ in filtered]
         stage_htmls = self._sync._parallel_fetch(hrefs, max_workers=5)
 
-        event_standings = []
-        for (href, stage_name), stage_html in zip(filtered, stage_htmls):
-            standings = parse_standings(stage_html)
-            if standings:
-                event_standings.append(
-                    EventStageStandings(
-                        stage_path=href,
-                        stage_name=stage_name,
-                        standings=standings,
-                    ),
-                )
-
-        return EventStandings(stages=event_standings)
-
-
+        return _standings_from_stages(filtered, stage_htmls)
+
+
+def _standings_from_main(main_html: HTMLParser) -> EventStandings:
+    """Build standings from the event page itself when it has no stage subnav."""
+    standings = parse_standings(main_html)
+    if standings:
+        return EventStandings(
+            stages=[
+                EventStageStandings(
+                    stage_path="",
+                    stage_name="All Stages",
+                    standings=standings,
+                ),
+            ],
+        )
+    return EventStandings(stages=[])
+
+
+def _standings_from_stages(
+    stages: list[tuple[str, str]], stage_htmls: list[HTMLParser],
+) -> EventStandings:
+    """Build standings from already-fetched stage pages, in subnav order."""
+    event_standings = []
+    for (href, stage_name), stage_html in zip(stages, stage_htmls):
+        standings = parse_standings(stage_html)
+        if standings:
+            event_standings.append(
+                EventStageStandings(
+                    stage_path=href,
+                    stage_name=stage_name,
+                    standings=standings,
+                ),
+            )
+
+    return EventStandings(stages=event_standings)
@@ -3,10 +3,12 @@
 from selectolax.parser import HTMLParser, Node
 
 from vlrdevapi._event.standings.models import StandingEntry, TeamStanding
+from vlrdevapi._memo import memoize_parse
 from vlrdevapi.commons.prizes import parse_prize_amount
 import contextlib
 
 
+@memoize_parse()
 def parse_subnav(html: HTMLParser) -> list[tuple[str, str]]:
     """Parse subnav to get list of (stage_path, stage_name)."""
     subnav = html.css_first(".wf-subnav")
@@ -26,6 +28,7 @@ def parse_subnav(html: HTMLParser) -> list[tuple[str, str]]:
     return stages
 
 
+@memoize_parse()
 def parse_standings(html: HTMLParser) -> list[StandingEntry]:
     """Parse the Prize Distribution section."""
     # Find the Prize Distribution label (can be h2 or div)
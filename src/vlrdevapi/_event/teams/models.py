@@ -5,6 +5,7 @@ class Team(BaseModel):
     """Team information for an event from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Team information for an event from vlr.gg."},
     )
 
@@ -26,6 +27,7 @@ class EventStageTeams(BaseModel):
     """Teams grouped by event stage from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Teams grouped by event stage from vlr.gg."},
     )
 
@@ -46,6 +48,7 @@ class EventTeams(BaseModel):
     """Wrapper for teams grouped by stage."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Wrapper for event teams."},
     )
     stages: list[EventStageTeams] = Field(
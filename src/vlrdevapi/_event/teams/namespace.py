@@ -4,6 +4,7 @@ from datetime import tzinfo
 from zoneinfo import ZoneInfo
 
 import httpx
+from selectolax.parser import HTMLParser
 
 from vlrdevapi._base import SyncNamespace
 from vlrdevapi._event._common import _filter_stages
@@ -62,26 +63,37 @@ class EventTeamsNamespace:
         stages = parse_subnav(main_html)
 
         if not stages:
-            teams = parse_teams(main_html)
-            if teams:
-                return EventTeams(
-                    stages=[
-                        EventStageTeams(stage_path="", stage_name="All Teams", teams=teams),
-                    ],
-                )
-            return EventTeams(stages=[])
+            return _teams_from_main(main_html)
 
         filtered = _filter_stages(stages, stage)
         hrefs = [href for href, _ in filtered]
         stage_htmls = self._sync._parallel_fetch(hrefs, max_workers=5)
 
-        event_teams = []
-        for (href, stage_name), stage_html in zip(filtered, stage_htmls):
-            teams = parse_teams(stage_html)
-            if teams:
-                event_teams.append(
-                    EventStageTeams(stage_path=href, stage_name=stage_name, teams=teams),
-                )
-
-        return EventTeams(stages=event_teams)
-
+        return _teams_from_stages(filtered, stage_htmls)
+
+
+def _teams_from_main(main_html: HTMLParser) -> EventTeams:
+    """Build teams from the event page itself when it has no stage subnav."""
+    teams = parse_teams(main_html)
+    if teams:
+        return EventTeams(
+            stages=[
+                EventStageTeams(stage_path="", stage_name="All Teams", teams=teams),
+            ],
+        )
+    return EventTeams(stages=[])
+
+
+def _teams_from_stages(
+    stages: list[tuple[str, str]], stage_htmls: list[HTMLParser],
+) -> EventTeams:
+    """Build teams from already-fetched stage pages, in subnav order."""
+    event_teams = []
+    for (href, stage_name), stage_html in zip(stages, stage_htmls):
+        teams = parse_teams(stage_html)
+        if teams:
+            event_teams.append(
+                EventStageTeams(stage_path=href, stage_name=stage_name, teams=teams),
+            )
+
+    return EventTeams(stages=event_teams)
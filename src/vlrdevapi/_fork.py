@@ -0,0 +1,40 @@
+"""Reset of per-process state in children created with ``os.fork``.
+
+A forked child inherits copies of every lock, cache and connection pool in
+the parent, including locks another thread held at the moment of the fork
+and sockets the parent keeps using. Everything registered here is reset in
+the child before any of its code runs.
+"""
+
+import os
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+# Module-level resets, run first and in registration order.
+_CALLBACKS: list[Callable[[], None]] = []
+
+# Live instances whose ``_reset_after_fork()`` runs after the callbacks.
+_TRACKED: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def in_child(func: Callable[[], None]) -> None:
+    """Run ``func`` in every forked child, e.g. to replace a module-level lock."""
+    _CALLBACKS.append(func)
+
+
+def track(obj: Any) -> None:
+    """Call ``obj._reset_after_fork()`` in every forked child while it is alive."""
+    _TRACKED.add(obj)
+
+
+def _reset() -> None:
+    for func in _CALLBACKS:
+        func()
+    for obj in list(_TRACKED):
+        obj._reset_after_fork()
+
+
+# Not available on Windows, where there is no fork.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset)
@@ -1,6 +1,7 @@
 """Shared utilities for match enrichment and parsing across live/upcoming/completed modules."""
 
 import logging
+import re
 from collections.abc import Callable
 from datetime import date, datetime, tzinfo
 from typing import Any, Protocol
@@ -11,6 +12,7 @@ from selectolax.parser import HTMLParser, Node
 
 from vlrdevapi._cache import LRUCache
 from vlrdevapi._series.info.namespace import SeriesInfoNamespace
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi._utils.paths import team as team_path
 from vlrdevapi._utils.team_parsing import _parse_team_basic
 from vlrdevapi.commons.datetime import parse_vlr_datetime
@@ -19,6 +21,9 @@ from vlrdevapi.fetcher import RetryConfig, fetch_sync
 
 logger = logging.getLogger(__name__)
 
+_PAGE_PARAM_RE = re.compile(r"page=(\d+)")
+
+
 class MatchEntryProtocol(Protocol):
     match_id: int
     team1: Any
@@ -71,6 +76,32 @@ def check_pagination(html: HTMLParser) -> bool:
     return False
 
 
+def parse_last_page(html: HTMLParser) -> int:
+    """Return the highest page number linked from the pagination controls.
+
+    Args:
+        html: Parsed HTML document.
+
+    Returns:
+        The largest numbered page link, or ``1`` if the page has no
+        pagination controls.
+
+    """
+    last_page = 1
+    pagination_el = html.css_first("div.action-container-pages")
+    if pagination_el is None:
+        return last_page
+    for btn in pagination_el.css(".btn.mod-page"):
+        text = btn.text(strip=True)
+        if text.isdigit():
+            last_page = max(last_page, int(text))
+            continue
+        page_match = _PAGE_PARAM_RE.search(btn.attributes.get("href") or "")
+        if page_match:
+            last_page = max(last_page, int(page_match.group(1)))
+    return last_page
+
+
 # ---------------------------------------------------------------------------
 # Generic match-card iteration (shared by completed/live/upcoming)
 # ---------------------------------------------------------------------------
@@ -106,12 +137,34 @@ def parse_match_card_sync(
     Returns:
         List of parsed match entries.
 
+    """
+    matches = parse_match_card_items(card, match_date, parse_item, source_tz=source_tz)
+    enrich_matches_sync(matches, series_info_ns, client, timeout, retry_config, team_cache)
+    return matches
+
+
+def parse_match_card_items(
+    card: Node,
+    match_date: date,
+    parse_item: Callable,
+    source_tz: ZoneInfo | tzinfo | None = None,
+) -> list:
+    """Parse the match items inside a ``.wf-card`` without team enrichment.
+
+    Args:
+        card: The ``.wf-card`` DOM node containing match items.
+        match_date: The date parsed from the preceding date header.
+        parse_item: Callable ``(Node, date) -> M | None`` that builds
+            a concrete model (e.g. ``CompletedMatchEntry``).
+
+    Returns:
+        List of parsed match entries with at least one known team.
+
     """
     matches = []
     for match_item in card.css("a.match-item"):
         match = parse_item(match_item, match_date, source_tz=source_tz)
         if match and match.match_id > 0 and (match.team1 is not None or match.team2 is not None):
-            enrich_team_data_sync(match, series_info_ns, client, timeout, retry_config, team_cache)
             matches.append(match)
     return matches
 
@@ -163,8 +216,8 @@ def parse_common_match_item_fields(
         event_text = event_el.text(strip=True)
         series_el = event_el.css_first("div.match-item-event-series")
         if series_el:
-            match.stage = series_el.text(strip=True)
-            match.event = event_text.replace(match.stage, "").strip()
+            match.stage = intern_text(series_el.text(strip=True))
+            match.event = intern_text(event_text.replace(match.stage, "").strip())
 
     if time_text:
         match.datetime = parse_vlr_datetime(match_date.strftime("%Y/%m/%d"), time_text, source_tz=source_tz)
@@ -177,6 +230,19 @@ def parse_common_match_item_fields(
 # ---------------------------------------------------------------------------
 
 
+def enrich_matches_sync(
+    matches: list,
+    series_info_ns: SeriesInfoNamespace,
+    client: httpx.Client,
+    timeout: int,
+    retry_config: RetryConfig,
+    team_cache: LRUCache[int, dict[str, str]],
+) -> None:
+    """Attach team data to each match entry with ``enrich_team_data_sync``."""
+    for match in matches:
+        enrich_team_data_sync(match, series_info_ns, client, timeout, retry_config, team_cache)
+
+
 def enrich_team_data_sync(
     match: MatchEntryProtocol,
     series_info_ns: SeriesInfoNamespace,
@@ -203,7 +269,7 @@ def enrich_team_data_sync(
 
     """
     try:
-        series_info = series_info_ns(match.match_id)
+        series_info = series_info_ns(match.match_id, fields={"teams"})
         team1_id = getattr(series_info.team1, "id", 0) if series_info.team1 else 0
         team2_id = getattr(series_info.team2, "id", 0) if series_info.team2 else 0
 
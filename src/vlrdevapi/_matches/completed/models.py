@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class TeamInCompletedMatch(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A team in a completed match entry."},
     )
 
@@ -23,6 +24,7 @@ class TeamInCompletedMatch(BaseModel):
 
 class CompletedMatchEntry(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A completed match from vlr.gg."},
     )
 
@@ -43,6 +45,7 @@ class CompletedMatchEntry(BaseModel):
 
 class CompletedMatchesPage(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A page of completed matches from vlr.gg."},
     )
 
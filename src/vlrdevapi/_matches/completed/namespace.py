@@ -1,19 +1,28 @@
 """Completed matches namespace."""
 
-from datetime import tzinfo
+from collections.abc import Iterator
+from datetime import UTC, tzinfo
+from datetime import datetime as datetime_
 from zoneinfo import ZoneInfo
 
 import httpx
+from pydantic import InstanceOf
 
 from vlrdevapi._base import SyncNamespace
 from vlrdevapi._cache import LRUCache
-from vlrdevapi._matches.completed.models import CompletedMatchesPage
+from vlrdevapi._matches.common import enrich_matches_sync, parse_last_page
+from vlrdevapi._matches.completed.models import (
+    CompletedMatchEntry,
+    CompletedMatchesPage,
+)
 from vlrdevapi._matches.completed.parser import (
+    parse_completed_listing,
     parse_completed_matches,
 )
 from vlrdevapi._series.info.namespace import SeriesInfoNamespace
-from vlrdevapi._utils.pagination import collect_all_pages_sync
+from vlrdevapi._utils.pagination import collect_all_pages_concurrent, iter_pages_sync
 from vlrdevapi._utils.paths import MATCHES_RESULTS
+from vlrdevapi.commons.checkpoint import Checkpoint, CheckpointStore
 from vlrdevapi.fetcher import (
     DEFAULT_RETRY_CONFIG,
     DEFAULT_TIMEOUT,
@@ -50,6 +59,7 @@ class CompletedMatchesNamespace:
             page: Page number (1-indexed). Ignored when return_all=True.
             max_page: Maximum pages to fetch when return_all=True. 0 means no limit.
             return_all: If True, fetches all pages and returns combined results.
+                Pages after the first are fetched concurrently.
 
         Returns:
             CompletedMatchesPage: An object with ``matches`` (list of
@@ -74,17 +84,192 @@ class CompletedMatchesNamespace:
 
         """
         if return_all:
-            return collect_all_pages_sync(
+            return collect_all_pages_concurrent(
                 fetch_fn=self._sync._fetch,
-                build_url=lambda p: MATCHES_RESULTS if p == 1 else f"{MATCHES_RESULTS}/?page={p}",
+                fetch_page_fn=self._sync._fetch_isolated,
+                build_url=_build_results_path,
                 parse_fn=parse_completed_matches,
+                last_page_fn=parse_last_page,
                 max_page=max_page if max_page > 0 else page,
                 parse_extra=(self._series_info, self._sync._client, self._sync._timeout, self._sync._retry_config, self._team_cache, self._source_tz),
             )
-        url = MATCHES_RESULTS if page == 1 else f"{MATCHES_RESULTS}/?page={page}"
-        html = self._sync._fetch(url)
+        html = self._sync._fetch(_build_results_path(page))
         return parse_completed_matches(
             html, self._series_info, self._sync._client, self._sync._timeout, self._sync._retry_config, self._team_cache,
             source_tz=self._source_tz,
         )
 
+    @sanitize_and_validate
+    def iter_pages(self, page: int = 1, max_page: int = 0) -> Iterator[CompletedMatchesPage]:
+        """Stream completed match pages one at a time, newest first.
+
+        Each page is yielded as soon as it is parsed while the next page is
+        prefetched in the background, so memory stays flat on long walks.
+
+        Args:
+            page: First page number to yield (1-indexed).
+            max_page: Last page number to fetch. 0 means no limit.
+
+        Yields:
+            CompletedMatchesPage: One parsed page of completed matches.
+
+        Raises:
+            ValidationError: If ``page`` or ``max_page`` are not valid
+                positive integers.
+            NotFoundError: If a page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            RateLimitError: If the rate limit is exceeded.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> for results in vlrdevapi.matches.completed.iter_pages(max_page=3):
+            ...     print(len(results.matches))
+            50
+
+        """
+        return iter_pages_sync(
+            fetch_fn=self._sync._fetch,
+            fetch_page_fn=self._sync._fetch_isolated,
+            build_url=_build_results_path,
+            parse_fn=parse_completed_matches,
+            has_next_fn=lambda html, p: p < parse_last_page(html),
+            start_page=page,
+            max_page=max_page,
+            parse_extra=(self._series_info, self._sync._client, self._sync._timeout, self._sync._retry_config, self._team_cache, self._source_tz),
+        )
+
+    @sanitize_and_validate
+    def iter_matches(self, page: int = 1, max_page: int = 0) -> Iterator[CompletedMatchEntry]:
+        """Stream completed matches one at a time, newest first.
+
+        Args:
+            page: First page number to read (1-indexed).
+            max_page: Last page number to fetch. 0 means no limit.
+
+        Yields:
+            CompletedMatchEntry: Each completed match, in listing order.
+
+        Raises:
+            ValidationError: If ``page`` or ``max_page`` are not valid
+                positive integers.
+            NotFoundError: If a page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            RateLimitError: If the rate limit is exceeded.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> for match in vlrdevapi.matches.completed.iter_matches(max_page=2):
+            ...     print(match.match_id)
+
+        """
+        pages = self.iter_pages(page=page, max_page=max_page)
+        return (match for results in pages for match in results.matches)
+
+    @sanitize_and_validate
+    def since(
+        self,
+        match_id: int | None = None,
+        datetime: datetime_ | None = None,
+        store: InstanceOf[CheckpointStore] | None = None,
+        key: str = "matches.completed",
+        max_page: int = 0,
+    ) -> CompletedMatchesPage:
+        """Get completed matches newer than a watermark, newest first.
+
+        Result pages are walked newest-first and the walk stops on the
+        first entry that is already known: the entry whose ``match_id``
+        equals the watermark, or the first entry completed before the
+        watermark datetime. Only the new entries are enriched with team
+        data, so a regular poll costs one or two page fetches plus the
+        team lookups of the new matches.
+
+        Listing times are minute-granular, so with only a ``datetime``
+        watermark, matches completed in the same minute as it are returned
+        again. Pass ``match_id`` (or use ``store``, which saves both) to
+        avoid that.
+
+        When neither ``match_id`` nor ``datetime`` is given, the watermark
+        is loaded from ``store`` under ``key``. With no watermark at all,
+        only the first page is returned and becomes the baseline. After a
+        walk that found new matches, the newest one is saved to ``store``.
+
+        Args:
+            match_id: Match identifier of the newest match already seen.
+            datetime: Completion datetime of the newest match already
+                seen. Naive datetimes are treated as UTC.
+            store: Optional ``CheckpointStore`` used to load and persist
+                the watermark between polls.
+            key: Key the watermark is stored under in ``store``.
+            max_page: Maximum pages to walk. 0 means no limit.
+
+        Returns:
+            CompletedMatchesPage: An object with the new ``matches`` only.
+            ``has_next_page`` is True when ``max_page`` was reached before
+            the watermark, meaning older unseen matches may remain.
+
+        Raises:
+            ValidationError: If ``max_page`` is not a valid non-negative
+                integer or ``store`` is not a ``CheckpointStore``.
+            NotFoundError: If a page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            RateLimitError: If the rate limit is exceeded.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> from vlrdevapi.commons import JSONFileCheckpointStore
+            >>> store = JSONFileCheckpointStore("vlr-checkpoints.json")
+            >>> new = vlrdevapi.matches.completed.since(store=store)
+            >>> len(new.matches)
+            3
+
+        """
+        if match_id is None and datetime is None and store is not None:
+            checkpoint = store.load(key)
+            if checkpoint is not None:
+                match_id = checkpoint.match_id or None
+                datetime = checkpoint.datetime
+        if datetime is not None and datetime.tzinfo is None:
+            datetime = datetime.replace(tzinfo=UTC)
+        if match_id is None and datetime is None:
+            max_page = 1
+
+        new_matches: list[CompletedMatchEntry] = []
+        collected: set[int] = set()
+        page = 1
+        reached = False
+        while not reached:
+            html = self._sync._fetch(_build_results_path(page))
+            for entry in parse_completed_listing(html, source_tz=self._source_tz).matches:
+                if _is_seen(entry, match_id, datetime):
+                    reached = True
+                    break
+                # Results posted mid-walk push entries onto the next page.
+                if entry.match_id not in collected:
+                    collected.add(entry.match_id)
+                    new_matches.append(entry)
+            last_page = parse_last_page(html)
+            if page >= last_page or (max_page > 0 and page >= max_page):
+                break
+            page += 1
+
+        enrich_matches_sync(
+            new_matches, self._series_info, self._sync._client, self._sync._timeout, self._sync._retry_config, self._team_cache,
+        )
+        if store is not None and new_matches:
+            newest = new_matches[0]
+            store.save(key, Checkpoint(match_id=newest.match_id, datetime=newest.datetime))
+        return CompletedMatchesPage(
+            matches=new_matches,
+            has_next_page=not reached and page < last_page,
+        )
+
+
+def _is_seen(entry: CompletedMatchEntry, match_id: int | None, since: datetime_ | None) -> bool:
+    if match_id is not None and entry.match_id == match_id:
+        return True
+    # Strictly older only: other matches can share the watermark's minute.
+    return since is not None and entry.datetime is not None and entry.datetime < since
+
+
+def _build_results_path(page: int) -> str:
+    return MATCHES_RESULTS if page == 1 else f"{MATCHES_RESULTS}/?page={page}"
@@ -1,5 +1,9 @@
-from vlrdevapi._matches.completed.models import CompletedMatchesPage
+from collections.abc import Iterator
+from datetime import datetime as datetime_
+
+from vlrdevapi._matches.completed.models import CompletedMatchEntry, CompletedMatchesPage
 import httpx
+from vlrdevapi.commons.checkpoint import CheckpointStore
 from vlrdevapi.fetcher import RateLimiter, RetryConfig
 
 class CompletedMatchesNamespace:
@@ -19,3 +23,19 @@ class CompletedMatchesNamespace:
         return_all: bool = False,
     ) -> CompletedMatchesPage:
         ...
+
+    def iter_pages(self, page: int = 1, max_page: int = 0) -> Iterator[CompletedMatchesPage]:
+        ...
+
+    def iter_matches(self, page: int = 1, max_page: int = 0) -> Iterator[CompletedMatchEntry]:
+        ...
+
+    def since(
+        self,
+        match_id: int | None = None,
+        datetime: datetime_ | None = None,
+        store: CheckpointStore | None = None,
+        key: str = "matches.completed",
+        max_page: int = 0,
+    ) -> CompletedMatchesPage:
+        ...
@@ -10,9 +10,10 @@ from selectolax.parser import HTMLParser, Node
 from vlrdevapi._cache import LRUCache
 from vlrdevapi._matches.common import (
     check_pagination,
+    enrich_matches_sync,
     parse_common_match_item_fields,
     parse_date_header,
-    parse_match_card_sync,
+    parse_match_card_items,
 )
 from vlrdevapi._matches.completed.models import (
     CompletedMatchEntry,
@@ -37,9 +38,8 @@ def parse_completed_matches(
 ) -> CompletedMatchesPage:
     """Parse the vlr.gg results page and extract completed match entries.
 
-    Iterates over DOM elements to locate date headers and match cards,
-    then parses each card into a ``CompletedMatchEntry``. Only entries
-    with ``status == "completed"`` are included in the result.
+    Parses the listing with ``parse_completed_listing``, then fetches
+    team identifiers and tags for every entry.
 
     Args:
         html: Parsed HTML document.
@@ -52,6 +52,28 @@ def parse_completed_matches(
         CompletedMatchesPage: Container with a list of
             ``CompletedMatchEntry`` objects and a ``has_next_page`` flag.
 
+    """
+    result = parse_completed_listing(html, source_tz=source_tz)
+    enrich_matches_sync(result.matches, series_info_ns, client, timeout, retry_config, team_cache)
+    return result
+
+
+def parse_completed_listing(html: HTMLParser, source_tz: ZoneInfo | tzinfo | None = None) -> CompletedMatchesPage:
+    """Parse completed match entries from the results page without team enrichment.
+
+    Iterates over DOM elements to locate date headers and match cards,
+    then parses each card into a ``CompletedMatchEntry``. Only entries
+    with ``status == "completed"`` are included. No extra requests are
+    made, so team ids and tags are left unset.
+
+    Args:
+        html: Parsed HTML document.
+        source_tz: Timezone the page times are rendered in.
+
+    Returns:
+        CompletedMatchesPage: Container with a list of
+            ``CompletedMatchEntry`` objects and a ``has_next_page`` flag.
+
     """
     matches = []
     current_date = None
@@ -69,11 +91,7 @@ def parse_completed_matches(
             if d:
                 current_date = d
         elif "wf-card" in classes and "mod-header" not in classes and current_date is not None:
-            card_matches = parse_match_card_sync(
-                element, current_date, series_info_ns, client, timeout, retry_config,
-                team_cache, _parse_match_item, source_tz=source_tz,
-            )
-            matches.extend(card_matches)
+            matches.extend(parse_match_card_items(element, current_date, _parse_match_item, source_tz=source_tz))
 
     completed_matches = [match for match in matches if match.status == "completed"]
     has_next_page = check_pagination(html)
@@ -1,4 +1,23 @@
-from vlrdevapi._matches.live.models import LiveMatchEntry, LiveMatchesPage
+from vlrdevapi._matches.live.models import (
+    LiveMatchEntry,
+    LiveMatchesPage,
+    LiveMatchEvent,
+    MapStarted,
+    MatchFinished,
+    MatchStarted,
+    ScoreChanged,
+)
 from vlrdevapi._matches.live.namespace import LiveMatchesNamespace
+from vlrdevapi._matches.live.watch import LiveWatcher
 
-__all__ = ["LiveMatchEntry", "LiveMatchesNamespace", "LiveMatchesPage"]
+__all__ = [
+    "LiveMatchEntry",
+    "LiveMatchEvent",
+    "LiveMatchesNamespace",
+    "LiveMatchesPage",
+    "LiveWatcher",
+    "MapStarted",
+    "MatchFinished",
+    "MatchStarted",
+    "ScoreChanged",
+]
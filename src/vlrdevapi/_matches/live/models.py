@@ -1,11 +1,13 @@
 
 from datetime import datetime as datetime_
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
 class TeamInLiveMatch(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A team in a live match entry."},
     )
 
@@ -15,10 +17,14 @@ class TeamInLiveMatch(BaseModel):
     country_name: str = Field(
         default="", description="Full country name (e.g. 'United States')",
     )
+    score: int | None = Field(
+        default=None, description="Number of maps won so far, if shown",
+    )
 
 
 class LiveMatchEntry(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A live match from vlr.gg."},
     )
 
@@ -39,9 +45,67 @@ class LiveMatchEntry(BaseModel):
 
 class LiveMatchesPage(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Live matches from vlr.gg."},
     )
 
     matches: list[LiveMatchEntry] = Field(
         default_factory=list, description="List of live match entries",
     )
+
+
+class MatchStarted(BaseModel):
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"description": "A match appeared in the live listing."},
+    )
+
+    type: Literal["match_started"] = Field(default="match_started", description="Event type discriminator")
+    match_id: int = Field(default=0, description="Unique match identifier on vlr.gg")
+    match: LiveMatchEntry = Field(default_factory=LiveMatchEntry, description="The live match as listed")
+
+
+class ScoreChanged(BaseModel):
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"description": "A series or map score changed in a live match."},
+    )
+
+    type: Literal["score_changed"] = Field(default="score_changed", description="Event type discriminator")
+    match_id: int = Field(default=0, description="Unique match identifier on vlr.gg")
+    match: LiveMatchEntry = Field(default_factory=LiveMatchEntry, description="The live match as listed")
+    scope: Literal["series", "map"] = Field(
+        default="series", description="Whether the series (maps won) or a map (rounds won) score changed",
+    )
+    map_name: str = Field(default="", description="Map name when ``scope`` is 'map'")
+    score1: int | None = Field(default=None, description="First team's new score")
+    score2: int | None = Field(default=None, description="Second team's new score")
+    previous_score1: int | None = Field(default=None, description="First team's previous score")
+    previous_score2: int | None = Field(default=None, description="Second team's previous score")
+
+
+class MapStarted(BaseModel):
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"description": "A new map began in a live match."},
+    )
+
+    type: Literal["map_started"] = Field(default="map_started", description="Event type discriminator")
+    match_id: int = Field(default=0, description="Unique match identifier on vlr.gg")
+    match: LiveMatchEntry = Field(default_factory=LiveMatchEntry, description="The live match as listed")
+    map_name: str = Field(default="", description="Map name (e.g. 'Split', 'Breeze')")
+    order: int = Field(default=0, description="Map order in the series (1-indexed)")
+
+
+class MatchFinished(BaseModel):
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"description": "A match left the live listing."},
+    )
+
+    type: Literal["match_finished"] = Field(default="match_finished", description="Event type discriminator")
+    match_id: int = Field(default=0, description="Unique match identifier on vlr.gg")
+    match: LiveMatchEntry = Field(default_factory=LiveMatchEntry, description="The match as last seen live")
+
+
+LiveMatchEvent = MatchStarted | ScoreChanged | MapStarted | MatchFinished
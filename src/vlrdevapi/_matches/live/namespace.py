@@ -9,6 +9,7 @@ from vlrdevapi._base import SyncNamespace
 from vlrdevapi._cache import LRUCache
 from vlrdevapi._matches.live.models import LiveMatchesPage
 from vlrdevapi._matches.live.parser import parse_live_matches
+from vlrdevapi._matches.live.watch import LiveWatcher
 from vlrdevapi._series.info.namespace import SeriesInfoNamespace
 from vlrdevapi._utils.paths import MATCHES
 from vlrdevapi.fetcher import (
@@ -65,3 +66,39 @@ class LiveMatchesNamespace:
             source_tz=self._source_tz,
         )
 
+    @sanitize_and_validate
+    def watch(
+        self,
+        interval: float = 15.0,
+        idle_interval: float = 120.0,
+        series_pages: bool = False,
+    ) -> LiveWatcher:
+        """Create a polling engine that reports changes to live matches.
+
+        The listing is parsed without team enrichment on every tick and
+        diffed against the previous snapshot, producing ``MatchStarted``,
+        ``ScoreChanged``, ``MapStarted``, and ``MatchFinished`` events.
+        Nothing is fetched until the watcher is polled or iterated.
+
+        Args:
+            interval: Seconds between polls while any match is live.
+            idle_interval: Seconds between polls while nothing is live.
+            series_pages: If True, also fetch each live match's series page
+                every tick to report map starts and per-map round scores.
+
+        Returns:
+            LiveWatcher: Iterate it for a stream of events, call
+            ``run(callback)``, or call ``poll()`` for a single tick.
+
+        Examples:
+            >>> watcher = vlrdevapi.matches.live.watch(interval=10)
+            >>> for event in watcher:
+            ...     if event.type == "match_finished":
+            ...         watcher.stop()
+
+        """
+        return LiveWatcher(
+            self._sync, self._series_info,
+            interval=interval, idle_interval=idle_interval, series_pages=series_pages,
+            source_tz=self._source_tz,
+        )
@@ -1,4 +1,5 @@
 from vlrdevapi._matches.live.models import LiveMatchesPage
+from vlrdevapi._matches.live.watch import LiveWatcher
 import httpx
 from vlrdevapi.fetcher import RateLimiter, RetryConfig
 
@@ -14,3 +15,11 @@ class LiveMatchesNamespace:
 
     def __call__(self) -> LiveMatchesPage:
         ...
+
+    def watch(
+        self,
+        interval: float = 15.0,
+        idle_interval: float = 120.0,
+        series_pages: bool = False,
+    ) -> LiveWatcher:
+        ...
@@ -1,6 +1,8 @@
 """Parse live matches from vlr.gg HTML pages."""
 
+import contextlib
 import logging
+from collections.abc import Iterator
 from datetime import date, tzinfo
 from zoneinfo import ZoneInfo
 
@@ -9,15 +11,16 @@ from selectolax.parser import HTMLParser, Node
 
 from vlrdevapi._cache import LRUCache
 from vlrdevapi._matches.common import (
+    enrich_matches_sync,
     parse_common_match_item_fields,
     parse_date_header,
-    parse_match_card_sync,
 )
 from vlrdevapi._matches.live.models import (
     LiveMatchEntry,
     LiveMatchesPage,
     TeamInLiveMatch,
 )
+from vlrdevapi._memo import memoize_parse
 from vlrdevapi._series.info.namespace import SeriesInfoNamespace
 from vlrdevapi.commons.countries import get_country_name
 from vlrdevapi.fetcher import RetryConfig
@@ -36,9 +39,10 @@ def parse_live_matches(
 ) -> LiveMatchesPage:
     """Parse the vlr.gg matches page and extract live match entries.
 
-    Iterates over DOM elements to locate date headers and match cards,
-    then parses each card into a ``LiveMatchEntry``. Only entries with
-    ``status == "live"`` are included in the result.
+    The listing itself comes from ``parse_live_listing``, which is
+    memoized per page content. Team data is fetched for each live entry
+    on every call, outside the memo, so a failed or stale enrichment is
+    never cached.
 
     Args:
         html: Parsed HTML document.
@@ -51,14 +55,46 @@ def parse_live_matches(
         LiveMatchesPage: Container with a list of ``LiveMatchEntry``
             objects.
 
+    """
+    live_matches = [
+        match for match in parse_live_listing(html, source_tz=source_tz)
+        if match.team1 is not None or match.team2 is not None
+    ]
+    enrich_matches_sync(live_matches, series_info_ns, client, timeout, retry_config, team_cache)
+    return LiveMatchesPage(matches=live_matches)
+
+
+@memoize_parse()
+def parse_live_listing(html: HTMLParser, source_tz: ZoneInfo | tzinfo | None = None) -> list[LiveMatchEntry]:
+    """Parse live match entries from the matches page without team enrichment.
+
+    Unlike ``parse_live_matches`` this makes no extra requests, so it is
+    cheap enough to run on every tick of a polling loop. Team ids and tags
+    are left unset.
+
+    Args:
+        html: Parsed HTML document.
+        source_tz: Timezone the page times are rendered in.
+
+    Returns:
+        list[LiveMatchEntry]: Entries with ``status == "live"``.
+
     """
     matches = []
-    current_date = None
+    for card, card_date in _iter_dated_cards(html):
+        for item in card.css("a.match-item"):
+            match = _parse_match_item(item, card_date, source_tz=source_tz)
+            if match and match.match_id > 0 and match.status == "live":
+                matches.append(match)
+    return matches
 
+
+def _iter_dated_cards(html: HTMLParser) -> Iterator[tuple[Node, date]]:
+    """Yield each match card with the date of the header preceding it."""
     root = html.root
     if root is None:
-        return LiveMatchesPage(matches=[])
-
+        return
+    current_date = None
     for element in root.traverse():
         if element.tag is None or element.tag.lower() != "div":
             continue
@@ -68,14 +104,7 @@ def parse_live_matches(
             if d:
                 current_date = d
         elif "wf-card" in classes and "mod-header" not in classes and current_date is not None:
-            card_matches = parse_match_card_sync(
-                element, current_date, series_info_ns, client, timeout, retry_config,
-                team_cache, _parse_match_item, source_tz=source_tz,
-            )
-            matches.extend(card_matches)
-
-    live_matches = [match for match in matches if match.status == "live"]
-    return LiveMatchesPage(matches=live_matches)
+            yield element, current_date
 
 
 def _parse_match_item(
@@ -121,7 +150,7 @@ def _parse_team_basic(team_el: Node) -> TeamInLiveMatch:
         team_el: The ``div.match-item-vs-team`` DOM node.
 
     Returns:
-        TeamInLiveMatch: Populated with name and country.
+        TeamInLiveMatch: Populated with name, country, and maps won.
 
     """
     team = TeamInLiveMatch()
@@ -134,4 +163,9 @@ def _parse_team_basic(team_el: Node) -> TeamInLiveMatch:
                 if cls.startswith("mod-"):
                     team.country_name = get_country_name(cls[4:])
                     break
+
+    score_el = team_el.css_first("div.match-item-vs-team-score")
+    if score_el:
+        with contextlib.suppress(ValueError):
+            team.score = int(score_el.text(strip=True))
     return team
@@ -0,0 +1,165 @@
+"""Polling engine that turns live match snapshots into change events."""
+
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from datetime import tzinfo
+from zoneinfo import ZoneInfo
+
+from vlrdevapi._base import SyncNamespace
+from vlrdevapi._matches.live.models import (
+    LiveMatchEntry,
+    LiveMatchEvent,
+    MapStarted,
+    MatchFinished,
+    MatchStarted,
+    ScoreChanged,
+)
+from vlrdevapi._matches.live.parser import parse_live_listing
+from vlrdevapi._series.info.models import SeriesInfo
+from vlrdevapi._series.info.namespace import SeriesInfoNamespace
+from vlrdevapi._utils.paths import MATCHES
+from vlrdevapi.exceptions import VlrdevapiError
+
+logger = logging.getLogger(__name__)
+
+# map order -> (map name, team1 rounds, team2 rounds)
+_MapState = dict[int, tuple[str, int | None, int | None]]
+
+
+class LiveWatcher:
+    """Poll the live matches listing and emit typed change events.
+
+    Each tick fetches ``/matches`` once and parses it without team
+    enrichment, then diffs it against the previous snapshot. With
+    ``series_pages`` enabled, the series page of every live match is also
+    fetched so map starts and per-map round scores can be reported.
+
+    Events are delivered by iterating the watcher, by calling ``run``
+    with a callback, or one tick at a time through ``poll``. The wait
+    between ticks is ``interval`` while any match is live and
+    ``idle_interval`` otherwise.
+    """
+
+    def __init__(
+        self,
+        sync: SyncNamespace,
+        series_info: SeriesInfoNamespace,
+        interval: float = 15.0,
+        idle_interval: float = 120.0,
+        series_pages: bool = False,
+        source_tz: ZoneInfo | tzinfo | None = None,
+    ):
+        self._sync = sync
+        self._series_info = series_info
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.series_pages = series_pages
+        self._source_tz = source_tz
+        self._matches: dict[int, LiveMatchEntry] = {}
+        self._maps: dict[int, _MapState] = {}
+        self._stopped = threading.Event()
+
+    @property
+    def matches(self) -> list[LiveMatchEntry]:
+        """Live matches as of the most recent poll."""
+        return list(self._matches.values())
+
+    @property
+    def next_interval(self) -> float:
+        """Seconds to wait before the next poll."""
+        return self.interval if self._matches else self.idle_interval
+
+    def poll(self) -> list[LiveMatchEvent]:
+        """Fetch the listing once and return the events since the previous poll.
+
+        The first poll reports every match that is already live as
+        ``MatchStarted``.
+
+        Returns:
+            list[LiveMatchEvent]: Events in the order they were detected.
+
+        Raises:
+            RequestError: If the listing request fails.
+            RateLimitError: If the rate limit is exceeded.
+
+        """
+        html = self._sync._fetch(MATCHES)
+        current = {match.match_id: match for match in parse_live_listing(html, source_tz=self._source_tz)}
+        events: list[LiveMatchEvent] = []
+
+        for match_id, match in current.items():
+            previous = self._matches.get(match_id)
+            if previous is None:
+                events.append(MatchStarted(match_id=match_id, match=match))
+            else:
+                before, after = _series_score(previous), _series_score(match)
+                if before != after:
+                    events.append(ScoreChanged(
+                        match_id=match_id, match=match, scope="series",
+                        score1=after[0], score2=after[1],
+                        previous_score1=before[0], previous_score2=before[1],
+                    ))
+            if self.series_pages:
+                events.extend(self._diff_maps(match))
+
+        for match_id, match in self._matches.items():
+            if match_id not in current:
+                self._maps.pop(match_id, None)
+                events.append(MatchFinished(match_id=match_id, match=match))
+
+        self._matches = current
+        return events
+
+    def run(self, callback: Callable[[LiveMatchEvent], object]) -> None:
+        """Poll until ``stop`` is called, passing every event to ``callback``."""
+        for event in self:
+            callback(event)
+
+    def stop(self) -> None:
+        """Stop polling. Safe to call from another thread or a callback."""
+        self._stopped.set()
+
+    def __iter__(self) -> Iterator[LiveMatchEvent]:
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            yield from self.poll()
+            self._stopped.wait(self.next_interval)
+
+    def _diff_maps(self, match: LiveMatchEntry) -> list[LiveMatchEvent]:
+        try:
+            info = self._series_info(match.match_id)
+        except VlrdevapiError:
+            logger.warning("Failed to fetch series page for live match %d", match.match_id)
+            return []
+
+        previous = self._maps.get(match.match_id, {})
+        current = _map_state(info)
+        events: list[LiveMatchEvent] = []
+        for order, (map_name, score1, score2) in current.items():
+            before = previous.get(order)
+            if before is None:
+                events.append(MapStarted(match_id=match.match_id, match=match, map_name=map_name, order=order))
+            elif before[1:] != (score1, score2):
+                events.append(ScoreChanged(
+                    match_id=match.match_id, match=match, scope="map", map_name=map_name,
+                    score1=score1, score2=score2,
+                    previous_score1=before[1], previous_score2=before[2],
+                ))
+        self._maps[match.match_id] = current
+        return events
+
+
+def _series_score(match: LiveMatchEntry) -> tuple[int | None, int | None]:
+    return (
+        match.team1.score if match.team1 else None,
+        match.team2.score if match.team2 else None,
+    )
+
+
+def _map_state(info: SeriesInfo) -> _MapState:
+    return {
+        game.order: (game.map_name, game.team1_score, game.team2_score)
+        for game in info.games
+        if game.played and game.map_name and game.map_name != "TBD"
+    }
@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class TeamInUpcomingMatch(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A team in an upcoming match entry."},
     )
 
@@ -19,6 +20,7 @@ class TeamInUpcomingMatch(BaseModel):
 
 class UpcomingMatchEntry(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "An upcoming match from vlr.gg."},
     )
 
@@ -42,6 +44,7 @@ class UpcomingMatchEntry(BaseModel):
 
 class UpcomingMatchesPage(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A page of upcoming matches from vlr.gg."},
     )
 
@@ -7,10 +7,11 @@ import httpx
 
 from vlrdevapi._base import SyncNamespace
 from vlrdevapi._cache import LRUCache
+from vlrdevapi._matches.common import parse_last_page
 from vlrdevapi._matches.upcoming.models import UpcomingMatchesPage
 from vlrdevapi._matches.upcoming.parser import parse_upcoming_matches
 from vlrdevapi._series.info.namespace import SeriesInfoNamespace
-from vlrdevapi._utils.pagination import collect_all_pages_sync
+from vlrdevapi._utils.pagination import collect_all_pages_concurrent
 from vlrdevapi._utils.paths import MATCHES
 from vlrdevapi.fetcher import (
     DEFAULT_RETRY_CONFIG,
@@ -48,6 +49,7 @@ class UpcomingMatchesNamespace:
             page: Page number (1-indexed). Ignored when return_all=True.
             max_page: Maximum pages to fetch when return_all=True. 0 means no limit.
             return_all: If True, fetches all pages and returns combined results.
+                Pages after the first are fetched concurrently.
 
         Returns:
             UpcomingMatchesPage: An object with ``matches`` (list of
@@ -69,10 +71,12 @@ class UpcomingMatchesNamespace:
 
         """
         if return_all:
-            return collect_all_pages_sync(
+            return collect_all_pages_concurrent(
                 fetch_fn=self._sync._fetch,
+                fetch_page_fn=self._sync._fetch_isolated,
                 build_url=lambda p: MATCHES if p == 1 else f"{MATCHES}?page={p}",
                 parse_fn=parse_upcoming_matches,
+                last_page_fn=parse_last_page,
                 max_page=max_page if max_page > 0 else page,
                 parse_extra=(self._series_info, self._sync._client, self._sync._timeout, self._sync._retry_config, self._team_cache, self._source_tz),
             )
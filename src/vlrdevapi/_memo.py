@@ -0,0 +1,71 @@
+"""Content-addressed memo of parser results for internal use."""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from vlrdevapi._cache import LRUCache
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# (parser module, parser name, parser version, content hash, args) -> result
+_PARSE_MEMO: LRUCache[tuple, Any] = LRUCache[tuple, Any](maxsize=128)
+
+
+def memoize_parse(version: int = 1) -> Callable[[F], F]:
+    """Decorate a parser so unchanged pages return the previously built result.
+
+    The memo is keyed by the parser, its ``version``, the ``content_hash`` of
+    the document (set by ``fetch_sync``), and the remaining arguments.
+    Documents without a ``content_hash``, such as ones built directly from a
+    string, always run the parser. Every call returns a deep copy, so callers
+    may mutate the result freely.
+
+    Args:
+        version: Bump whenever the parser's output for the same HTML changes.
+
+    Returns:
+        Callable: The decorator.
+
+    """
+    def decorator(func: F) -> F:
+        name = (func.__module__, func.__qualname__, version)
+
+        @wraps(func)
+        def wrapper(html: Any, *args: Any, **kwargs: Any) -> Any:
+            digest = getattr(html, "content_hash", None)
+            if digest is None:
+                return func(html, *args, **kwargs)
+            key = (*name, digest, tuple(map(_arg_key, args)), tuple((k, _arg_key(v)) for k, v in sorted(kwargs.items())))
+            result = _PARSE_MEMO.get(key)
+            if result is None:
+                result = func(html, *args, **kwargs)
+                _PARSE_MEMO.put(key, result)
+            return _copy(result)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def clear_parse_memo() -> None:
+    """Drop every memoized parser result."""
+    _PARSE_MEMO.clear()
+
+
+def _arg_key(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 
 from selectolax.parser import Node
 
+from vlrdevapi._utils.intern import intern_text
+
 if TYPE_CHECKING:
     from vlrdevapi._player.agents.models import AgentStats
     from vlrdevapi._player.teams.models import PlayerTeam
@@ -144,7 +146,7 @@ def _parse_agent_row(tr: Node) -> AgentStats:
 
     img_el = tds[0].css_first("img")
     if img_el:
-        stats.agent = (img_el.attributes.get("alt", "") or "").title()
+        stats.agent = intern_text((img_el.attributes.get("alt", "") or "").title())
 
     use_span = tds[1].css_first("span")
     if use_span:
@@ -3,6 +3,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class AgentStats(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Per-agent statistics for a player on vlr.gg.",
         },
@@ -29,6 +30,7 @@ class AgentStats(BaseModel):
 
 class AgentStatsPage(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Per-agent statistics for a player on vlr.gg, filtered by timespan.",
         },
@@ -0,0 +1,4 @@
+from vlrdevapi._player.bundle.models import PlayerBundle
+from vlrdevapi._player.bundle.namespace import PlayerBundleNamespace
+
+__all__ = ["PlayerBundle", "PlayerBundleNamespace"]
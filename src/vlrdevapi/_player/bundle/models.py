@@ -0,0 +1,32 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from vlrdevapi._player.agents.models import AgentStatsPage
+from vlrdevapi._player.info.models import PlayerInfo
+from vlrdevapi._player.profile.models import PlayerProfile
+from vlrdevapi._player.teams.models import PlayerTeams
+
+
+class PlayerBundle(BaseModel):
+    """Player info, teams, agent stats, and profile built from shared page fetches."""
+
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
+            "description": "Player info, teams, agent stats, and profile built from shared page fetches.",
+        },
+    )
+
+    player_id: int = Field(default=0, description="Unique player identifier on vlr.gg")
+    info: PlayerInfo = Field(
+        default_factory=PlayerInfo, description="Basic player information",
+    )
+    teams: PlayerTeams = Field(
+        default_factory=PlayerTeams, description="Current and past teams for the player",
+    )
+    agents: dict[str, AgentStatsPage] = Field(
+        default_factory=dict,
+        description="Agent statistics keyed by timespan (30d, 60d, 90d, all)",
+    )
+    profile: PlayerProfile = Field(
+        default_factory=PlayerProfile, description="Consolidated player profile summary",
+    )
@@ -0,0 +1,123 @@
+"""Player bundle namespace."""
+
+from datetime import tzinfo
+from typing import Literal
+from zoneinfo import ZoneInfo
+
+import httpx
+from selectolax.parser import HTMLParser
+
+from vlrdevapi._base import SyncNamespace
+from vlrdevapi._player.agents.namespace import _build_path, _validate_timespan
+from vlrdevapi._player.agents.parser import parse_agent_stats
+from vlrdevapi._player.bundle.models import PlayerBundle
+from vlrdevapi._player.info.parser import parse_player_info
+from vlrdevapi._player.profile.models import PlayerProfile
+from vlrdevapi._player.profile.parser import parse_player_profile
+from vlrdevapi._player.teams.parser import parse_player_teams
+from vlrdevapi.fetcher import (
+    DEFAULT_RETRY_CONFIG,
+    DEFAULT_TIMEOUT,
+    RateLimiter,
+    RetryConfig,
+)
+from vlrdevapi.validators import sanitize_and_validate
+
+_DEFAULT_TIMESPANS = ("30d", "all")
+
+
+class PlayerBundleNamespace:
+    """Fetch every player page variant once and build all player models from it."""
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        timeout: int = DEFAULT_TIMEOUT,
+        retry_config: RetryConfig = DEFAULT_RETRY_CONFIG,
+        rate_limiter: RateLimiter | None = None,
+        extra_headers: dict[str, str] | None = None,
+        source_tz: ZoneInfo | tzinfo | None = None,
+    ):
+        self._source_tz = source_tz
+        self._sync = SyncNamespace(client, timeout, retry_config, rate_limiter, extra_headers)
+
+    @sanitize_and_validate
+    def __call__(
+        self,
+        player_id: int,
+        timespans: list[Literal["30d", "60d", "90d", "all"]] | None = None,
+    ) -> PlayerBundle:
+        """Get info, teams, agent stats, and profile for a player in one pass.
+
+        Each distinct timespan page is fetched exactly once, concurrently,
+        and every player parser runs against those shared documents.
+        ``info`` and ``teams`` are read from the first page. ``profile``
+        follows the same ``30d`` then ``all`` fallback as
+        ``player.profile`` when those timespans are requested.
+
+        Args:
+            player_id: The unique player identifier on vlr.gg.
+            timespans: Agent stats timespans to fetch. Each must be one of
+                ``30d``, ``60d``, ``90d``, ``all``. Defaults to
+                ``["30d", "all"]``.
+
+        Returns:
+            PlayerBundle: An object with ``player_id``, ``info``
+            (``PlayerInfo``), ``teams`` (``PlayerTeams``), ``agents``
+            (``AgentStatsPage`` keyed by timespan), and ``profile``
+            (``PlayerProfile``).
+
+        Raises:
+            ValidationError: If ``player_id`` is not a valid positive integer
+                or if any timespan is not one of the allowed values.
+            NotFoundError: If the player page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            RateLimitError: If the rate limit is exceeded.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> result = vlrdevapi.player.bundle(player_id=11225, timespans=["30d", "all"])
+            >>> result.info.name
+            'zekken'
+            >>> result.agents["all"].agents[0].agent
+            'raze'
+
+        """
+        spans = list(dict.fromkeys(timespans or _DEFAULT_TIMESPANS))
+        for timespan in spans:
+            _validate_timespan(timespan)
+
+        htmls = self._sync._parallel_fetch(
+            [_build_path(player_id, timespan) for timespan in spans],
+            max_workers=len(spans),
+        )
+        pages = dict(zip(spans, htmls, strict=True))
+
+        first = htmls[0]
+        info = parse_player_info(first)
+        info.player_id = player_id
+        profile = _build_profile(pages)
+        profile.player_id = player_id
+
+        return PlayerBundle(
+            player_id=player_id,
+            info=info,
+            teams=parse_player_teams(first),
+            agents={timespan: parse_agent_stats(html, timespan) for timespan, html in pages.items()},
+            profile=profile,
+        )
+
+
+def _build_profile(pages: dict[str, HTMLParser]) -> PlayerProfile:
+    profile: PlayerProfile | None = None
+    for timespan in _DEFAULT_TIMESPANS:
+        html = pages.get(timespan)
+        if html is None:
+            continue
+        profile = parse_player_profile(html, timespan=timespan)
+        if profile.top_agents:
+            return profile
+    if profile is not None:
+        return profile
+    timespan, html = next(iter(pages.items()))
+    return parse_player_profile(html, timespan=timespan)
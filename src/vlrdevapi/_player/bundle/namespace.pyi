@@ -0,0 +1,23 @@
+from typing import Literal
+
+import httpx
+
+from vlrdevapi._player.bundle.models import PlayerBundle
+from vlrdevapi.fetcher import RateLimiter, RetryConfig
+
+class PlayerBundleNamespace:
+    def __init__(
+        self,
+        client: httpx.Client,
+        timeout: int = ...,
+        retry_config: RetryConfig = ...,
+        rate_limiter: RateLimiter | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> None: ...
+
+    def __call__(
+        self,
+        player_id: int,
+        timespans: list[Literal["30d", "60d", "90d", "all"]] | None = None,
+    ) -> PlayerBundle:
+        ...
@@ -5,6 +5,7 @@ class PlayerInfo(BaseModel):
     """Detailed information about a player on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Detailed information about a player on vlr.gg.",
         },
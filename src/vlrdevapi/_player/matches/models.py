@@ -8,6 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class TeamInMatch(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A team in a player match entry."},
     )
 
@@ -18,6 +19,7 @@ class TeamInMatch(BaseModel):
 
 class MatchEntry(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A match from a player's match history on vlr.gg.",
         },
@@ -49,6 +51,7 @@ class MatchEntry(BaseModel):
 
 class MatchHistoryPage(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A page of matches from a player's match history on vlr.gg.",
         },
@@ -63,6 +66,7 @@ class MatchHistoryPage(BaseModel):
 
 class PlayerMatches(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Collection of match entries for a player.",
         },
@@ -1,13 +1,15 @@
 """Player matches namespace."""
 
-from datetime import tzinfo
+from collections.abc import Iterator
+from datetime import date, tzinfo
 from zoneinfo import ZoneInfo
 
 import httpx
 
 from vlrdevapi._base import SyncNamespace
 from vlrdevapi._player.matches.models import MatchEntry, MatchHistoryPage, PlayerMatches
-from vlrdevapi._player.matches.parser import parse_player_matches
+from vlrdevapi._player.matches.parser import _has_next_page, parse_player_matches
+from vlrdevapi._utils.pagination import iter_pages_sync
 from vlrdevapi.fetcher import (
     DEFAULT_RETRY_CONFIG,
     DEFAULT_TIMEOUT,
@@ -33,7 +35,13 @@ class MatchesNamespace:
         self._sync = SyncNamespace(client, timeout, retry_config, rate_limiter, extra_headers)
 
     @sanitize_and_validate
-    def __call__(self, player_id: int, limit: int = 20) -> PlayerMatches:
+    def __call__(
+        self,
+        player_id: int,
+        limit: int = 20,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> PlayerMatches:
         """Get match history for a player.
 
         Args:
@@ -41,6 +49,9 @@ class MatchesNamespace:
             limit: Maximum number of matches to return. Defaults to ``20``.
                 If more matches are needed than fit on one page, additional
                 pages are fetched automatically.
+            since: Only include matches on or after this date (inclusive).
+                Paging stops at the first older match.
+            until: Only include matches on or before this date (inclusive).
 
         Returns:
             PlayerMatches: An object with ``player_id`` and ``matches``
@@ -60,22 +71,66 @@ class MatchesNamespace:
             ('Sentinels', 'Fnatic')
             >>> result.matches[0].result
             'W'
+            >>> week = vlrdevapi.player.matches(player_id=11225, limit=100, since=date(2026, 6, 1))
 
         """
         matches: list[MatchEntry] = []
         page_num = 1
         while len(matches) < limit:
-            page = self._fetch_page(player_id, page_num)
+            page = self._fetch_page(player_id, page_num, since, until)
             matches.extend(page.matches)
             if not page.has_next_page:
                 break
             page_num += 1
         return PlayerMatches(player_id=player_id, matches=matches[:limit])
 
-    def _fetch_page(self, player_id: int, page: int) -> MatchHistoryPage:
+    @sanitize_and_validate
+    def iter(self, player_id: int, page: int = 1, max_page: int = 0) -> Iterator[MatchEntry]:
+        """Stream a player's match history one match at a time, newest first.
+
+        Pages are fetched lazily as the iterator is consumed, with the next
+        page prefetched in the background, so there is no ``limit`` to pick
+        up front and breaking out early stops further requests.
+
+        Args:
+            player_id: The unique player identifier on vlr.gg.
+            page: First page number to read (1-indexed).
+            max_page: Last page number to fetch. 0 means no limit.
+
+        Yields:
+            MatchEntry: Each match, in match history order.
+
+        Raises:
+            ValidationError: If ``player_id``, ``page``, or ``max_page`` are
+                not valid positive integers.
+            NotFoundError: If the player page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            RateLimitError: If the rate limit is exceeded.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> for match in vlrdevapi.player.matches.iter(player_id=11225, max_page=2):
+            ...     print(match.event, match.result)
+
+        """
+        pages = iter_pages_sync(
+            fetch_fn=self._sync._fetch,
+            fetch_page_fn=self._sync._fetch_isolated,
+            build_url=lambda p: _build_path(player_id, p),
+            parse_fn=parse_player_matches,
+            has_next_fn=lambda html, p: _has_next_page(html),
+            start_page=page,
+            max_page=max_page,
+            parse_extra=(self._source_tz,),
+        )
+        return (match for result in pages for match in result.matches)
+
+    def _fetch_page(
+        self, player_id: int, page: int, since: date | None = None, until: date | None = None,
+    ) -> MatchHistoryPage:
         path = _build_path(player_id, page)
         html = self._sync._fetch(path)
-        return parse_player_matches(html, source_tz=self._source_tz)
+        return parse_player_matches(html, source_tz=self._source_tz, since=since, until=until)
 
 
 def _build_path(player_id: int, page: int = 1) -> str:
@@ -1,4 +1,7 @@
-from vlrdevapi._player.matches.models import PlayerMatches
+from collections.abc import Iterator
+from datetime import date
+
+from vlrdevapi._player.matches.models import MatchEntry, PlayerMatches
 import httpx
 from vlrdevapi.fetcher import RateLimiter, RetryConfig
 
@@ -12,5 +15,14 @@ class MatchesNamespace:
         extra_headers: dict[str, str] | None = None,
     ) -> None: ...
 
-    def __call__(self, player_id: int, limit: int = 10) -> PlayerMatches:
+    def __call__(
+        self,
+        player_id: int,
+        limit: int = 10,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> PlayerMatches:
+        ...
+
+    def iter(self, player_id: int, page: int = 1, max_page: int = 0) -> Iterator[MatchEntry]:
         ...
@@ -1,10 +1,11 @@
 
-from datetime import tzinfo
+from datetime import date, tzinfo
 from zoneinfo import ZoneInfo
 
 from selectolax.parser import HTMLParser, Node
 
 from vlrdevapi._player.matches.models import MatchEntry, MatchHistoryPage, TeamInMatch
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.commons.datetime import (
     parse_vlr_date,
     parse_vlr_datetime,
@@ -36,7 +37,7 @@ def _parse_team(team_el: Node | None) -> TeamInMatch:
 
     tag_el = team_el.css_first(".m-item-team-tag")
     if tag_el:
-        team.tag = tag_el.text(strip=True)
+        team.tag = intern_text(tag_el.text(strip=True))
 
     return team
 
@@ -55,12 +56,12 @@ def _parse_match_item(a: Node, source_tz: ZoneInfo | tzinfo | None = None) -> Ma
     if event_el:
         name_el = event_el.css_first('div[style*="font-weight: 700"]')
         if name_el:
-            entry.event = name_el.text(strip=True)
+            entry.event = intern_text(name_el.text(strip=True))
         remaining = event_el.text(strip=True)
         if entry.event and remaining.startswith(entry.event):
             remaining = remaining[len(entry.event) :].strip()
         stage, bracket = _split_stage_bracket(remaining)
-        entry.stage = stage
+        entry.stage = intern_text(stage)
         entry.bracket = bracket
 
     team1_el = a.css_first(".m-item-team:not(.mod-right)")
@@ -110,9 +111,30 @@ def _has_next_page(html: HTMLParser) -> bool:
     return False
 
 
-def parse_player_matches(html: HTMLParser, source_tz: ZoneInfo | tzinfo | None = None) -> MatchHistoryPage:
+def _item_date(a: Node) -> date | None:
+    divs = a.css(".m-item-date div")
+    return parse_vlr_date(divs[1].text(strip=True)) if len(divs) >= 2 else None
+
+
+def parse_player_matches(
+    html: HTMLParser,
+    source_tz: ZoneInfo | tzinfo | None = None,
+    since: date | None = None,
+    until: date | None = None,
+) -> MatchHistoryPage:
     page = MatchHistoryPage()
+    page.has_next_page = _has_next_page(html)
+    windowed = since is not None or until is not None
     for a in html.css("a.m-item"):
+        if windowed:
+            item_date = _item_date(a)
+            if item_date is not None:
+                # Match history is newest first, so the first match older
+                # than ``since`` ends the window for this and later pages.
+                if since is not None and item_date < since:
+                    page.has_next_page = False
+                    break
+                if until is not None and item_date > until:
+                    continue
         page.matches.append(_parse_match_item(a, source_tz=source_tz))
-    page.has_next_page = _has_next_page(html)
     return page
@@ -1,6 +1,6 @@
 """Top-level player namespace with curried access pattern."""
 
-from datetime import tzinfo
+from datetime import date, tzinfo
 from typing import Literal
 from zoneinfo import ZoneInfo
 
@@ -8,6 +8,8 @@ import httpx
 
 from vlrdevapi._player.agents.models import AgentStatsPage
 from vlrdevapi._player.agents.namespace import AgentsNamespace
+from vlrdevapi._player.bundle.models import PlayerBundle
+from vlrdevapi._player.bundle.namespace import PlayerBundleNamespace
 from vlrdevapi._player.info.models import PlayerInfo
 from vlrdevapi._player.info.namespace import PlayerInfoNamespace
 from vlrdevapi._player.matches.models import PlayerMatches
@@ -22,7 +24,7 @@ from vlrdevapi.fetcher import (
     RateLimiter,
     RetryConfig,
 )
-from vlrdevapi.validators import sanitize_and_validate
+from vlrdevapi.validators import forwarded, sanitize_and_validate
 
 
 class PlayerMatchNamespace:
@@ -41,6 +43,7 @@ class PlayerMatchNamespace:
         agents: AgentsNamespace,
         matches: MatchesNamespace,
         profile: ProfileNamespace,
+        bundle: PlayerBundleNamespace,
     ):
         self._player_id = player_id
         self._info = info
@@ -48,8 +51,9 @@ class PlayerMatchNamespace:
         self._agents = agents
         self._matches = matches
         self._profile = profile
+        self._bundle = bundle
 
-    @sanitize_and_validate
+    @forwarded
     def info(self) -> PlayerInfo:
         """Get basic player info.
 
@@ -69,7 +73,7 @@ class PlayerMatchNamespace:
         """
         return self._info(self._player_id)
 
-    @sanitize_and_validate
+    @forwarded
     def teams(self) -> PlayerTeams:
         """Get current and past teams for this player.
 
@@ -89,7 +93,7 @@ class PlayerMatchNamespace:
         """
         return self._teams(self._player_id)
 
-    @sanitize_and_validate
+    @forwarded
     def agents(self, timespan: Literal["30d", "60d", "90d", "all"] = "all") -> AgentStatsPage:
         """Get agent statistics for this player.
 
@@ -116,12 +120,14 @@ class PlayerMatchNamespace:
         """
         return self._agents(self._player_id, timespan=timespan)
 
-    @sanitize_and_validate
-    def matches(self, limit: int = 20) -> PlayerMatches:
+    @forwarded
+    def matches(self, limit: int = 20, since: date | None = None, until: date | None = None) -> PlayerMatches:
         """Get match history for this player.
 
         Args:
             limit: Maximum number of matches to return (default 20).
+            since: Only include matches on or after this date (inclusive).
+            until: Only include matches on or before this date (inclusive).
 
         Returns:
             PlayerMatches: An object with ``player_id`` and ``matches``
@@ -137,12 +143,20 @@ class PlayerMatchNamespace:
             ParsingError: If the page structure is unrecognised.
 
         """
-        return self._matches(self._player_id, limit=limit)
+        return self._matches(self._player_id, limit=limit, since=since, until=until)
 
-    @sanitize_and_validate
-    def profile(self) -> PlayerProfile:
+    @forwarded
+    def profile(self, strategy: Literal["sequential", "speculative", "adaptive"] = "sequential") -> PlayerProfile:
         """Get full consolidated profile for this player.
 
+        Args:
+            strategy: How the ``all`` fallback page is requested.
+                - ``"sequential"`` (default): only after ``30d`` has no
+                  agent stats
+                - ``"speculative"``: concurrently with ``30d``
+                - ``"adaptive"``: concurrently once this player is known
+                  to need the fallback
+
         Returns:
             PlayerProfile: An object with ``name``, ``real_name``,
             ``country``, ``country_code``, ``player_id``, ``twitter``,
@@ -158,7 +172,31 @@ class PlayerMatchNamespace:
             ParsingError: If the page structure is unrecognised.
 
         """
-        return self._profile(self._player_id)
+        return self._profile(self._player_id, strategy=strategy)
+
+    @forwarded
+    def bundle(self, timespans: list[Literal["30d", "60d", "90d", "all"]] | None = None) -> PlayerBundle:
+        """Get info, teams, agent stats, and profile for this player in one pass.
+
+        Args:
+            timespans: Agent stats timespans to fetch. Each distinct timespan
+                page is fetched once, concurrently. Defaults to
+                ``["30d", "all"]``.
+
+        Returns:
+            PlayerBundle: An object with ``info``, ``teams``, ``agents``
+            (``AgentStatsPage`` keyed by timespan), and ``profile``.
+
+        Raises:
+            ValidationError: If the pre-bound ``player_id`` is not a valid
+                positive integer or if any timespan is invalid.
+            NotFoundError: If the player page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            RateLimitError: If the rate limit is exceeded.
+            ParsingError: If the page structure is unrecognised.
+
+        """
+        return self._bundle(self._player_id, timespans=timespans)
 
 
 class PlayerNamespace:
@@ -174,6 +212,7 @@ class PlayerNamespace:
         matches = vlrdevapi.player(11225).matches(limit=20)
         agents = vlrdevapi.player(11225).agents(timespan="60d")
         profile = vlrdevapi.player(11225).profile()
+        bundle = vlrdevapi.player(11225).bundle(timespans=["30d", "all"])
     """
 
     def __init__(
@@ -191,6 +230,7 @@ class PlayerNamespace:
         self._agents = AgentsNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
         self._matches = MatchesNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
         self._profile = ProfileNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
+        self._bundle = PlayerBundleNamespace(client, timeout, retry_config, rate_limiter, extra_headers, source_tz=source_tz)
 
     @property
     def info(self) -> PlayerInfoNamespace:
@@ -267,6 +307,21 @@ class PlayerNamespace:
         """
         return self._profile
 
+    @property
+    def bundle(self) -> PlayerBundleNamespace:
+        """Access info, teams, agents, and profile built from shared page fetches.
+
+        Usage::
+
+            bundle = vlrdevapi.player.bundle(player_id=11225, timespans=["30d", "all"])
+
+        Returns:
+            PlayerBundleNamespace: A namespace instance. Call with a ``player_id``
+            and optional ``timespans`` to return a ``PlayerBundle`` model.
+
+        """
+        return self._bundle
+
     @sanitize_and_validate
     def __call__(self, player_id: int) -> PlayerMatchNamespace:
         """Create a curried namespace bound to a specific player.
@@ -279,8 +334,8 @@ class PlayerNamespace:
 
         Returns:
             PlayerMatchNamespace: A namespace object with methods ``.info()``,
-            ``.teams()``, ``.agents()``, ``.matches()``, and
-            ``.profile()`` — all pre-bound to the given ``player_id``.
+            ``.teams()``, ``.agents()``, ``.matches()``, ``.profile()``, and
+            ``.bundle()`` — all pre-bound to the given ``player_id``.
 
         Raises:
             ValidationError: If ``player_id`` is not a valid positive integer.
@@ -300,6 +355,7 @@ class PlayerNamespace:
             agents=self._agents,
             matches=self._matches,
             profile=self._profile,
+            bundle=self._bundle,
         )
 
 
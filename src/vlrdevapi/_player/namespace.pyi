@@ -1,7 +1,10 @@
+from datetime import date
 from typing import Literal
 
 from vlrdevapi._player.agents.models import AgentStatsPage
 from vlrdevapi._player.agents.namespace import AgentsNamespace
+from vlrdevapi._player.bundle.models import PlayerBundle
+from vlrdevapi._player.bundle.namespace import PlayerBundleNamespace
 from vlrdevapi._player.info.models import PlayerInfo
 from vlrdevapi._player.info.namespace import PlayerInfoNamespace
 from vlrdevapi._player.matches.models import PlayerMatches
@@ -23,6 +26,7 @@ class PlayerMatchNamespace:
         agents: AgentsNamespace,
         matches: MatchesNamespace,
         profile: ProfileNamespace,
+        bundle: PlayerBundleNamespace,
     ) -> None: ...
 
     def info(self) -> PlayerInfo: ...
@@ -31,9 +35,11 @@ class PlayerMatchNamespace:
 
     def agents(self, timespan: Literal["30d", "60d", "90d", "all"] = "all") -> AgentStatsPage: ...
 
-    def matches(self, limit: int = 20) -> PlayerMatches: ...
+    def matches(self, limit: int = 20, since: date | None = None, until: date | None = None) -> PlayerMatches: ...
 
-    def profile(self) -> PlayerProfile: ...
+    def profile(self, strategy: Literal["sequential", "speculative", "adaptive"] = "sequential") -> PlayerProfile: ...
+
+    def bundle(self, timespans: list[Literal["30d", "60d", "90d", "all"]] | None = None) -> PlayerBundle: ...
 
 
 class PlayerNamespace:
@@ -61,4 +67,7 @@ class PlayerNamespace:
     @property
     def profile(self) -> ProfileNamespace: ...
 
+    @property
+    def bundle(self) -> PlayerBundleNamespace: ...
+
     def __call__(self, player_id: int) -> PlayerMatchNamespace: ...
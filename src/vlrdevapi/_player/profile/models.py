@@ -9,6 +9,7 @@ class PlayerProfile(BaseModel):
     """Consolidated player profile summary from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Consolidated player profile summary from vlr.gg.",
         },
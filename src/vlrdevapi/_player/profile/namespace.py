@@ -1,11 +1,14 @@
 """Player profile namespace."""
 
+import concurrent.futures
 from datetime import tzinfo
+from typing import Literal
 from zoneinfo import ZoneInfo
 
 import httpx
 
 from vlrdevapi._base import SyncNamespace
+from vlrdevapi._cache import LRUCache
 from vlrdevapi._player.profile.models import PlayerProfile
 from vlrdevapi._player.profile.parser import parse_player_profile
 from vlrdevapi.fetcher import (
@@ -16,6 +19,8 @@ from vlrdevapi.fetcher import (
 )
 from vlrdevapi.validators import sanitize_and_validate
 
+_TIMESPANS = ("30d", "all")
+
 
 class ProfileNamespace:
     """Access a consolidated player profile from vlr.gg."""
@@ -31,9 +36,14 @@ class ProfileNamespace:
     ):
         self._source_tz = source_tz
         self._sync = SyncNamespace(client, timeout, retry_config, rate_limiter, extra_headers)
+        self._needs_fallback: LRUCache[int, bool] = LRUCache[int, bool](maxsize=1024)
 
     @sanitize_and_validate
-    def __call__(self, player_id: int) -> PlayerProfile:
+    def __call__(
+        self,
+        player_id: int,
+        strategy: Literal["sequential", "speculative", "adaptive"] = "sequential",
+    ) -> PlayerProfile:
         """Get a consolidated player profile summary.
 
         Fetches player info, current team, and most-played agent stats.
@@ -42,6 +52,15 @@ class ProfileNamespace:
 
         Args:
             player_id: The unique player identifier on vlr.gg.
+            strategy: How the ``all`` fallback page is requested.
+                - ``"sequential"`` (default): fetch ``all`` only after
+                  ``30d`` returned no agent stats.
+                - ``"speculative"``: request ``30d`` and ``all``
+                  concurrently and return as soon as the ``30d`` result
+                  has agent stats, otherwise the ``all`` result.
+                - ``"adaptive"``: fetch sequentially until a player is
+                  seen to need the fallback, then fetch speculatively for
+                  that player on later calls.
 
         Returns:
             PlayerProfile: An object with ``name``, ``real_name``,
@@ -64,15 +83,40 @@ class ProfileNamespace:
             'Sentinels'
 
         """
-        html = self._sync._fetch(_build_path(player_id, "30d"))
-        profile = parse_player_profile(html, timespan="30d")
+        if strategy == "speculative" or (strategy == "adaptive" and self._needs_fallback.get(player_id)):
+            profile = self._fetch_speculative(player_id)
+        else:
+            profile = self._fetch_sequential(player_id)
+        if strategy == "adaptive":
+            self._needs_fallback.put(player_id, profile.stats_timespan == "all")
         profile.player_id = player_id
-        if not profile.top_agents:
-            html = self._sync._fetch(_build_path(player_id, "all"))
-            profile = parse_player_profile(html, timespan="all")
-            profile.player_id = player_id
         return profile
 
+    def _fetch_sequential(self, player_id: int) -> PlayerProfile:
+        profile = PlayerProfile()
+        for timespan in _TIMESPANS:
+            html = self._sync._fetch(_build_path(player_id, timespan))
+            profile = parse_player_profile(html, timespan=timespan)
+            if profile.top_agents:
+                break
+        return profile
+
+    def _fetch_speculative(self, player_id: int) -> PlayerProfile:
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(_TIMESPANS))
+        try:
+            futures = [
+                (timespan, pool.submit(self._sync._fetch_isolated, _build_path(player_id, timespan)))
+                for timespan in _TIMESPANS
+            ]
+            profile = PlayerProfile()
+            for timespan, future in futures:
+                profile = parse_player_profile(future.result(), timespan=timespan)
+                if profile.top_agents:
+                    break
+            return profile
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
 
 def _build_path(player_id: int, timespan: str) -> str:
     return f"/player/{player_id}/?timespan={timespan}"
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from vlrdevapi._player.profile.models import PlayerProfile
 import httpx
 from vlrdevapi.fetcher import RateLimiter, RetryConfig
@@ -12,5 +14,9 @@ class ProfileNamespace:
         extra_headers: dict[str, str] | None = None,
     ) -> None: ...
 
-    def __call__(self, player_id: int) -> PlayerProfile:
+    def __call__(
+        self,
+        player_id: int,
+        strategy: Literal["sequential", "speculative", "adaptive"] = "sequential",
+    ) -> PlayerProfile:
         ...
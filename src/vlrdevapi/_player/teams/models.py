@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class PlayerTeam(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A team entry on a player's profile."},
     )
 
@@ -29,6 +30,7 @@ class PlayerTeam(BaseModel):
 
 class PlayerTeams(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Current and past teams for a player."},
     )
 
@@ -43,6 +45,7 @@ class PlayerTeams(BaseModel):
 
 class PlayerPastTeams(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Past teams for a player."},
     )
 
@@ -1,3 +1,4 @@
+from vlrdevapi._series.economy.columns import ECONOMY_COLUMNS, economy_columns
 from vlrdevapi._series.economy.models import (
     BuyType,
     EconomyData,
@@ -7,9 +8,11 @@ from vlrdevapi._series.economy.models import (
 from vlrdevapi._series.economy.namespace import SeriesEconomyNamespace
 
 __all__ = [
+    "ECONOMY_COLUMNS",
     "BuyType",
     "EconomyData",
     "RoundEconomyData",
     "RoundWinner",
     "SeriesEconomyNamespace",
+    "economy_columns",
 ]
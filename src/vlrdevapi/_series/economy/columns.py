@@ -0,0 +1,48 @@
+"""Columnar export of per-round economy data."""
+
+from collections.abc import Iterable
+from operator import attrgetter
+
+from vlrdevapi._series.economy.models import EconomyData
+from vlrdevapi._utils.columnar import Columns, ColumnSpec, collect_columns, enum_value
+
+_GAME_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("series_id", int, attrgetter("series_id")),
+    ("game_id", int, attrgetter("game_id")),
+)
+
+_ROUND_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("round_number", int, attrgetter("round_number")),
+    ("winner_id", int, attrgetter("winner.id")),
+    ("winner_name", str, attrgetter("winner.name")),
+    ("bank_team1", float, attrgetter("bank_team1")),
+    ("bank_team2", float, attrgetter("bank_team2")),
+    ("spent_team1", int, attrgetter("spent_team1")),
+    ("spent_team2", int, attrgetter("spent_team2")),
+    ("buy_type_team1", str, enum_value(attrgetter("buy_type_team1"))),
+    ("buy_type_team2", str, enum_value(attrgetter("buy_type_team2"))),
+    ("is_pistol_round", bool, attrgetter("is_pistol_round")),
+)
+
+ECONOMY_COLUMNS: tuple[str, ...] = tuple(name for name, _, _ in (*_GAME_COLUMNS, *_ROUND_COLUMNS))
+
+
+def economy_columns(games: Iterable[EconomyData]) -> Columns:
+    """Concatenate the economy rounds of many games into one columnar table.
+
+    Buy types are stored as their display values (``"Eco"``, ``"Full-buy"``).
+
+    Args:
+        games: Economy data of each game, e.g. from ``series.economy.all``.
+
+    Returns:
+        Columns: One row per round with the columns in ``ECONOMY_COLUMNS``.
+        Use ``to_numpy()`` or ``to_arrow()`` to convert it.
+
+    Examples:
+        >>> table = economy_columns(vlrdevapi.series.economy.all(series_id=12345))
+        >>> sum(table["spent_team1"])
+        187400
+
+    """
+    return collect_columns(games, attrgetter("rounds"), _GAME_COLUMNS, _ROUND_COLUMNS)
@@ -25,6 +25,8 @@ class BuyType(Enum):
 class RoundWinner(BaseModel):
     """Winner information for a round."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(default="", description="Winning team name")
     id: int = Field(default=0, description="Winning team ID")
 
@@ -33,6 +35,7 @@ class RoundEconomyData(BaseModel):
     """Economy data for a single round within a game/map on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Economy data for a single round within a game/map on vlr.gg.",
         },
@@ -68,6 +71,7 @@ class EconomyData(BaseModel):
     """Economy data for a game/map within a series on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Economy data for a game/map within a series on vlr.gg.",
         },
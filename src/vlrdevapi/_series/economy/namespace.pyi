@@ -14,3 +14,6 @@ class SeriesEconomyNamespace:
 
     def __call__(self, series_id: int, game_id: int) -> EconomyData:
         ...
+
+    def all(self, series_id: int) -> list[EconomyData]:
+        ...
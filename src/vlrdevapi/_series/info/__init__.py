@@ -1,4 +1,10 @@
-from vlrdevapi._series.info.models import MapVeto, SeriesGame, SeriesInfo, SeriesTeam
+from vlrdevapi._series.info.models import (
+    MapVeto,
+    SeriesGame,
+    SeriesInfo,
+    SeriesInfoField,
+    SeriesTeam,
+)
 from vlrdevapi._series.info.namespace import SeriesInfoNamespace
 
-__all__ = ["MapVeto", "SeriesGame", "SeriesInfo", "SeriesInfoNamespace", "SeriesTeam"]
+__all__ = ["MapVeto", "SeriesGame", "SeriesInfo", "SeriesInfoField", "SeriesInfoNamespace", "SeriesTeam"]
@@ -1,14 +1,18 @@
 
 
 from datetime import datetime as _datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+SeriesInfoField = Literal["event", "date", "teams", "status", "veto", "games"]
+
 
 class SeriesTeam(BaseModel):
     """A team in a series/match on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A team in a series/match on vlr.gg."},
     )
 
@@ -22,6 +26,7 @@ class MapVeto(BaseModel):
     """A single map veto/pick/decider entry in a series."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A single map veto/pick/decider entry in a series.",
         },
@@ -38,6 +43,7 @@ class SeriesGame(BaseModel):
     """A single game/map within a series on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A single game/map within a series on vlr.gg.",
         },
@@ -82,6 +88,7 @@ class SeriesInfo(BaseModel):
     """Overview information for a match/series on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Overview information for a match/series on vlr.gg.",
         },
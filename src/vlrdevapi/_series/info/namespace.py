@@ -6,7 +6,7 @@ from zoneinfo import ZoneInfo
 import httpx
 
 from vlrdevapi._base import SyncNamespace
-from vlrdevapi._series.info.models import SeriesInfo
+from vlrdevapi._series.info.models import SeriesInfo, SeriesInfoField
 from vlrdevapi._series.info.parser import parse_series_info
 from vlrdevapi._utils.paths import series as series_path
 from vlrdevapi.fetcher import (
@@ -34,11 +34,15 @@ class SeriesInfoNamespace:
         self._sync = SyncNamespace(client, timeout, retry_config, rate_limiter, extra_headers)
 
     @sanitize_and_validate
-    def __call__(self, series_id: int) -> SeriesInfo:
+    def __call__(self, series_id: int, fields: set[SeriesInfoField] | None = None) -> SeriesInfo:
         """Get overview info for a match/series on vlr.gg.
 
         Args:
             series_id: The unique series identifier on vlr.gg.
+            fields: Sections to parse (``"event"``, ``"date"``, ``"teams"``,
+                ``"status"``, ``"veto"``, ``"games"``). Defaults to all of
+                them. Leaving out ``"games"`` skips the per-map parsing,
+                the most expensive part of the page.
 
         Returns:
             SeriesInfo: Series metadata including ``team1``, ``team2``,
@@ -59,8 +63,10 @@ class SeriesInfoNamespace:
             >>> result.event_name
             'VCT LOCK//IN São Paulo'
 
+            >>> teams = vlrdevapi.series.info(series_id=12345, fields={"teams"})
+
         """
         html = self._sync._fetch(series_path(series_id))
-        result = parse_series_info(html)
+        result = parse_series_info(html, fields)
         result.series_id = series_id
         return result
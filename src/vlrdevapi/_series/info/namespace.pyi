@@ -1,4 +1,4 @@
-from vlrdevapi._series.info.models import SeriesInfo
+from vlrdevapi._series.info.models import SeriesInfo, SeriesInfoField
 import httpx
 from vlrdevapi.fetcher import RateLimiter, RetryConfig
 
@@ -12,5 +12,5 @@ class SeriesInfoNamespace:
         extra_headers: dict[str, str] | None = None,
     ) -> None: ...
 
-    def __call__(self, series_id: int) -> SeriesInfo:
+    def __call__(self, series_id: int, fields: set[SeriesInfoField] | None = None) -> SeriesInfo:
         ...
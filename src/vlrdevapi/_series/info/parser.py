@@ -1,12 +1,16 @@
 import re
+from collections.abc import Collection
 from datetime import datetime
 
 from selectolax.parser import HTMLParser, Node
 
-from vlrdevapi._series.info.models import MapVeto, SeriesGame, SeriesInfo, SeriesTeam
+from vlrdevapi._series.info.models import MapVeto, SeriesGame, SeriesInfo, SeriesInfoField, SeriesTeam
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.commons.timezone import parse_vlr_stored_datetime
 import contextlib
 
+SERIES_INFO_FIELDS: frozenset[SeriesInfoField] = frozenset({"event", "date", "teams", "status", "veto", "games"})
+
 
 def _parse_team_link(el: Node) -> SeriesTeam:
     """Parse a team link element into a SeriesTeam model.
@@ -56,15 +60,15 @@ def _parse_veto(text: str) -> list[MapVeto]:
     segments = [s.strip() for s in text.split(";") if s.strip()]
     for seg in segments:
         if seg.endswith(" remains"):
-            map_name = seg.replace(" remains", "").strip()
+            map_name = intern_text(seg.replace(" remains", "").strip())
             result.append(MapVeto(map_name=map_name, veto_type="decider", team=""))
         else:
             for action in ("ban", "pick"):
                 prefix = f" {action} "
                 if prefix in seg:
                     parts = seg.split(prefix, 1)
-                    team_tag = parts[0].strip()
-                    map_name = parts[1].strip()
+                    team_tag = intern_text(parts[0].strip())
+                    map_name = intern_text(parts[1].strip())
                     result.append(
                         MapVeto(map_name=map_name, veto_type=action, team=team_tag),
                     )
@@ -72,23 +76,30 @@ def _parse_veto(text: str) -> list[MapVeto]:
     return result
 
 
-def parse_series_info(html: HTMLParser) -> SeriesInfo:
+def parse_series_info(html: HTMLParser, fields: Collection[SeriesInfoField] | None = None) -> SeriesInfo:
     """Parse series overview info from the HTML response.
 
     Args:
         html: The selectolax HTMLParser of the series page.
+        fields: Sections to parse, ``None`` for all of them: ``"event"``
+            (event id and name, stage, bracket), ``"date"`` (datetime,
+            patch), ``"teams"``, ``"status"`` (status, best-of, series
+            score), ``"veto"``, and ``"games"``. Sections not requested keep
+            their defaults. Team tags are derived from the veto, so
+            ``"teams"`` also fills ``veto``.
 
     Returns:
         SeriesInfo: Parsed series metadata including teams, scores,
         event details, veto, and games.
 
     """
+    wanted = SERIES_INFO_FIELDS if fields is None else frozenset(fields)
     info = SeriesInfo()
     header = html.css_first(".match-header")
     if not header:
         return info
 
-    event_link = header.css_first("a.match-header-event")
+    event_link = header.css_first("a.match-header-event") if "event" in wanted else None
     if event_link:
         href = event_link.attributes.get("href", "") or ""
         event_parts = href.strip("/").split("/")
@@ -98,19 +109,19 @@ def parse_series_info(html: HTMLParser) -> SeriesInfo:
 
         bold_el = event_link.css_first("div[style*='font-weight: 700']")
         if bold_el:
-            info.event_name = bold_el.text(strip=True)
+            info.event_name = intern_text(bold_el.text(strip=True))
 
         series_el = event_link.css_first(".match-header-event-series")
         if series_el:
             series_text = series_el.text(strip=True)
             if ": " in series_text:
                 parts = series_text.split(": ", 1)
-                info.stage = parts[0].strip()
+                info.stage = intern_text(parts[0].strip())
                 info.bracket = parts[1].strip()
             else:
-                info.stage = series_text
+                info.stage = intern_text(series_text)
 
-    date_container = header.css_first(".match-header-date")
+    date_container = header.css_first(".match-header-date") if "date" in wanted else None
     if date_container:
         ts_el = date_container.css_first(".moment-tz-convert")
         if ts_el:
@@ -126,15 +137,16 @@ def parse_series_info(html: HTMLParser) -> SeriesInfo:
                 info.patch = patch_text
             break
 
-    link1 = header.css_first(".match-header-link.mod-1")
-    if link1:
-        info.team1 = _parse_team_link(link1)
+    if "teams" in wanted:
+        link1 = header.css_first(".match-header-link.mod-1")
+        if link1:
+            info.team1 = _parse_team_link(link1)
 
-    link2 = header.css_first(".match-header-link.mod-2")
-    if link2:
-        info.team2 = _parse_team_link(link2)
+        link2 = header.css_first(".match-header-link.mod-2")
+        if link2:
+            info.team2 = _parse_team_link(link2)
 
-    vs_section = header.css_first(".match-header-vs")
+    vs_section = header.css_first(".match-header-vs") if "status" in wanted else None
     if vs_section:
         notes = vs_section.css(".match-header-vs-note")
         if notes:
@@ -163,11 +175,30 @@ def parse_series_info(html: HTMLParser) -> SeriesInfo:
             except ValueError:
                 pass
 
+    if wanted.isdisjoint(("teams", "veto", "games")):
+        return info
+
     veto_el = header.css_first(".match-header-note")
     if veto_el:
         veto_text = veto_el.text(strip=True)
         info.veto = _parse_veto(veto_text)
 
+    if "teams" in wanted:
+        _assign_team_tags(info)
+
+    if "games" in wanted:
+        info.games = _parse_games(html, info)
+
+    return info
+
+
+def _assign_team_tags(info: SeriesInfo) -> None:
+    """Derive team tags from the veto, falling back to short team names.
+
+    Args:
+        info: Parsed SeriesInfo whose ``team1``/``team2`` tags are set in-place.
+
+    """
     tags = {}
     for v in info.veto:
         if v.team and v.veto_type in ("ban", "pick"):
@@ -195,10 +226,6 @@ def parse_series_info(html: HTMLParser) -> SeriesInfo:
     if not info.team2.tag and len(info.team2.name) <= 3:
         info.team2.tag = info.team2.name
 
-    info.games = _parse_games(html, info)
-
-    return info
-
 
 def _parse_duration(duration_str: str) -> int | None:
     """Parse a duration string like '53:03' or '1:03:33' into total seconds.
@@ -335,7 +362,7 @@ def _parse_games(html: HTMLParser, info: SeriesInfo) -> list[SeriesGame]:
             if span_el:
                 order_str = span_el.text(strip=True)
                 map_text = map_text[len(order_str) :].strip()
-            game.map_name = map_text
+            game.map_name = intern_text(map_text)
 
         raw_html = el.html or ""
         pick_match = re.search(r"Pick:\s*(\S+)", raw_html)
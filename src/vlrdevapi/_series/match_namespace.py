@@ -15,7 +15,7 @@ from vlrdevapi._series.rounds.models import RoundsData
 from vlrdevapi._series.rounds.namespace import SeriesRoundsNamespace
 from vlrdevapi._series.vods.models import SeriesVods
 from vlrdevapi._series.vods.namespace import SeriesVodsNamespace
-from vlrdevapi.validators import sanitize_and_validate
+from vlrdevapi.validators import forwarded
 
 
 class SeriesMatchNamespace:
@@ -45,7 +45,7 @@ class SeriesMatchNamespace:
         self._performance = performance
         self._economy = economy
 
-    @sanitize_and_validate
+    @forwarded
     def info(self) -> SeriesInfo:
         """Get overview info for this series.
 
@@ -72,7 +72,7 @@ class SeriesMatchNamespace:
         """
         return self._info(self._series_id)
 
-    @sanitize_and_validate
+    @forwarded
     def vods(self) -> SeriesVods:
         """Get VOD/video links for this series.
 
@@ -97,7 +97,7 @@ class SeriesMatchNamespace:
         """
         return self._vods(self._series_id)
 
-    @sanitize_and_validate
+    @forwarded
     def players(self, game_id: int | str = "all") -> PlayersStats:
         """Get per-game player statistics for this series.
 
@@ -125,7 +125,7 @@ class SeriesMatchNamespace:
         """
         return self._players(self._series_id, game_id)
 
-    @sanitize_and_validate
+    @forwarded
     def rounds(self, game_id: int) -> RoundsData:
         """Get round-by-round data for a game in this series.
 
@@ -155,7 +155,7 @@ class SeriesMatchNamespace:
         """
         return self._rounds(self._series_id, game_id)
 
-    @sanitize_and_validate
+    @forwarded
     def performance(self, game_id: int | str = "all") -> PerformanceData:
         """Get performance metrics for a game in this series.
 
@@ -186,7 +186,7 @@ class SeriesMatchNamespace:
         """
         return self._performance(self._series_id, game_id)
 
-    @sanitize_and_validate
+    @forwarded
     def economy(self, game_id: int) -> EconomyData:
         """Get economy data for a game in this series.
 
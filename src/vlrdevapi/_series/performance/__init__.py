@@ -1,6 +1,13 @@
+from vlrdevapi._series.performance.aggregate import (
+    KILL_MATRIX_KINDS,
+    KillMatrixAggregate,
+    KillMatrixKind,
+    KillTensor,
+)
 from vlrdevapi._series.performance.models import (
     AdvStatsEntry,
     AdvStatsNotableRound,
+    DenseKillMatrix,
     KillEntry,
     KillMatrix,
     NotableVictim,
@@ -9,10 +16,15 @@ from vlrdevapi._series.performance.models import (
 from vlrdevapi._series.performance.namespace import SeriesPerformanceNamespace
 
 __all__ = [
+    "KILL_MATRIX_KINDS",
     "AdvStatsEntry",
     "AdvStatsNotableRound",
+    "DenseKillMatrix",
     "KillEntry",
     "KillMatrix",
+    "KillMatrixAggregate",
+    "KillMatrixKind",
+    "KillTensor",
     "NotableVictim",
     "PerformanceData",
     "SeriesPerformanceNamespace",
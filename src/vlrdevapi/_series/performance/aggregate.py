@@ -0,0 +1,203 @@
+"""Accumulation of kill matrices across many series into per-player totals."""
+
+from collections.abc import Iterable
+from typing import Any, Literal, NamedTuple
+
+from vlrdevapi._series.performance.models import PerformanceData
+
+KillMatrixKind = Literal["all", "first", "op"]
+
+KILL_MATRIX_KINDS: tuple[KillMatrixKind, ...] = ("all", "first", "op")
+
+_MATRIX_FIELDS: dict[KillMatrixKind, str] = {
+    "all": "all_kills_matrix",
+    "first": "first_kills_matrix",
+    "op": "op_kills_matrix",
+}
+
+
+class KillTensor(NamedTuple):
+    """Accumulated kills as a dense grid, returned by ``KillMatrixAggregate.to_tensor``."""
+
+    player_ids: list[int]
+    """Player IDs, in the order they index both player axes."""
+    names: list[str]
+    """Most recently seen name of each player."""
+    kinds: tuple[KillMatrixKind, ...]
+    """Matrix kinds, in the order they index the first axis."""
+    values: Any
+    """``kinds x players x players`` kills by the row player on the column
+    player, a NumPy array when available and nested lists otherwise."""
+
+
+class KillMatrixAggregate:
+    """Running kill totals between players across many ``PerformanceData``.
+
+    Every all-kills, first-kills and op-kills matrix added is folded into
+    directed ``(killer_id, victim_id)`` kill counts, so season-long duel
+    tables only walk each series' entries once, when it is added. Each
+    ``KillEntry`` contributes its ``kills`` to killer-on-victim and its
+    ``deaths`` to victim-on-killer. Entries without both player IDs are
+    skipped.
+
+    A series may be added as its combined ``"all"`` game or as individual
+    games, but not both. Adding the same series game twice is a no-op.
+
+    Examples:
+        >>> agg = KillMatrixAggregate(
+        ...     vlrdevapi.series.performance(sid) for sid in series_ids
+        ... )
+        >>> agg.add(vlrdevapi.series.performance(new_series_id))
+        True
+        >>> agg.duel(9, 438)
+        (41, 37)
+
+    """
+
+    def __init__(self, performances: Iterable[PerformanceData] = ()):
+        self._positions: dict[int, int] = {}
+        self._player_ids: list[int] = []
+        self._names: list[str] = []
+        self._counts: dict[KillMatrixKind, dict[tuple[int, int], int]] = {kind: {} for kind in KILL_MATRIX_KINDS}
+        self._games: dict[int, set[str]] = {}
+        self._added = 0
+        self.update(performances)
+
+    def __len__(self) -> int:
+        """Return the number of performances folded in."""
+        return self._added
+
+    @property
+    def player_ids(self) -> list[int]:
+        """Player IDs in order of first appearance."""
+        return list(self._player_ids)
+
+    def name(self, player_id: int) -> str | None:
+        """Return the most recently seen name of a player, or None if unseen."""
+        pos = self._positions.get(player_id)
+        return None if pos is None else self._names[pos]
+
+    def add(self, performance: PerformanceData) -> bool:
+        """Fold one performance result into the totals.
+
+        Args:
+            performance: A series game's performance data.
+
+        Returns:
+            bool: False if this series game was already added.
+
+        Raises:
+            ValueError: If the series was already added as ``"all"`` and this
+                is one of its games, or the other way around.
+
+        """
+        series_id, game_id = performance.series_id, str(performance.game_id)
+        # Results built without a series ID cannot be told apart.
+        if series_id > 0:
+            games = self._games.setdefault(series_id, set())
+            if game_id in games:
+                return False
+            if games and (game_id == "all" or "all" in games):
+                msg = f"series {series_id} cannot be added both as 'all' and per game"
+                raise ValueError(msg)
+            games.add(game_id)
+
+        position = self._position
+        for kind in KILL_MATRIX_KINDS:
+            counts = self._counts[kind]
+            for e in getattr(performance, _MATRIX_FIELDS[kind]).entries:
+                if not e.killer_id or not e.victim_id:
+                    continue
+                killer = position(e.killer_id, e.killer)
+                victim = position(e.victim_id, e.victim)
+                if e.kills:
+                    counts[killer, victim] = counts.get((killer, victim), 0) + e.kills
+                if e.deaths:
+                    counts[victim, killer] = counts.get((victim, killer), 0) + e.deaths
+        self._added += 1
+        return True
+
+    def update(self, performances: Iterable[PerformanceData]) -> int:
+        """Fold several performance results into the totals.
+
+        Args:
+            performances: Performance results, e.g. as they are fetched.
+
+        Returns:
+            int: How many were new.
+
+        """
+        return sum(self.add(performance) for performance in performances)
+
+    def kills(self, killer_id: int, victim_id: int, kind: KillMatrixKind = "all") -> int:
+        """Return how many times one player killed another.
+
+        Args:
+            killer_id: The killer's player ID.
+            victim_id: The victim's player ID.
+            kind: Which matrix to read.
+
+        Returns:
+            int: The accumulated kills, 0 for unseen players.
+
+        """
+        killer = self._positions.get(killer_id)
+        victim = self._positions.get(victim_id)
+        if killer is None or victim is None:
+            return 0
+        return self._counts[kind].get((killer, victim), 0)
+
+    def duel(self, player_id: int, opponent_id: int, kind: KillMatrixKind = "all") -> tuple[int, int]:
+        """Return ``(kills on opponent, deaths to opponent)`` for a player.
+
+        Args:
+            player_id: The player's ID.
+            opponent_id: The opponent's player ID.
+            kind: Which matrix to read.
+
+        Returns:
+            tuple[int, int]: The player's kills and deaths in the pairing.
+
+        """
+        return self.kills(player_id, opponent_id, kind), self.kills(opponent_id, player_id, kind)
+
+    def to_tensor(self) -> KillTensor:
+        """Return the totals as a dense ``kinds x players x players`` grid.
+
+        Returns:
+            KillTensor: The grid with its player and kind order.
+
+        """
+        n = len(self._player_ids)
+        try:
+            import numpy as np
+        except ImportError:
+            values: Any = []
+            for kind in KILL_MATRIX_KINDS:
+                grid = [[0] * n for _ in range(n)]
+                for (killer, victim), count in self._counts[kind].items():
+                    grid[killer][victim] = count
+                values.append(grid)
+        else:
+            values = np.zeros((len(KILL_MATRIX_KINDS), n, n), dtype=np.int64)
+            for k, kind in enumerate(KILL_MATRIX_KINDS):
+                counts = self._counts[kind]
+                if counts:
+                    cells = np.fromiter((i for pair in counts for i in pair), dtype=np.intp, count=2 * len(counts))
+                    values[k, cells[0::2], cells[1::2]] = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        return KillTensor(
+            player_ids=list(self._player_ids),
+            names=list(self._names),
+            kinds=KILL_MATRIX_KINDS,
+            values=values,
+        )
+
+    def _position(self, player_id: int, name: str) -> int:
+        pos = self._positions.get(player_id)
+        if pos is None:
+            pos = self._positions[player_id] = len(self._player_ids)
+            self._player_ids.append(player_id)
+            self._names.append(name)
+        elif name:
+            self._names[pos] = name
+        return pos
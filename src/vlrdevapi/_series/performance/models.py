@@ -1,11 +1,14 @@
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Literal, NamedTuple
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class KillEntry(BaseModel):
     """A single killer-victim pair with kill/death counts."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A single killer-victim pair with kill/death counts.",
         },
@@ -26,6 +29,7 @@ class KillMatrix(BaseModel):
     """A kill matrix as flat entries for all kills, first kills, or op kills."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A kill matrix (all kills, first kills, or op kills) as flat entries.",
         },
@@ -33,6 +37,8 @@ class KillMatrix(BaseModel):
 
     entries: list[KillEntry] = Field(default_factory=list, description="Kill entries comprising the kill matrix")
 
+    _kill_index: "_KillIndex | None" = PrivateAttr(default=None)
+
     def lookup(self, killer: str, victim: str) -> KillEntry | None:
         """Look up a kill entry by killer and victim names.
 
@@ -44,10 +50,7 @@ class KillMatrix(BaseModel):
             KillEntry | None: The matching entry, or None.
 
         """
-        for e in self.entries:
-            if e.killer == killer and e.victim == victim:
-                return e
-        return None
+        return self._index().pairs.get((killer, victim))
 
     def by_killer(self, name: str) -> list[KillEntry]:
         """Return all entries where the given player is the killer.
@@ -59,7 +62,7 @@ class KillMatrix(BaseModel):
             list[KillEntry]: Matching kill entries.
 
         """
-        return [e for e in self.entries if e.killer == name]
+        return list(self._index().killers.get(name, ()))
 
     def by_victim(self, name: str) -> list[KillEntry]:
         """Return all entries where the given player is the victim.
@@ -71,7 +74,7 @@ class KillMatrix(BaseModel):
             list[KillEntry]: Matching kill entries.
 
         """
-        return [e for e in self.entries if e.victim == name]
+        return list(self._index().victims.get(name, ()))
 
     def by_team(self, team: str) -> list[KillEntry]:
         """Return all entries where either player belongs to the given team.
@@ -83,9 +86,7 @@ class KillMatrix(BaseModel):
             list[KillEntry]: Matching kill entries.
 
         """
-        return [
-            e for e in self.entries if e.killer_team == team or e.victim_team == team
-        ]
+        return list(self._index().teams.get(team, ()))
 
     def killers(self) -> list[str]:
         """Return an ordered list of unique killer names.
@@ -94,11 +95,7 @@ class KillMatrix(BaseModel):
             list[str]: Unique killer names in order of first appearance.
 
         """
-        seen: list[str] = []
-        for e in self.entries:
-            if e.killer not in seen:
-                seen.append(e.killer)
-        return seen
+        return list(self._index().killers)
 
     def victims(self) -> list[str]:
         """Return an ordered list of unique victim names.
@@ -107,17 +104,110 @@ class KillMatrix(BaseModel):
             list[str]: Unique victim names in order of first appearance.
 
         """
-        seen: list[str] = []
-        for e in self.entries:
-            if e.victim not in seen:
-                seen.append(e.victim)
-        return seen
+        return list(self._index().victims)
+
+    def to_matrix(self, value: Literal["kills", "deaths", "diff"] = "kills", fill: int = 0) -> "DenseKillMatrix":
+        """Return the matrix as a dense killer-by-victim grid.
+
+        Row ``i`` is ``killers[i]`` and column ``j`` is ``victims[j]``, both
+        in order of first appearance. The grid is a NumPy integer array when
+        NumPy is installed and a list of row lists otherwise.
+
+        Args:
+            value: The entry field to place in each cell.
+            fill: The value for pairs with no entry or no data.
+
+        Returns:
+            DenseKillMatrix: The grid with its row and column names.
+
+        """
+        index = self._index()
+        killers = list(index.killers)
+        victims = list(index.victims)
+        row_of = {name: i for i, name in enumerate(killers)}
+        column_of = {name: j for j, name in enumerate(victims)}
+        rows = [[fill] * len(victims) for _ in killers]
+        # ``pairs`` holds the first entry per pair, as ``lookup`` returns.
+        for (killer, victim), e in index.pairs.items():
+            cell = getattr(e, value)
+            if cell is not None:
+                rows[row_of[killer]][column_of[victim]] = cell
+        try:
+            import numpy as np
+        except ImportError:
+            return DenseKillMatrix(killers=killers, victims=victims, values=rows)
+        return DenseKillMatrix(killers=killers, victims=victims, values=np.array(rows, dtype=int).reshape(len(killers), len(victims)))
+
+    def _index(self) -> "_KillIndex":
+        # Compact copies (see ``vlrdevapi._compact``) have no private
+        # attributes and build a fresh index on every call.
+        private = getattr(self, "__pydantic_private__", None)
+        if private is None:
+            return _KillIndex(self.entries)
+        index = private.get("_kill_index")
+        if index is None or index.entries is not self.entries or index.size != len(self.entries):
+            index = _KillIndex(self.entries)
+            private["_kill_index"] = index
+        return index
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # The index is rebuilt on demand, so pickles leave it out.
+        state = super().__getstate__()
+        state["__pydantic_private__"] = {**state["__pydantic_private__"], "_kill_index": None}
+        return state
+
+
+class DenseKillMatrix(NamedTuple):
+    """A kill matrix as a dense grid, returned by ``KillMatrix.to_matrix``."""
+
+    killers: list[str]
+    """Row names: killer player names."""
+    victims: list[str]
+    """Column names: victim player names."""
+    values: Any
+    """``len(killers)`` x ``len(victims)`` grid, a NumPy array when available."""
+
+
+class _KillIndex:
+    """Lookup tables over a ``KillMatrix``'s entries, all in entry order.
+
+    Rebuilt when ``entries`` is replaced or changes length, so checking
+    it costs O(1) per lookup. Replacing an entry in place
+    (``entries[i] = ...``) or editing an entry's names is not detected;
+    assign a new list (``m.entries = [...]``) instead.
+
+    Any two indexes, or an index and no index, compare equal, so building
+    one never changes ``KillMatrix`` equality.
+    """
+
+    __slots__ = ("entries", "killers", "pairs", "size", "teams", "victims")
+
+    def __init__(self, entries: list[KillEntry]):
+        self.entries = entries
+        self.size = len(entries)
+        self.pairs: dict[tuple[str, str], KillEntry] = {}
+        self.killers: dict[str, list[KillEntry]] = {}
+        self.victims: dict[str, list[KillEntry]] = {}
+        self.teams: dict[str, list[KillEntry]] = {}
+        for e in entries:
+            self.pairs.setdefault((e.killer, e.victim), e)
+            self.killers.setdefault(e.killer, []).append(e)
+            self.victims.setdefault(e.victim, []).append(e)
+            self.teams.setdefault(e.killer_team, []).append(e)
+            if e.victim_team != e.killer_team:
+                self.teams.setdefault(e.victim_team, []).append(e)
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, _KillIndex)
+
+    __hash__ = None  # type: ignore[assignment]
 
 
 class NotableVictim(BaseModel):
     """A victim in a notable round with name and player ID."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A victim in a notable round with name and player ID.",
         },
@@ -131,6 +221,7 @@ class AdvStatsNotableRound(BaseModel):
     """A notable round detail for a multi-kill or clutch."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "A notable round detail for a multi-kill or clutch.",
         },
@@ -144,6 +235,7 @@ class AdvStatsEntry(BaseModel):
     """Advanced stats entry for a player in a game."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Advanced stats entry for a player in a game.",
         },
@@ -180,6 +272,7 @@ class PerformanceData(BaseModel):
     """Performance metrics for a game/map within a series on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Performance metrics for a game/map within a series on vlr.gg.",
         },
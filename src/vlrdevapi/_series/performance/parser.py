@@ -9,6 +9,7 @@ from vlrdevapi._series.performance.models import (
     NotableVictim,
     PerformanceData,
 )
+from vlrdevapi._utils.intern import intern_text
 import contextlib
 
 
@@ -53,7 +54,7 @@ def _parse_player_from_td(td: Node) -> tuple[str, int, str]:
 
     team_tag = td.css_first(".team-tag")
     if team_tag:
-        team_short = team_tag.text(strip=True)
+        team_short = intern_text(team_tag.text(strip=True))
         parent = team_tag.parent
         if parent and parent.tag == "div":
             name = parent.text(deep=False, strip=True)
@@ -206,7 +207,7 @@ def _parse_adv_stats_row(tr: Node, player_mapping: dict[str, int]) -> AdvStatsEn
     if agent_img:
         src = agent_img.attributes.get("src", "") or ""
         agent_name = src.rsplit("/", 1)[-1].replace(".png", "")
-        entry.agent = agent_name.title()
+        entry.agent = intern_text(agent_name.title())
 
     stat_fields = [
         ("two_k", "mod-d", "two_k_rounds"),
@@ -6,6 +6,7 @@ class SideStats(BaseModel):
     """Stats for one side: overall, attack, or defend."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Stats for one side: overall, attack, or defend.",
         },
@@ -29,6 +30,7 @@ class PlayerStats(BaseModel):
     """Three-way stats: overall, attack, and defend."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Three-way stats: overall + attack + defend."},
     )
 
@@ -41,6 +43,7 @@ class PlayerGameStats(BaseModel):
     """Per-player stats within a specific game/overview."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Per-player stats within a specific game/overview.",
         },
@@ -59,6 +62,7 @@ class TeamPlayers(BaseModel):
     """All players for one team in a game."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "All players for one team in a game."},
     )
 
@@ -72,6 +76,7 @@ class PlayersStats(BaseModel):
     """Player statistics for a series game on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Player statistics for a series game on vlr.gg.",
         },
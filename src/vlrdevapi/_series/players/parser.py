@@ -10,6 +10,7 @@ from vlrdevapi._series.players.models import (
     SideStats,
     TeamPlayers,
 )
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.commons.countries import get_country_name
 import contextlib
 
@@ -138,18 +139,24 @@ def _parse_stat_cell(td: Node) -> tuple:
     return overall, attack, defend
 
 
-def _parse_player_row(tr: Node) -> PlayerGameStats:
+def _parse_player_row(tr: Node, stats: PlayerStats) -> PlayerGameStats:
     """Parse a player row from the stats table.
 
     Args:
         tr: The table row Node containing player data.
+        stats: The player's already parsed stats.
 
     Returns:
         PlayerGameStats: Parsed player info including name, ID, team,
         and agents.
 
     """
-    player = PlayerGameStats()
+    player_id = 0
+    name = ""
+    team_short = ""
+    country_code = ""
+    country = ""
+    agents: list[str] = []
     tds = tr.css("td")
 
     td_player = tds[0] if len(tds) > 0 else None
@@ -162,41 +169,51 @@ def _parse_player_row(tr: Node) -> PlayerGameStats:
             parts = href.strip("/").split("/")
             if len(parts) >= 2:
                 with contextlib.suppress(ValueError):
-                    player.player_id = int(parts[1])
+                    player_id = int(parts[1])
 
         name_el = td_player.css_first(".text-of")
         if name_el:
-            player.name = name_el.text(strip=True)
+            name = name_el.text(strip=True)
         else:
             bold_el = td_player.css_first("div[style*='font-weight: 700']")
             if bold_el:
-                player.name = bold_el.text(strip=True)
+                name = bold_el.text(strip=True)
             else:
                 for div in td_player.css("div"):
                     text = div.text(strip=True)
                     if text and len(text) <= 20 and not div.css("div"):
-                        player.name = text
+                        name = text
                         break
 
         team_el = td_player.css_first(".ge-text-light")
         if team_el:
-            player.team_short = team_el.text(strip=True)
+            team_short = intern_text(team_el.text(strip=True))
 
         flag_el = td_player.css_first("i.flag")
         if flag_el:
             for cls in (flag_el.attributes.get("class") or "").split():
                 if cls.startswith("mod-") and cls != "mod-none":
-                    player.country_code = cls[4:]
-                    player.country = get_country_name(player.country_code)
+                    country_code = cls[4:]
+                    country = get_country_name(country_code)
                     break
 
     if td_agents:
         for img in td_agents.css("img"):
             alt = img.attributes.get("alt", "") or ""
             if alt:
-                player.agents.append(alt.title())
-
-    return player
+                agents.append(intern_text(alt.title()))
+
+    # Built in one call: an empty ``PlayerGameStats()`` would also build a
+    # default ``PlayerStats`` and three ``SideStats`` only to replace them.
+    return PlayerGameStats(
+        player_id=player_id,
+        name=name,
+        country_code=country_code,
+        country=country,
+        team_short=team_short,
+        agents=agents,
+        stats=stats,
+    )
 
 
 def _parse_table(table: Node) -> list[PlayerGameStats]:
@@ -217,8 +234,6 @@ def _parse_table(table: Node) -> list[PlayerGameStats]:
         if len(tds) < 14:
             continue
 
-        player = _parse_player_row(tr)
-
         stat_tds = tds[2:14]
 
         overall_vals = []
@@ -247,11 +262,12 @@ def _parse_table(table: Node) -> list[PlayerGameStats]:
                 fk_fd_diff=vals[11],
             )
 
-        player.stats = PlayerStats(
+        stats = PlayerStats(
             overall=_build_side(overall_vals),
             attack=_build_side(attack_vals),
             defend=_build_side(defend_vals),
         )
+        player = _parse_player_row(tr, stats)
 
         players.append(player)
 
@@ -315,9 +331,9 @@ def parse_players_stats(html: HTMLParser, game_id: str = "all") -> PlayersStats:
             if bold_div:
                 m = re.search(r"<span[^>]*>\s*([A-Za-z]+)", bold_div.html or "")
                 if m:
-                    result.map_name = m.group(1)
+                    result.map_name = intern_text(m.group(1))
             if not result.map_name:
-                result.map_name = map_div.text(strip=True)
+                result.map_name = intern_text(map_div.text(strip=True))
 
     tables = game_div.css("table.wf-table-inset.mod-overview")
     if len(tables) < 2:
@@ -1,4 +1,5 @@
+from vlrdevapi._series.rounds.columns import ROUNDS_COLUMNS, rounds_columns
 from vlrdevapi._series.rounds.models import RoundData, RoundsData, RoundWinType
 from vlrdevapi._series.rounds.namespace import SeriesRoundsNamespace
 
-__all__ = ["RoundData", "RoundWinType", "RoundsData", "SeriesRoundsNamespace"]
+__all__ = ["ROUNDS_COLUMNS", "RoundData", "RoundWinType", "RoundsData", "SeriesRoundsNamespace", "rounds_columns"]
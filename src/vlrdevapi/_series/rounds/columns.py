@@ -0,0 +1,43 @@
+"""Columnar export of round-by-round data."""
+
+from collections.abc import Iterable
+from operator import attrgetter
+
+from vlrdevapi._series.rounds.models import RoundsData
+from vlrdevapi._utils.columnar import Columns, ColumnSpec, collect_columns
+
+_GAME_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("series_id", int, attrgetter("series_id")),
+    ("game_id", int, attrgetter("game_id")),
+)
+
+_ROUND_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("round_number", int, attrgetter("round_number")),
+    ("winner_team_id", int, attrgetter("winner_team_id")),
+    ("winner_team_name", str, attrgetter("winner_team_name")),
+    ("win_type", str, attrgetter("win_type")),
+    ("side", str, attrgetter("side")),
+    ("team1_score", int, attrgetter("team1_score")),
+    ("team2_score", int, attrgetter("team2_score")),
+)
+
+ROUNDS_COLUMNS: tuple[str, ...] = tuple(name for name, _, _ in (*_GAME_COLUMNS, *_ROUND_COLUMNS))
+
+
+def rounds_columns(games: Iterable[RoundsData]) -> Columns:
+    """Concatenate the rounds of many games into one columnar table.
+
+    Args:
+        games: Round data of each game, e.g. from ``series.rounds.all``.
+
+    Returns:
+        Columns: One row per round with the columns in ``ROUNDS_COLUMNS``.
+        Use ``to_numpy()`` or ``to_arrow()`` to convert it.
+
+    Examples:
+        >>> table = rounds_columns(vlrdevapi.series.rounds.all(series_id=12345))
+        >>> table["win_type"][:3]
+        ['Elimination', 'Defuse', 'Elimination']
+
+    """
+    return collect_columns(games, attrgetter("rounds"), _GAME_COLUMNS, _ROUND_COLUMNS)
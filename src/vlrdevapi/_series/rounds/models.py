@@ -31,6 +31,7 @@ class RoundData(BaseModel):
     """A single round within a game/map on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A single round within a game/map on vlr.gg."},
     )
 
@@ -54,6 +55,7 @@ class RoundsData(BaseModel):
     """Round-by-round data for a game/map within a series on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Round-by-round data for a game/map within a series on vlr.gg.",
         },
@@ -4,9 +4,9 @@ from datetime import tzinfo
 from zoneinfo import ZoneInfo
 
 import httpx
-from selectolax.parser import HTMLParser
 
 from vlrdevapi._base import SyncNamespace
+from vlrdevapi._series.info.models import SeriesInfo
 from vlrdevapi._series.info.parser import parse_series_info
 from vlrdevapi._series.rounds.models import RoundsData
 from vlrdevapi._series.rounds.parser import parse_rounds_data
@@ -70,22 +70,62 @@ class SeriesRoundsNamespace:
         result.game_id = game_id
 
         html_series = self._sync._fetch(series_path(series_id))
-        return _enrich_rounds(result, html_series)
+        return _enrich_rounds(result, parse_series_info(html_series, fields={"teams"}))
+
+    @sanitize_and_validate
+    def all(self, series_id: int) -> list[RoundsData]:
+        """Get round-by-round data for every played game of a series.
+
+        The series page is fetched and parsed once for the game list and
+        team IDs, then the overview tab of every game is fetched
+        concurrently.
+
+        Args:
+            series_id: The unique series identifier on vlr.gg.
+
+        Returns:
+            list[RoundsData]: Round data per played game, in map order.
+
+        Raises:
+            ValidationError: If ``series_id`` is not a valid positive integer.
+            NotFoundError: If the series page does not exist (HTTP 404).
+            RequestError: If the HTTP request fails.
+            RateLimitError: If the rate limit is exceeded.
+            ParsingError: If the page structure is unrecognised.
+
+        Examples:
+            >>> games = vlrdevapi.series.rounds.all(series_id=12345)
+            >>> [len(g.rounds) for g in games]
+            [24, 26, 19]
+
+        """
+        series_info = parse_series_info(self._sync._fetch(series_path(series_id)), fields={"teams", "games"})
+        game_ids = [game.game_id for game in series_info.games if game.played and game.game_id > 0]
+        htmls = self._sync._parallel_fetch(
+            [f"{series_path(series_id)}?game={game_id}&tab=overview" for game_id in game_ids],
+        )
+
+        results: list[RoundsData] = []
+        for game_id, html in zip(game_ids, htmls, strict=True):
+            result = parse_rounds_data(html)
+            result.series_id = series_id
+            result.game_id = game_id
+            results.append(_enrich_rounds(result, series_info))
+        return results
 
 
 
-def _enrich_rounds(result: RoundsData, html_series: HTMLParser) -> RoundsData:
+def _enrich_rounds(result: RoundsData, series_info: SeriesInfo) -> RoundsData:
     """Enrich round data with team IDs from the series info.
 
     Args:
         result: The RoundsData to enrich.
-        html_series: HTML of the series page for team info parsing.
+        series_info: Series info with at least the ``"teams"`` section parsed.
 
     Returns:
         RoundsData: Enriched round data with team IDs.
 
     """
-    series_info = parse_series_info(html_series)
     if series_info.team1 and series_info.team1.tag == result.team1:
         result.team1_id = series_info.team1.id
     if series_info.team2 and series_info.team2.tag == result.team2:
@@ -14,3 +14,6 @@ class SeriesRoundsNamespace:
 
     def __call__(self, series_id: int, game_id: int) -> RoundsData:
         ...
+
+    def all(self, series_id: int) -> list[RoundsData]:
+        ...
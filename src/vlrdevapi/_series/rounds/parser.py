@@ -1,6 +1,7 @@
 from selectolax.parser import HTMLParser
 
 from vlrdevapi._series.rounds.models import RoundData, RoundsData, RoundWinType
+from vlrdevapi._utils.intern import intern_text
 
 
 def parse_rounds_data(html: HTMLParser) -> RoundsData:
@@ -27,8 +28,8 @@ def parse_rounds_data(html: HTMLParser) -> RoundsData:
     if len(teams) < 2:
         return RoundsData()
 
-    team1 = teams[0].text(strip=True)
-    team2 = teams[1].text(strip=True)
+    team1 = intern_text(teams[0].text(strip=True))
+    team2 = intern_text(teams[1].text(strip=True))
 
     rounds_data = RoundsData(team1=team1, team2=team2)
 
@@ -6,6 +6,7 @@ class SeriesVod(BaseModel):
     """A single VOD/video link for a series match."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A single VOD/video link for a series match."},
     )
 
@@ -19,6 +20,7 @@ class SeriesVods(BaseModel):
     """VOD/video links for a match/series on vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "VOD/video links for a match/series on vlr.gg.",
         },
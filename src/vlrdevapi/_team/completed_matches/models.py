@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class OpponentInCompletedMatch(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Opponent team in a completed match."},
     )
 
@@ -16,6 +17,7 @@ class OpponentInCompletedMatch(BaseModel):
 
 class TeamCompletedMatchEntry(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A completed match for a specific team."},
     )
 
@@ -34,6 +36,7 @@ class TeamCompletedMatchEntry(BaseModel):
 
 class TeamCompletedMatches(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Collection of completed matches for a team."},
     )
 
@@ -7,6 +7,7 @@ from vlrdevapi._team.completed_matches.models import (
     TeamCompletedMatchEntry,
     TeamCompletedMatches,
 )
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.commons.datetime import parse_vlr_datetime
 from vlrdevapi.fetcher import BASE_URL
 
@@ -40,11 +41,11 @@ def _parse_match_item(item: Node, team_id: int, source_tz: ZoneInfo | tzinfo | N
     if event_el:
         divs = event_el.css("div")
         if len(divs) >= 2:
-            match.event = divs[1].text(strip=True)
+            match.event = intern_text(divs[1].text(strip=True))
         full_text = event_el.text(separator=" ", strip=True)
         if match.event and match.event in full_text:
             stage_text = full_text.replace(match.event, "").strip()
-            match.stage = stage_text
+            match.stage = intern_text(stage_text)
 
     result_el = item.css_first(".m-item-result")
     if result_el:
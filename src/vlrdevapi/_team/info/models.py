@@ -4,6 +4,8 @@ from pydantic import BaseModel, ConfigDict, Field
 class TeamSocial(BaseModel):
     """Team social media information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(description="Platform name (e.g., 'Twitch', 'YouTube')")
     url: str = Field(description="Full URL to the social media profile")
 
@@ -11,6 +13,8 @@ class TeamSocial(BaseModel):
 class TeamSuccessor(BaseModel):
     """Team successor information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: int = Field(description="Team ID")
     name: str = Field(description="Team name")
 
@@ -19,6 +23,7 @@ class TeamInfo(BaseModel):
     """Team information from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Team information from vlr.gg."},
     )
 
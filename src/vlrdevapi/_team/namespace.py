@@ -25,7 +25,7 @@ from vlrdevapi.fetcher import (
     RateLimiter,
     RetryConfig,
 )
-from vlrdevapi.validators import sanitize_and_validate
+from vlrdevapi.validators import forwarded, sanitize_and_validate
 
 
 class TeamMatchNamespace:
@@ -56,7 +56,7 @@ class TeamMatchNamespace:
         self._stats = stats
         self._placements = placements
 
-    @sanitize_and_validate
+    @forwarded
     def info(self) -> TeamInfo:
         """Get general info for this team.
 
@@ -78,7 +78,7 @@ class TeamMatchNamespace:
         """
         return self._info(self._team_id)
 
-    @sanitize_and_validate
+    @forwarded
     def roster(self) -> TeamRoster:
         """Get the current roster for this team.
 
@@ -100,7 +100,7 @@ class TeamMatchNamespace:
         """
         return self._roster(self._team_id)
 
-    @sanitize_and_validate
+    @forwarded
     def completed_matches(self) -> TeamCompletedMatches:
         """Get completed match history for this team.
 
@@ -123,7 +123,7 @@ class TeamMatchNamespace:
         """
         return self._completed_matches(self._team_id)
 
-    @sanitize_and_validate
+    @forwarded
     def upcoming_matches(self) -> TeamUpcomingMatches:
         """Get upcoming matches for this team.
 
@@ -145,10 +145,14 @@ class TeamMatchNamespace:
         """
         return self._upcoming_matches(self._team_id)
 
-    @sanitize_and_validate
-    def transactions(self) -> TeamTransactions:
+    @forwarded
+    def transactions(self, since: date | None = None, until: date | None = None) -> TeamTransactions:
         """Get roster transactions (joins/leaves) for this team.
 
+        Args:
+            since: Only include transactions on or after this date (inclusive).
+            until: Only include transactions on or before this date (inclusive).
+
         Returns:
             TeamTransactions: Chronological list of ``transactions``
             including ``action`` (Join/Leave/Inactive), ``player`` details,
@@ -165,9 +169,9 @@ class TeamMatchNamespace:
             'Join'
 
         """
-        return self._transactions(self._team_id)
+        return self._transactions(self._team_id, since=since, until=until)
 
-    @sanitize_and_validate
+    @forwarded
     def stats(
         self,
         date_start: date | None = None,
@@ -215,7 +219,7 @@ class TeamMatchNamespace:
             agent_composition=agent_composition,
         )
 
-    @sanitize_and_validate
+    @forwarded
     def placements(self) -> TeamPlacements:
         """Get event placement history for this team.
 
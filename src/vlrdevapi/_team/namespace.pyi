@@ -39,7 +39,7 @@ class TeamMatchNamespace:
 
     def upcoming_matches(self) -> TeamUpcomingMatches: ...
 
-    def transactions(self) -> TeamTransactions: ...
+    def transactions(self, since: date | None = None, until: date | None = None) -> TeamTransactions: ...
 
     def stats(
         self,
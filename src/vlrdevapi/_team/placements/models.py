@@ -6,6 +6,7 @@ class EventPlacement(BaseModel):
     """A single placement within an event."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A single placement within an event."},
     )
 
@@ -21,6 +22,7 @@ class TeamEventPlacement(BaseModel):
     """Event placement entry for a team."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Event placement entry for a team."},
     )
 
@@ -43,6 +45,7 @@ class TeamPlacements(BaseModel):
     """Collection of team event placements."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Collection of team event placements."},
     )
 
@@ -8,6 +8,7 @@ from vlrdevapi._team.placements.models import (
     TeamEventPlacement,
     TeamPlacements,
 )
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.commons.prizes import parse_prize_amount
 
 
@@ -83,7 +84,7 @@ def _parse_event_item(item: Node) -> TeamEventPlacement | None:
 
     name_el = item.css_first(".text-of")
     if name_el:
-        event.event_name = name_el.text(strip=True)
+        event.event_name = intern_text(name_el.text(strip=True))
 
     year_divs = item.css("div")
     for div in year_divs:
@@ -127,11 +128,11 @@ def _parse_series_span(span: Node) -> EventPlacement | None:
 
     if "–" in text:  # noqa: RUF001
         parts = text.split("–", 1)  # noqa: RUF001
-        placement.stage = parts[0].strip()
+        placement.stage = intern_text(parts[0].strip())
         placement.placement = parts[1].strip()
     elif "-" in text:
         parts = text.split("-", 1)
-        placement.stage = parts[0].strip()
+        placement.stage = intern_text(parts[0].strip())
         placement.placement = parts[1].strip()
     else:
         placement.placement = text
@@ -6,6 +6,7 @@ class Player(BaseModel):
     """Player or staff member information."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Player or staff member information."},
     )
 
@@ -31,6 +32,7 @@ class TeamRoster(BaseModel):
     """Team roster information from vlr.gg."""
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Team roster information from vlr.gg."},
     )
 
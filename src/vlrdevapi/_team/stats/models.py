@@ -8,6 +8,7 @@ AgentCompositionLevel = Literal["none", "basic", "detailed"]
 
 class CompositionMatchDetails(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Detailed match information for a specific composition.",
         },
@@ -40,6 +41,7 @@ class CompositionMatchDetails(BaseModel):
 
 class AgentComposition(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Agent composition statistics for a map."},
     )
 
@@ -61,6 +63,7 @@ class AgentComposition(BaseModel):
 
 class MapStats(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Statistics for a single map."},
     )
 
@@ -92,6 +95,7 @@ class MapStats(BaseModel):
 
 class TeamStats(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Collection of map statistics for a team (excludes maps with 0 games).",
         },
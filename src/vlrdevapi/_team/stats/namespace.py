@@ -6,9 +6,12 @@ from zoneinfo import ZoneInfo
 import httpx
 
 from vlrdevapi._base import SyncNamespace
-from vlrdevapi._series.info.namespace import SeriesInfoNamespace
+from vlrdevapi._cache import LRUCache
+from vlrdevapi._series.info.models import SeriesInfo
+from vlrdevapi._series.info.parser import parse_series_info
 from vlrdevapi._team.stats.models import AgentCompositionLevel, TeamStats
 from vlrdevapi._team.stats.parser import parse_team_stats
+from vlrdevapi._utils.paths import series as series_path
 from vlrdevapi.fetcher import (
     DEFAULT_RETRY_CONFIG,
     DEFAULT_TIMEOUT,
@@ -55,7 +58,7 @@ def _build_stats_url(
 class TeamStatsNamespace:
     """Access team map statistics from vlr.gg."""
 
-    __slots__ = ("_series_info", "_sync", "_source_tz")
+    __slots__ = ("_series_cache", "_source_tz", "_sync")
 
     def __init__(
         self,
@@ -68,7 +71,7 @@ class TeamStatsNamespace:
     ):
         self._source_tz = source_tz
         self._sync = SyncNamespace(client, timeout, retry_config, rate_limiter, extra_headers)
-        self._series_info = SeriesInfoNamespace(client, timeout, retry_config, rate_limiter)
+        self._series_cache: LRUCache[int, SeriesInfo] = LRUCache[int, SeriesInfo](maxsize=512)
 
     @sanitize_and_validate
     def __call__(
@@ -122,6 +125,34 @@ class TeamStatsNamespace:
         return parse_team_stats(
             html, team_id,
             agent_composition=agent_composition,
-            series_info_fn=self._series_info if agent_composition == "detailed" else None,
+            series_infos_fn=self._series_infos if agent_composition == "detailed" else None,
         )
 
+    def _series_infos(self, series_ids: list[int]) -> dict[int, SeriesInfo]:
+        """Look up series info for composition details, fetching uncached series concurrently.
+
+        Args:
+            series_ids: Distinct series IDs referenced by the stats page.
+
+        Returns:
+            dict[int, SeriesInfo]: Series info keyed by series ID.
+
+        """
+        infos: dict[int, SeriesInfo] = {}
+        missing: list[int] = []
+        for series_id in series_ids:
+            cached = self._series_cache.get(series_id)
+            if cached is not None:
+                infos[series_id] = cached
+            else:
+                missing.append(series_id)
+
+        htmls = self._sync._parallel_fetch([series_path(sid) for sid in missing], max_workers=5)
+        for series_id, html in zip(missing, htmls, strict=True):
+            # Composition details only read event, date and team fields.
+            info = parse_series_info(html, fields={"event", "date", "teams"})
+            info.series_id = series_id
+            self._series_cache.put(series_id, info)
+            infos[series_id] = info
+        return infos
+
@@ -12,6 +12,7 @@ from vlrdevapi._team.stats.models import (
     MapStats,
     TeamStats,
 )
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.exceptions import VlrdevapiException
 
 logger = logging.getLogger(__name__)
@@ -21,6 +22,11 @@ _AGENT_NAME_OVERRIDES: dict[str, str] = {
     "kayo": "Kayo",
 }
 
+_MAP_NAME_RE = re.compile(r"^(.+?)\s*\((\d+)\)$")
+_PLAY_COUNT_RE = re.compile(r"\((\d+)\)")
+_SERIES_HREF_RE = re.compile(r"/(\d+)/")
+_COMP_HASH_RE = re.compile(r"[0-9a-f]{12}")
+
 
 def _parse_percentage(value: str) -> float | None:
     if not value or value.strip() == "-":
@@ -46,7 +52,7 @@ def _extract_cell_text(cell: Node) -> str:
 
 
 def _parse_map_name(text: str) -> tuple[str, int]:
-    match = re.match(r"^(.+?)\s*\((\d+)\)$", text.strip())
+    match = _MAP_NAME_RE.match(text.strip())
     if match:
         return match.group(1).strip(), int(match.group(2))
     return text.strip(), 0
@@ -58,7 +64,7 @@ def _normalize_agent_name(src_path: str) -> str:
     lower_name = name.lower()
     if lower_name in _AGENT_NAME_OVERRIDES:
         return _AGENT_NAME_OVERRIDES[lower_name]
-    return name.title()
+    return intern_text(name.title())
 
 
 def _parse_compositions_from_cell(cell: Node) -> dict[str, AgentComposition]:
@@ -72,7 +78,7 @@ def _parse_compositions_from_cell(cell: Node) -> dict[str, AgentComposition]:
         play_count = 0
         for span in agg_div.css("span"):
             text = span.text(strip=True)
-            match = re.match(r"\((\d+)\)", text)
+            match = _PLAY_COUNT_RE.match(text)
             if match:
                 play_count = int(match.group(1))
                 break
@@ -106,11 +112,71 @@ def _parse_score(score_text: str) -> tuple[int, int]:
     return 0, 0
 
 
-def _parse_game_rows(html: HTMLParser, map_name: str) -> list[dict]:
+def _group_toggle_rows(html: HTMLParser) -> dict[str, list[Node]]:
+    """Bucket the per-game toggle rows of the maps table by map name.
+
+    Each ``tr.mod-toggle`` row also carries a ``mod-<map name>`` class.
+    Grouping them in one pass avoids a whole-document query per map.
+
+    Args:
+        html: Parsed HTML of the team stats page.
+
+    Returns:
+        dict[str, list[Node]]: Toggle rows keyed by map name, in page order.
+
+    """
+    groups: dict[str, list[Node]] = {}
+    for row in html.css("tr.mod-toggle"):
+        for cls in (row.attributes.get("class") or "").split():
+            if cls.startswith("mod-") and cls != "mod-toggle":
+                groups.setdefault(cls[4:], []).append(row)
+    return groups
+
+
+def _scan_game_link(link: Node) -> tuple[Node | None, Node | None, Node | None, list[tuple[Node, Node | None]]]:
+    """Find the date, opponent, score and half nodes of a game link in one walk.
+
+    Equivalent to ``css_first("div")``, ``css_first(".text-of")``,
+    ``css_first(".game-score")`` and ``css(".game-half")`` (each half paired
+    with its first ``.game-half-label``), but visits the subtree once
+    instead of running a selector query per field.
+
+    Args:
+        link: The ``a`` node of a game row.
+
+    Returns:
+        tuple: ``(date_div, opponent_div, score_div, halves)``.
+
+    """
+    date_div = opponent_div = score_div = None
+    halves: list[tuple[Node, Node | None]] = []
+    nodes = link.traverse()
+    next(nodes)  # the link itself
+    for node in nodes:
+        if date_div is None and node.tag == "div":
+            date_div = node
+        classes = node.attributes.get("class")
+        if not classes:
+            continue
+        for cls in classes.split():
+            if cls == "text-of":
+                if opponent_div is None:
+                    opponent_div = node
+            elif cls == "game-score":
+                if score_div is None:
+                    score_div = node
+            elif cls == "game-half":
+                halves.append((node, None))
+            elif cls == "game-half-label" and halves and halves[-1][1] is None:
+                halves[-1] = (halves[-1][0], node)
+    return date_div, opponent_div, score_div, halves
+
+
+def _parse_game_rows(rows: list[Node]) -> list[dict]:
     games: list[dict] = []
 
-    for row in html.css(f"tr.mod-toggle.mod-{map_name}"):
-        cells = row.css("td")
+    for row in rows:
+        cells = [child for child in row.iter() if child.tag == "td"]
         if len(cells) < 3:
             continue
 
@@ -132,19 +198,17 @@ def _parse_game_rows(html: HTMLParser, map_name: str) -> list[dict]:
 
         href = link.attributes.get("href", "") or ""
         series_id = 0
-        href_match = re.match(r"/(\d+)/", href)
+        href_match = _SERIES_HREF_RE.match(href)
         if href_match:
             series_id = int(href_match.group(1))
 
-        date_div = link.css_first("div")
+        date_div, opponent_div, score_div, halves = _scan_game_link(link)
         date = date_div.text(strip=True) if date_div else ""
 
         opponent_name = ""
-        opponent_div = link.css_first(".text-of")
         if opponent_div:
             opponent_name = opponent_div.text(strip=True)
 
-        score_div = link.css_first(".game-score")
         team_score, opponent_score = 0, 0
         if score_div:
             team_score, opponent_score = _parse_score(score_div.text(strip=True))
@@ -153,9 +217,7 @@ def _parse_game_rows(html: HTMLParser, map_name: str) -> list[dict]:
         defense_won, defense_lost = 0, 0
         ot_won, ot_lost = 0, 0
 
-        half_divs = link.css(".game-half")
-        for half_div in half_divs:
-            label_div = half_div.css_first(".game-half-label")
+        for half_div, label_div in halves:
             if not label_div:
                 continue
 
@@ -188,17 +250,10 @@ def _parse_game_rows(html: HTMLParser, map_name: str) -> list[dict]:
 
         comp_hash = ""
         for cell in cells:
-            classes = (cell.attributes.get("class") or "").split()
-            for cls in classes:
-                if len(cls) == 12:
-                    is_valid_hash = True
-                    for c in cls:
-                        if c not in "0123456789abcdef":
-                            is_valid_hash = False
-                            break
-                    if is_valid_hash:
-                        comp_hash = cls
-                        break
+            for cls in (cell.attributes.get("class") or "").split():
+                if _COMP_HASH_RE.fullmatch(cls):
+                    comp_hash = cls
+                    break
             if comp_hash:
                 break
 
@@ -288,7 +343,7 @@ def _parse_map_row_basic(row: Node) -> MapStats | None:
         return None
 
     stats = MapStats()
-    stats.map_name = map_name
+    stats.map_name = intern_text(map_name)
     stats.games_played = games_played
     stats.win_rate = _parse_percentage(_extract_cell_text(cells[2]))
     stats.wins = _parse_int(_extract_cell_text(cells[3]))
@@ -306,8 +361,8 @@ def _parse_map_row_basic(row: Node) -> MapStats | None:
 
 
 def _parse_map_row_with_compositions(
-    html: HTMLParser,
     row: Node,
+    toggle_rows: Callable[[], dict[str, list[Node]]],
 ) -> tuple[MapStats | None, list[dict], dict[str, AgentComposition]]:
     cells = row.css("td")
     if len(cells) < 12:
@@ -321,7 +376,7 @@ def _parse_map_row_with_compositions(
         return None, [], {}
 
     stats = MapStats()
-    stats.map_name = map_name
+    stats.map_name = intern_text(map_name)
     stats.games_played = games_played
     stats.win_rate = _parse_percentage(_extract_cell_text(cells[2]))
     stats.wins = _parse_int(_extract_cell_text(cells[3]))
@@ -342,7 +397,7 @@ def _parse_map_row_with_compositions(
         comp_cell = cells[13]
         compositions = _parse_compositions_from_cell(comp_cell)
         if compositions:
-            game_rows = _parse_game_rows(html, map_name)
+            game_rows = _parse_game_rows(toggle_rows().get(map_name, []))
 
     return stats, game_rows, compositions
 
@@ -370,11 +425,45 @@ def _apply_basic_enrichment(
     stats.compositions = _sort_compositions(list(compositions.values()))
 
 
+def _collect_series_ids(
+    pending: list[tuple[MapStats, list[dict], dict[str, AgentComposition]]],
+) -> list[int]:
+    """Return the distinct series IDs referenced by pending game rows, in page order."""
+    seen: dict[int, None] = {}
+    for _, game_rows, compositions in pending:
+        for game in game_rows:
+            series_id = game.get("series_id", 0)
+            if series_id > 0 and game.get("composition_hash", "") in compositions:
+                seen[series_id] = None
+    return list(seen)
+
+
+def _resolve_series_infos(
+    series_ids: list[int],
+    series_info_fn: Callable[[int], SeriesInfo] | None,
+    series_infos_fn: Callable[[list[int]], dict[int, SeriesInfo]] | None,
+) -> dict[int, SeriesInfo]:
+    if not series_ids:
+        return {}
+    if series_infos_fn is not None:
+        return series_infos_fn(series_ids)
+    if series_info_fn is None:
+        return {}
+    infos: dict[int, SeriesInfo] = {}
+    for series_id in series_ids:
+        try:
+            infos[series_id] = series_info_fn(series_id)
+        except VlrdevapiException:
+            logger.warning("Failed to fetch series info for series %d", series_id)
+            raise
+    return infos
+
+
 def _apply_detailed_enrichment(
     stats: MapStats,
     game_rows: list[dict],
     compositions: dict[str, AgentComposition],
-    series_info_fn: Callable[[int], SeriesInfo] | None,
+    series_infos: dict[int, SeriesInfo],
 ) -> None:
     for game in game_rows:
         comp_hash = game.get("composition_hash", "")
@@ -392,15 +481,7 @@ def _apply_detailed_enrichment(
         if comp.matches is None:
             comp.matches = []
 
-        series_id = game.get("series_id", 0)
-        series_info = None
-        if series_info_fn is not None:
-            try:
-                series_info = series_info_fn(series_id)
-            except VlrdevapiException:
-                logger.warning("Failed to fetch series info for series %d", series_id)
-                raise
-
+        series_info = series_infos.get(game.get("series_id", 0))
         match_details = _build_match_details(game, series_info, is_win)
         comp.matches.append(match_details)
 
@@ -442,6 +523,15 @@ def _parse_all_map_rows(
     if not tbody:
         return basic_stats, pending
 
+    # Built on first use: only maps with compositions need their game rows.
+    groups: dict[str, list[Node]] | None = None
+
+    def toggle_rows() -> dict[str, list[Node]]:
+        nonlocal groups
+        if groups is None:
+            groups = _group_toggle_rows(html)
+        return groups
+
     for row in tbody.css("tr"):
         classes = (row.attributes.get("class") or "").split()
         if "mod-toggle" in classes:
@@ -453,7 +543,7 @@ def _parse_all_map_rows(
                 basic_stats.append(map_stats)
             continue
 
-        stats, game_rows, compositions = _parse_map_row_with_compositions(html, row)
+        stats, game_rows, compositions = _parse_map_row_with_compositions(row, toggle_rows)
         if stats is None:
             continue
 
@@ -473,16 +563,24 @@ def parse_team_stats(
     team_id: int,
     agent_composition: AgentCompositionLevel = "none",
     series_info_fn: Callable[[int], SeriesInfo] | None = None,
+    series_infos_fn: Callable[[list[int]], dict[int, SeriesInfo]] | None = None,
 ) -> TeamStats:
     """Parse team stats from HTML.
 
+    For detailed enrichment, the distinct series IDs of every map are
+    collected first, so each series is looked up once even when several of
+    its maps appear on the page.
+
     Args:
         html: Parsed HTML of the team stats page.
         team_id: The team identifier.
         agent_composition: Agent composition detail level.
             ``"none"`` (default), ``"basic"``, or ``"detailed"``.
         series_info_fn: Callable to fetch series info for detailed
-            enrichment. Required when ``agent_composition="detailed"``.
+            enrichment, called once per distinct series.
+        series_infos_fn: Batch alternative to ``series_info_fn``, called
+            once with every distinct series ID and returning a mapping of
+            series ID to info. Takes precedence when both are given.
 
     Returns:
         TeamStats: Parsed team statistics including per-map stats and
@@ -494,8 +592,9 @@ def parse_team_stats(
 
     result.maps.extend(basic_stats)
 
+    series_infos = _resolve_series_infos(_collect_series_ids(pending), series_info_fn, series_infos_fn)
     for stats, game_rows, compositions in pending:
-        _apply_detailed_enrichment(stats, game_rows, compositions, series_info_fn)
+        _apply_detailed_enrichment(stats, game_rows, compositions, series_infos)
         result.maps.append(stats)
 
     return result
@@ -18,6 +18,7 @@ class TransactionAction(str, Enum):
 
 class TransactionPlayer(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Player involved in a transaction."},
     )
 
@@ -29,6 +30,7 @@ class TransactionPlayer(BaseModel):
 
 class TeamTransaction(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "A team transaction entry."},
     )
 
@@ -43,6 +45,7 @@ class TeamTransaction(BaseModel):
 
 class TeamTransactions(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Collection of transactions for a team."},
     )
 
@@ -1,6 +1,6 @@
 """Team transactions namespace."""
 
-from datetime import tzinfo
+from datetime import date, tzinfo
 from zoneinfo import ZoneInfo
 
 import httpx
@@ -33,11 +33,20 @@ class TeamTransactionsNamespace:
         self._sync = SyncNamespace(client, timeout, retry_config, rate_limiter, extra_headers)
 
     @sanitize_and_validate
-    def __call__(self, team_id: int) -> TeamTransactions:
+    def __call__(
+        self,
+        team_id: int,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> TeamTransactions:
         """Get roster transactions (joins/leaves) for a team.
 
         Args:
             team_id: The unique team identifier on vlr.gg.
+            since: Only include transactions on or after this date (inclusive).
+            until: Only include transactions on or before this date (inclusive).
+                Rows outside the window are skipped without being parsed,
+                and parsing stops once the window has been passed.
 
         Returns:
             TeamTransactions: Chronological list of ``transactions`` including ``action`` (Join/Leave/Inactive), ``player`` details, ``date``, and ``position``.
@@ -56,5 +65,5 @@ class TeamTransactionsNamespace:
 
         """
         html = self._sync._fetch(f"/team/transactions/{team_id}/")
-        return parse_team_transactions(html, team_id)
+        return parse_team_transactions(html, team_id, since=since, until=until)
 
@@ -1,3 +1,5 @@
+from datetime import date
+
 from vlrdevapi._team.transactions.models import TeamTransactions
 import httpx
 from vlrdevapi.fetcher import RateLimiter, RetryConfig
@@ -12,5 +14,10 @@ class TeamTransactionsNamespace:
         extra_headers: dict[str, str] | None = None,
     ) -> None: ...
 
-    def __call__(self, team_id: int) -> TeamTransactions:
+    def __call__(
+        self,
+        team_id: int,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> TeamTransactions:
         ...
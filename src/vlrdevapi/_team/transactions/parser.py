@@ -1,4 +1,6 @@
 
+from datetime import date
+
 from selectolax.parser import HTMLParser, Node
 
 from vlrdevapi._team.transactions.models import (
@@ -11,7 +13,12 @@ from vlrdevapi.commons.countries import get_country_name
 from vlrdevapi.commons.datetime import date_to_utc_datetime, parse_vlr_date
 
 
-def parse_team_transactions(html: HTMLParser, team_id: int) -> TeamTransactions:
+def parse_team_transactions(
+    html: HTMLParser,
+    team_id: int,
+    since: date | None = None,
+    until: date | None = None,
+) -> TeamTransactions:
     result = TeamTransactions(team_id=team_id)
 
     table = html.css_first("table.wf-faux-table")
@@ -19,7 +26,22 @@ def parse_team_transactions(html: HTMLParser, team_id: int) -> TeamTransactions:
         return result
 
     rows = table.css("tr.txn-item")
+    windowed = since is not None or until is not None
+    newest_first = windowed and _is_newest_first(rows)
     for row in rows:
+        if windowed:
+            row_date = _row_date(row)
+            if row_date is not None:
+                # Rows are in date order, so leaving the window on the far
+                # side means no later row can fall back inside it.
+                if since is not None and row_date < since:
+                    if newest_first:
+                        break
+                    continue
+                if until is not None and row_date > until:
+                    if not newest_first:
+                        break
+                    continue
         transaction = _parse_transaction_row(row)
         if transaction:
             result.transactions.append(transaction)
@@ -27,6 +49,17 @@ def parse_team_transactions(html: HTMLParser, team_id: int) -> TeamTransactions:
     return result
 
 
+def _row_date(row: Node) -> date | None:
+    td = row.css_first("td")
+    return parse_vlr_date(td.text(strip=True)) if td else None
+
+
+def _is_newest_first(rows: list[Node]) -> bool:
+    first = next((d for d in map(_row_date, rows) if d is not None), None)
+    last = next((d for d in map(_row_date, reversed(rows)) if d is not None), None)
+    return first is not None and last is not None and first > last
+
+
 def _parse_transaction_row(row: Node) -> TeamTransaction | None:
     tds = row.css("td")
     if len(tds) < 6:
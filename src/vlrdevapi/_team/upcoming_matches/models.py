@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class OpponentInUpcomingMatch(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Opponent team in an upcoming match."},
     )
 
@@ -16,6 +17,7 @@ class OpponentInUpcomingMatch(BaseModel):
 
 class TeamUpcomingMatchEntry(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "An upcoming match for a specific team."},
     )
 
@@ -31,6 +33,7 @@ class TeamUpcomingMatchEntry(BaseModel):
 
 class TeamUpcomingMatches(BaseModel):
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={"description": "Collection of upcoming matches for a team."},
     )
 
@@ -85,7 +85,7 @@ class TeamUpcomingMatchesNamespace:
             local_series_info = SeriesInfoNamespace(client, _timeout, _rc, _rl)
             enrich_team_match_sync(
                 match, _tid,
-                series_info_fn=lambda match_id: local_series_info(match_id),  # type: ignore
+                series_info_fn=lambda match_id: local_series_info(match_id, fields={"teams", "event"}),  # type: ignore
                 fetch_fn=lambda p: fetch_sync(client, p, _timeout, retry_config=_rc, rate_limiter=_rl),
                 team_cache=_cache,
                 opponent_cls=OpponentInUpcomingMatch,
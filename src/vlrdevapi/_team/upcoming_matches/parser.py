@@ -3,14 +3,17 @@ from zoneinfo import ZoneInfo
 
 from selectolax.parser import HTMLParser, Node
 
+from vlrdevapi._memo import memoize_parse
 from vlrdevapi._team.upcoming_matches.models import (
     TeamUpcomingMatchEntry,
     TeamUpcomingMatches,
 )
+from vlrdevapi._utils.intern import intern_text
 from vlrdevapi.commons.datetime import parse_vlr_datetime
 from vlrdevapi.fetcher import BASE_URL
 
 
+@memoize_parse()
 def parse_team_upcoming_matches(
     html: HTMLParser,
     team_id: int,
@@ -56,11 +59,11 @@ def _parse_match_item(item: Node, source_tz: ZoneInfo | tzinfo | None = None) ->
     if event_el:
         divs = event_el.css("div")
         if len(divs) >= 2:
-            match.event = divs[1].text(strip=True)
+            match.event = intern_text(divs[1].text(strip=True))
         full_text = event_el.text(separator=" ", strip=True)
         if match.event and match.event in full_text:
             stage_text = full_text.replace(match.event, "").strip()
-            match.stage = stage_text
+            match.stage = intern_text(stage_text)
 
     date_el = item.css_first(".m-item-date")
     if date_el:
@@ -1,9 +1,15 @@
 """Internal utility helpers for paths, pagination, and enrichment."""
 
-from vlrdevapi._utils.pagination import collect_all_pages_sync
+from vlrdevapi._utils.pagination import (
+    collect_all_pages_concurrent,
+    collect_all_pages_sync,
+    iter_pages_sync,
+)
 from vlrdevapi._utils.team_enrichment import enrich_team_match_sync
 
 __all__ = [
+    "collect_all_pages_concurrent",
     "collect_all_pages_sync",
     "enrich_team_match_sync",
+    "iter_pages_sync",
 ]
@@ -0,0 +1,137 @@
+"""Struct-of-arrays tables with optional NumPy and Arrow conversion."""
+
+from collections.abc import Callable, Iterable, Sequence
+from enum import Enum
+from typing import Any
+
+ColumnType = type[int] | type[float] | type[bool] | type[str]
+
+# (column name, column type, value getter applied to each row model)
+ColumnSpec = tuple[str, ColumnType, Callable[[Any], Any]]
+
+
+class Columns(dict[str, list[Any]]):
+    """A table as one list per column, all of the same length.
+
+    Behaves as a plain ``dict`` of column name to values, and also records
+    each column's Python type so it can be converted to a NumPy structured
+    array or an Arrow record batch without inspecting the values.
+    """
+
+    __slots__ = ("types",)
+
+    def __init__(self, types: dict[str, ColumnType]):
+        super().__init__((name, []) for name in types)
+        self.types = types
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows in the table."""
+        return len(next(iter(self.values()), ()))
+
+    def extend(self, other: "Columns") -> None:
+        """Append every row of ``other``, which must have the same columns.
+
+        Raises:
+            ValueError: If the column names differ.
+
+        """
+        if other.keys() != self.keys():
+            msg = f"cannot extend columns {list(self)} with {list(other)}"
+            raise ValueError(msg)
+        for name, values in other.items():
+            self[name].extend(values)
+
+    def to_numpy(self) -> Any:
+        """Return the table as a NumPy structured array.
+
+        Strings become fixed-width unicode fields sized to the longest value.
+
+        Returns:
+            numpy.ndarray: One record per row.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            msg = "to_numpy() requires NumPy: pip install vlrdevapi[numpy]"
+            raise ImportError(msg) from e
+
+        dtype = [(name, _numpy_dtype(kind, self[name])) for name, kind in self.types.items()]
+        array = np.empty(self.num_rows, dtype=dtype)
+        for name, values in self.items():
+            array[name] = values
+        return array
+
+    def to_arrow(self) -> Any:
+        """Return the table as an Arrow record batch.
+
+        Returns:
+            pyarrow.RecordBatch: The table with a schema from the column types.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            msg = "to_arrow() requires pyarrow: pip install vlrdevapi[arrow]"
+            raise ImportError(msg) from e
+
+        arrow_types = {int: pa.int64(), float: pa.float64(), bool: pa.bool_(), str: pa.string()}
+        schema = pa.schema([(name, arrow_types[kind]) for name, kind in self.types.items()])
+        return pa.RecordBatch.from_pydict(dict(self), schema=schema)
+
+
+def collect_columns(
+    parents: Iterable[Any],
+    rows: Callable[[Any], Sequence[Any]],
+    parent_columns: Sequence[ColumnSpec],
+    row_columns: Sequence[ColumnSpec],
+) -> Columns:
+    """Build one table from the rows of many parent models.
+
+    Each column is filled a whole parent at a time, with no per-row
+    intermediate objects.
+
+    Args:
+        parents: Models that each hold a sequence of rows, e.g. games.
+        rows: Returns a parent's rows.
+        parent_columns: Columns read once from the parent and repeated for
+            each of its rows.
+        row_columns: Columns read from every row.
+
+    Returns:
+        Columns: The concatenated table, parent columns first.
+
+    """
+    table = Columns({name: kind for name, kind, _ in (*parent_columns, *row_columns)})
+    for parent in parents:
+        items = rows(parent)
+        n = len(items)
+        if not n:
+            continue
+        for name, _, get in parent_columns:
+            table[name] += [get(parent)] * n
+        for name, _, get in row_columns:
+            table[name] += map(get, items)
+    return table
+
+
+def enum_value(get: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a getter so enum members are returned as their values."""
+    def getter(row: Any) -> Any:
+        value = get(row)
+        return value.value if isinstance(value, Enum) else value
+
+    return getter
+
+
+def _numpy_dtype(kind: ColumnType, values: list[Any]) -> str:
+    if kind is str:
+        return f"U{max(map(len, values), default=1) or 1}"
+    return {int: "i8", float: "f8", bool: "?"}[kind]
@@ -0,0 +1,35 @@
+"""Shared storage for strings that repeat across many parsed results."""
+
+# Agent, map, team tag, stage and event names come from a small vocabulary
+# but are sliced out of each page afresh, so without a shared copy every
+# result holds its own. A plain dict is used rather than ``sys.intern``,
+# whose strings are never freed on recent CPython, so the table can be
+# bounded and cleared.
+_TABLE: dict[str, str] = {}
+
+# Beyond this many distinct values new ones are returned as they are. The
+# vocabularies interned here stay far below it even over a full crawl.
+MAX_INTERNED = 1 << 16
+
+
+def intern_text(value: str) -> str:
+    """Return the shared copy of ``value``, adding it if not yet seen.
+
+    Args:
+        value: A parsed low-cardinality string, e.g. an agent or map name.
+
+    Returns:
+        str: An equal string, the same object for every equal input.
+
+    """
+    shared = _TABLE.get(value)
+    if shared is not None:
+        return shared
+    if len(_TABLE) < MAX_INTERNED:
+        _TABLE[value] = value
+    return value
+
+
+def clear_interned() -> None:
+    """Drop every shared string, e.g. between unrelated crawls."""
+    _TABLE.clear()
@@ -1,4 +1,5 @@
-from collections.abc import Callable
+import concurrent.futures
+from collections.abc import Callable, Iterator
 from typing import Protocol, TypeVar
 
 from selectolax.parser import HTMLParser
@@ -34,4 +35,108 @@ def collect_all_pages_sync(
     return page_data
 
 
+def collect_all_pages_concurrent(
+    fetch_fn: Callable[[str], HTMLParser],
+    fetch_page_fn: Callable[[str], HTMLParser],
+    build_url: Callable[[int], str],
+    parse_fn: Callable[..., PageT],
+    last_page_fn: Callable[[HTMLParser], int],
+    max_page: int,
+    parse_extra: tuple = (),
+    max_workers: int = 5,
+) -> PageT:
+    """Collect every page, fetching pages after the first concurrently.
+
+    Page 1 is fetched with ``fetch_fn`` to discover the last page number.
+    The remaining pages are fetched with ``fetch_page_fn`` on a bounded
+    thread pool and parsed in page order on the calling thread, so
+    ``parse_fn`` never runs concurrently. If a later page advertises a
+    higher last page (windowed pagination), the walk continues from there.
+
+    Args:
+        fetch_fn: Fetches page 1 on the caller's client.
+        fetch_page_fn: Thread-safe fetch used by pool workers.
+        build_url: Builds the URL path for a 1-indexed page number.
+        parse_fn: Parses a page; called as ``parse_fn(html, *parse_extra)``.
+        last_page_fn: Returns the highest page number linked from a page.
+        max_page: Maximum number of pages to collect. ``0`` means no limit.
+        parse_extra: Extra positional arguments passed to ``parse_fn``.
+        max_workers: Maximum number of concurrent page fetches.
+
+    Returns:
+        PageT: The last parsed page with ``matches`` replaced by the
+            entries of every page in order and ``has_next_page`` cleared.
+
+    """
+    html = fetch_fn(build_url(1))
+    page_data = parse_fn(html, *parse_extra)
+    all_items = list(page_data.matches)
+    fetched = 1
+    last_page = last_page_fn(html)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            if max_page > 0:
+                last_page = min(last_page, max_page)
+            if last_page <= fetched:
+                break
+            urls = [build_url(p) for p in range(fetched + 1, last_page + 1)]
+            discovered = last_page
+            for html in pool.map(fetch_page_fn, urls):
+                page_data = parse_fn(html, *parse_extra)
+                all_items.extend(page_data.matches)
+                discovered = max(discovered, last_page_fn(html))
+            fetched = last_page
+            last_page = discovered
+
+    page_data.matches = all_items
+    page_data.has_next_page = False
+    return page_data
+
+
+def iter_pages_sync(
+    fetch_fn: Callable[[str], HTMLParser],
+    fetch_page_fn: Callable[[str], HTMLParser],
+    build_url: Callable[[int], str],
+    parse_fn: Callable[..., PageT],
+    has_next_fn: Callable[[HTMLParser, int], bool],
+    start_page: int = 1,
+    max_page: int = 0,
+    parse_extra: tuple = (),
+) -> Iterator[PageT]:
+    """Yield parsed pages one at a time, prefetching the next page in the background.
+
+    As soon as a page is fetched, ``has_next_fn`` is checked against its raw
+    HTML and the following page is requested on a worker thread, so the
+    download overlaps with parsing and with the consumer's own work. Only
+    one page is buffered ahead, keeping memory flat on long walks.
+
+    Args:
+        fetch_fn: Fetches ``start_page`` on the caller's client.
+        fetch_page_fn: Thread-safe fetch used for background prefetches.
+        build_url: Builds the URL path for a 1-indexed page number.
+        parse_fn: Parses a page; called as ``parse_fn(html, *parse_extra)``.
+        has_next_fn: Returns whether a page after ``page`` exists, given
+            that page's HTML and number.
+        start_page: First page number to yield. Defaults to ``1``.
+        max_page: Last page number to fetch. ``0`` means no limit.
+        parse_extra: Extra positional arguments passed to ``parse_fn``.
+
+    Yields:
+        PageT: Each parsed page, in page order.
 
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        page = start_page
+        html = fetch_fn(build_url(page))
+        while True:
+            has_next = has_next_fn(html, page) and not (max_page > 0 and page >= max_page)
+            pending = pool.submit(fetch_page_fn, build_url(page + 1)) if has_next else None
+            yield parse_fn(html, *parse_extra)
+            if pending is None:
+                return
+            page += 1
+            html = pending.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
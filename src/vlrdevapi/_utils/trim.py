@@ -0,0 +1,96 @@
+"""Per-route trimming of raw page bodies before they are parsed."""
+
+import re
+from dataclasses import dataclass
+
+# <script>, <style> and <noscript> elements and HTML comments. No parser
+# reads any of them, and scripts and styles are a large share of every page.
+# Only openers are matched by regex; the matching close is found with a
+# forward search, which is much cheaper than a lazy ``.*?`` over the body.
+_STRIP_OPEN_RE = re.compile(rb"<!--|<(script|style|noscript)\b", re.IGNORECASE)
+_STRIP_CLOSE_RES = {
+    tag: re.compile(rb"</" + tag + rb"\s*>", re.IGNORECASE) for tag in (b"script", b"style", b"noscript")
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Trim:
+    """How a route's page body is cut down before parsing.
+
+    Attributes:
+        start: Optional pattern marking where the content the route's parsers
+            read begins. Everything before its first match (doctype, head,
+            navigation) is dropped. Pages without a match are kept whole.
+        strip: Whether to drop ``<script>``, ``<style>``, ``<noscript>``
+            elements and comments.
+
+    """
+
+    start: re.Pattern[bytes] | None = None
+    strip: bool = True
+
+
+STRIP_ONLY = Trim()
+
+# Series pages: every series parser reads the match header or what follows it.
+SERIES = Trim(start=re.compile(rb'<div\s+class="(?:[^"]*\s)?match-header[\s"]'))
+
+# (path pattern, trim). The first matching route wins; unmatched paths only
+# get ``STRIP_ONLY``.
+ROUTE_TRIMS: tuple[tuple[re.Pattern[str], Trim], ...] = (
+    (re.compile(r"^/\d+(?:/|$)"), SERIES),
+)
+
+
+def trim_for(path: str) -> Trim:
+    """Return the trim declared for a URL path.
+
+    Args:
+        path: The URL path of the page, e.g. ``"/12345/"``.
+
+    Returns:
+        Trim: The matching route's trim, or ``STRIP_ONLY``.
+
+    """
+    for pattern, trim in ROUTE_TRIMS:
+        if pattern.match(path):
+            return trim
+    return STRIP_ONLY
+
+
+def trim_html(content: bytes, trim: Trim) -> bytes:
+    """Apply ``trim`` to a raw page body.
+
+    Args:
+        content: The response body. Must use an ASCII-compatible encoding.
+        trim: The trim to apply.
+
+    Returns:
+        bytes: The trimmed body.
+
+    """
+    # Strip first, so ``start`` cannot match inside a script or comment.
+    if trim.strip:
+        content = _strip(content)
+    if trim.start is not None:
+        m = trim.start.search(content)
+        if m:
+            content = content[m.start():]
+    return content
+
+
+def _strip(content: bytes) -> bytes:
+    parts: list[bytes] = []
+    pos = 0
+    while m := _STRIP_OPEN_RE.search(content, pos):
+        parts.append(content[pos:m.start()])
+        if m.group(1) is None:
+            end = content.find(b"-->", m.end())
+            pos = len(content) if end < 0 else end + 3
+        else:
+            close = _STRIP_CLOSE_RES[m.group(1).lower()].search(content, m.end())
+            pos = len(content) if close is None else close.end()
+    if not parts:
+        return content
+    parts.append(content[pos:])
+    return b"".join(parts)
@@ -1,3 +1,4 @@
+from vlrdevapi.commons.checkpoint import Checkpoint, CheckpointStore, JSONFileCheckpointStore, MemoryCheckpointStore
 from vlrdevapi.commons.countries import COUNTRIES, get_country_name
 from vlrdevapi.commons.datetime import UTC, VLR_TIMEZONE, parse_vlr_date, parse_vlr_datetime, parse_vlr_time
 from vlrdevapi.commons.prizes import parse_prize_amount
@@ -15,6 +16,10 @@ __all__ = [
     "UTC",
     "VLR_STORED_TZ",
     "VLR_TIMEZONE",
+    "Checkpoint",
+    "CheckpointStore",
+    "JSONFileCheckpointStore",
+    "MemoryCheckpointStore",
     "detect_vlr_timezone",
     "detect_vlr_timezone_from_url",
     "get_country_name",
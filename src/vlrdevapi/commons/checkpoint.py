@@ -0,0 +1,94 @@
+"""Checkpoint stores for incremental syncs such as ``matches.completed.since``."""
+
+import json
+import os
+import threading
+from datetime import datetime as datetime_
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from vlrdevapi import _fork
+
+
+class Checkpoint(BaseModel):
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"description": "The newest item seen by an incremental sync."},
+    )
+
+    match_id: int = Field(default=0, description="Match identifier of the newest seen entry")
+    datetime: datetime_ | None = Field(
+        default=None, description="Datetime of the newest seen entry in UTC",
+    )
+
+
+@runtime_checkable
+class CheckpointStore(Protocol):
+    """Anything that can load and save a ``Checkpoint`` under a string key."""
+
+    def load(self, key: str) -> Checkpoint | None: ...
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None: ...
+
+
+class MemoryCheckpointStore:
+    """Thread-safe in-process checkpoint store."""
+
+    __slots__ = ("__weakref__", "_checkpoints", "_lock")
+
+    def __init__(self) -> None:
+        self._checkpoints: dict[str, Checkpoint] = {}
+        self._lock = threading.Lock()
+        _fork.track(self)
+
+    def _reset_after_fork(self) -> None:
+        # Checkpoints are kept; only a lock held at the fork is replaced.
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            return self._checkpoints.get(key)
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            self._checkpoints[key] = checkpoint
+
+
+class JSONFileCheckpointStore:
+    """Checkpoint store backed by a JSON file, so watermarks survive restarts.
+
+    Writes go to a temporary file that is then renamed over the original,
+    so a crash mid-write never leaves a truncated file behind.
+    """
+
+    __slots__ = ("__weakref__", "_lock", "_path")
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        _fork.track(self)
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            data = self._read()
+        raw = data.get(key)
+        return Checkpoint.model_validate(raw) if raw is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = checkpoint.model_dump(mode="json")
+            tmp = self._path.with_name(self._path.name + ".tmp")
+            tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self._path)
+
+    def _read(self) -> dict:
+        try:
+            return json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
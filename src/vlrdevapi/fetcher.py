@@ -1,12 +1,14 @@
 """HTTP fetching layer with retry logic and rate limiting."""
 
+import hashlib
 import logging
 import random
 import threading
 import time
+import weakref
 from dataclasses import dataclass
 from enum import Enum
-from typing import Never
+from typing import Literal, Never
 
 __all__ = [
     "BASE_URL",
@@ -14,15 +16,32 @@ __all__ = [
     "DEFAULT_RATE_LIMIT",
     "DEFAULT_RETRY_CONFIG",
     "DEFAULT_TIMEOUT",
+    "HTML_BACKENDS",
+    "MODEL_BACKENDS",
     "BackoffStrategy",
+    "FetchedHTML",
+    "FetchedLexborHTML",
+    "HTMLBackend",
+    "ModelBackend",
     "RateLimiter",
     "RetryConfig",
     "fetch_sync",
+    "get_html_backend",
+    "get_html_trimming",
+    "get_model_backend",
+    "set_html_backend",
+    "set_html_trimming",
+    "set_model_backend",
 ]
 
 import httpx
+from selectolax.lexbor import LexborHTMLParser
 from selectolax.parser import HTMLParser
 
+from vlrdevapi import _fork
+from vlrdevapi._cache import LRUCache
+from vlrdevapi._compact import MODEL_BACKENDS, ModelBackend
+from vlrdevapi._utils.trim import Trim, trim_for, trim_html
 from vlrdevapi.exceptions import HTTPError, NotFoundError, RateLimitError, RequestError
 
 BASE_URL = "https://www.vlr.gg"
@@ -93,12 +112,18 @@ class RateLimiter:
 
     """
 
-    __slots__ = ("_last_request_time", "_lock", "_min_interval")
+    __slots__ = ("__weakref__", "_last_request_time", "_lock", "_min_interval")
 
     def __init__(self, requests_per_second: float = 0) -> None:
         self._min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
         self._last_request_time = 0.0
         self._lock = threading.Lock()
+        _fork.track(self)
+
+    def _reset_after_fork(self) -> None:
+        # A forked child paces its own requests from a fresh lock.
+        self._lock = threading.Lock()
+        self._last_request_time = 0.0
 
     @property
     def enabled(self) -> bool:
@@ -142,8 +167,160 @@ def _calc_delay(attempt: int, config: RetryConfig) -> float:
     return delay * random.uniform(0.75, 1.25)
 
 
-def _parse_response(response: httpx.Response) -> HTMLParser:
-    return HTMLParser(response.text)
+HTMLBackend = Literal["modest", "lexbor"]
+HTML_BACKENDS: tuple[HTMLBackend, ...] = ("modest", "lexbor")
+
+
+class FetchedHTML(HTMLParser):
+    """An ``HTMLParser`` that remembers a digest of the response body it was built from.
+
+    ``content_hash`` lets parsers memoize their output per page content
+    (see ``vlrdevapi._memo``).
+    """
+
+    content_hash: bytes
+
+
+class FetchedLexborHTML(LexborHTMLParser):
+    """The ``lexbor`` counterpart of ``FetchedHTML``."""
+
+    content_hash: bytes
+
+
+@dataclass
+class _ParseOptions:
+    backend: HTMLBackend = "modest"
+    trimming: bool = False
+    models: ModelBackend = "pydantic"
+
+
+# Per-client parse options. Clients that were never registered use the defaults.
+_CLIENT_OPTIONS: "weakref.WeakKeyDictionary[httpx.Client, _ParseOptions]" = weakref.WeakKeyDictionary()
+_CLIENT_OPTIONS_LOCK = threading.Lock()
+
+
+def _reset_client_options_lock() -> None:
+    global _CLIENT_OPTIONS_LOCK
+    _CLIENT_OPTIONS_LOCK = threading.Lock()
+
+
+_fork.in_child(_reset_client_options_lock)
+
+
+def _options(client: httpx.Client) -> _ParseOptions:
+    with _CLIENT_OPTIONS_LOCK:
+        return _CLIENT_OPTIONS.get(client) or _ParseOptions()
+
+
+def set_html_backend(client: httpx.Client, backend: HTMLBackend) -> None:
+    """Choose the selectolax backend used to parse responses fetched with ``client``.
+
+    Args:
+        client: The ``httpx.Client`` whose responses should use ``backend``.
+        backend: ``"modest"`` (``selectolax.parser.HTMLParser``) or
+            ``"lexbor"`` (``selectolax.lexbor.LexborHTMLParser``).
+
+    Raises:
+        ValueError: If ``backend`` is not a known backend.
+
+    """
+    if backend not in HTML_BACKENDS:
+        msg = f"invalid html_backend {backend!r}, valid options: {list(HTML_BACKENDS)}"
+        raise ValueError(msg)
+    with _CLIENT_OPTIONS_LOCK:
+        _CLIENT_OPTIONS.setdefault(client, _ParseOptions()).backend = backend
+
+
+def get_html_backend(client: httpx.Client) -> HTMLBackend:
+    """Return the selectolax backend registered for ``client``."""
+    return _options(client).backend
+
+
+def set_html_trimming(client: httpx.Client, enabled: bool) -> None:
+    """Turn per-route trimming of response bodies fetched with ``client`` on or off.
+
+    When enabled (off by default), scripts, styles and comments are removed
+    from UTF-8 bodies before parsing, and routes with a declared trim (see
+    ``vlrdevapi._utils.trim``) are cut down to the part their parsers read.
+
+    Args:
+        client: The ``httpx.Client`` whose responses should be trimmed.
+        enabled: Whether to trim.
+
+    """
+    with _CLIENT_OPTIONS_LOCK:
+        _CLIENT_OPTIONS.setdefault(client, _ParseOptions()).trimming = enabled
+
+
+def get_html_trimming(client: httpx.Client) -> bool:
+    """Return whether responses fetched with ``client`` are trimmed before parsing."""
+    return _options(client).trimming
+
+
+def set_model_backend(client: httpx.Client, backend: ModelBackend) -> None:
+    """Choose how namespaces using ``client`` return their results.
+
+    Args:
+        client: The ``httpx.Client`` the namespaces were created with.
+        backend: ``"pydantic"`` for the pydantic models, or ``"slots"`` for
+            ``__slots__`` dataclasses with the same names and fields, which
+            take a fraction of the memory (see ``vlrdevapi._compact``).
+
+    """
+    with _CLIENT_OPTIONS_LOCK:
+        _CLIENT_OPTIONS.setdefault(client, _ParseOptions()).models = backend
+
+
+def get_model_backend(client: httpx.Client) -> ModelBackend:
+    """Return how namespaces using ``client`` return their results."""
+    return _options(client).models
+
+
+# Recently fetched documents keyed by backend, trim and body digest.
+# Byte-identical responses, the common case when polling, reuse the already
+# built document instead of parsing the HTML again. Parsers only read from
+# documents, so sharing is safe.
+_DOCUMENTS: LRUCache[tuple, HTMLParser] = LRUCache[tuple, HTMLParser](maxsize=16)
+
+_UTF8_NAMES = frozenset({"utf-8", "utf8"})
+
+
+def _parse_response(
+    response: httpx.Response, backend: HTMLBackend = "modest", trimming: bool = False,
+) -> HTMLParser:
+    content = response.content
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    trim = trim_for(response.url.path) if trimming else None
+    key = (backend, trim, digest)
+    html = _DOCUMENTS.get(key)
+    if html is None:
+        html = _build_document(response, content, backend, trim)
+        # The digest of the untrimmed body: a trim never changes what the
+        # route's parsers return, so memoized results stay valid either way.
+        html.content_hash = digest
+        _DOCUMENTS.put(key, html)
+    return html
+
+
+def _build_document(
+    response: httpx.Response, content: bytes, backend: HTMLBackend = "modest", trim: Trim | None = None,
+) -> FetchedHTML | FetchedLexborHTML:
+    """Parse the raw body, skipping the ``str`` decode for UTF-8 responses.
+
+    Handing selectolax the bytes with a known encoding avoids decoding the
+    body into a Python string (and charset sniffing) only for selectolax to
+    encode it back to UTF-8. UTF-8 bodies are also trimmed with ``trim``
+    first. Other declared charsets go through ``response.text`` untrimmed.
+    """
+    charset = response.charset_encoding
+    utf8 = charset is None or charset.lower().replace("_", "-") in _UTF8_NAMES
+    if utf8 and trim is not None:
+        content = trim_html(content, trim)
+    if backend == "lexbor":
+        return FetchedLexborHTML(content if utf8 else response.text)
+    if utf8:
+        return FetchedHTML(content, detect_encoding=False)
+    return FetchedHTML(response.text)
 
 
 def _raise_mapped_exception(exc: Exception) -> Never:
@@ -194,7 +371,9 @@ def fetch_sync(
         headers: Optional additional HTTP headers for the request.
 
     Returns:
-        HTMLParser: Parsed HTML of the response.
+        HTMLParser: Parsed HTML of the response, built with the backend
+            registered for ``client`` through ``set_html_backend`` and
+            trimmed when enabled through ``set_html_trimming``.
 
     Raises:
         NotFoundError: If the response status code is 404.
@@ -210,7 +389,8 @@ def fetch_sync(
                 rate_limiter.acquire()
             resp = client.get(url, timeout=timeout, headers=headers)
             resp.raise_for_status()
-            return _parse_response(resp)
+            options = _options(client)
+            return _parse_response(resp, options.backend, options.trimming)
         except Exception as exc:  # noqa: BLE001
             if not _is_retryable(exc):
                 _raise_mapped_exception(exc)
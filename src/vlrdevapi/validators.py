@@ -1,19 +1,67 @@
 """Input validation decorator for namespace methods."""
 
-__all__ = ["sanitize_and_validate"]
+__all__ = ["forwarded", "sanitize_and_validate"]
 
 import inspect
-from collections.abc import Callable
+import types
+from collections.abc import Callable, Iterator
+from datetime import date, datetime
 from functools import wraps
-from typing import Any
+from typing import Any, Literal, Union, get_args, get_origin
 
 from pydantic import validate_call
 
+from vlrdevapi._compact import converting, to_slots
 from vlrdevapi.exceptions import ValidationError
+from vlrdevapi.fetcher import get_model_backend
 
 _ID_PARAMS = frozenset({"event_id", "team_id", "player_id", "series_id", "page", "limit", "subseries_id", "last_days"})
 _MAX_PAGE_PARAMS = frozenset({"max_page"})
 
+# Annotations whose exact-type values pydantic returns unchanged.
+_PLAIN_TYPES = frozenset({int, str, bool, float, date, datetime, type(None)})
+
+
+def _check_id(name: str, value: Any) -> None:
+    # Skip None — these params are optional in some namespaces (e.g. event_id on team stats)
+    if value is not None and (not isinstance(value, int) or value <= 0):
+        msg = f"{name} must be a positive integer, got {value}"
+        raise ValidationError(msg)
+
+
+def _check_max_page(name: str, value: Any) -> None:
+    # max_page allows 0 (meaning unlimited), but not negative
+    if value is not None and (not isinstance(value, int) or value < 0):
+        msg = f"{name} must be a non-negative integer, got {value}"
+        raise ValidationError(msg)
+
+
+def _check_game_id(name: str, value: Any) -> None:
+    # game_id may be int or "all"
+    if value == "all":
+        return
+    if value is None:
+        msg = "game_id cannot be None"
+        raise ValidationError(msg)
+    try:
+        val = int(value)
+    except (ValueError, TypeError):
+        msg = f"game_id must be a positive integer or 'all', got {value}"
+        raise ValidationError(msg) from None
+    if val <= 0:
+        msg = f"game_id must be a positive integer or 'all', got {value}"
+        raise ValidationError(msg)
+
+
+def _check_for(name: str) -> Callable[[str, Any], None] | None:
+    if name in _ID_PARAMS:
+        return _check_id
+    if name in _MAX_PAGE_PARAMS:
+        return _check_max_page
+    if name == "game_id":
+        return _check_game_id
+    return None
+
 
 def _validate_bound_args(sig: inspect.Signature, args: tuple, kwargs: dict) -> inspect.BoundArguments:
     """Validate and sanitize bound arguments.
@@ -35,36 +83,9 @@ def _validate_bound_args(sig: inspect.Signature, args: tuple, kwargs: dict) -> i
     bound.apply_defaults()
 
     for name, value in bound.arguments.items():
-        # Positive-integer validation for known ID / pagination params
-        # Skip None — these params are optional in some namespaces (e.g. event_id on team stats)
-        if name in _ID_PARAMS and value is not None:
-            if not isinstance(value, int) or value <= 0:
-                msg = f"{name} must be a positive integer, got {value}"
-                raise ValidationError(msg)
-
-        # max_page allows 0 (meaning unlimited), but not negative
-        if name in _MAX_PAGE_PARAMS and value is not None:
-            if not isinstance(value, int) or value < 0:
-                msg = f"{name} must be a non-negative integer, got {value}"
-                raise ValidationError(msg)
-
-        # game_id may be int or "all"
-        if name == "game_id" and value != "all":
-            if value is None:
-                msg = "game_id cannot be None"
-                raise ValidationError(msg)
-            try:
-                val = int(value)
-            except (ValueError, TypeError):
-                msg = f"game_id must be a positive integer or 'all', got {value}"
-                raise ValidationError(
-                    msg,
-                ) from None
-            if val <= 0:
-                msg = f"game_id must be a positive integer or 'all', got {value}"
-                raise ValidationError(
-                    msg,
-                )
+        check = _check_for(name)
+        if check is not None:
+            check(name, value)
 
         # Sanitize strings by stripping whitespace
         if isinstance(value, str):
@@ -73,9 +94,120 @@ def _validate_bound_args(sig: inspect.Signature, args: tuple, kwargs: dict) -> i
     return bound
 
 
+def _accepted_as_is(annotation: Any) -> tuple[frozenset[type], frozenset[str]] | None:
+    """Return the exact types and literal strings pydantic passes through unchanged.
+
+    ``None`` means any value is accepted (no annotation).
+    """
+    if annotation is inspect.Parameter.empty:
+        return None
+    if annotation is None:
+        return frozenset({type(None)}), frozenset()
+    if annotation in _PLAIN_TYPES:
+        return frozenset({annotation}), frozenset()
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return frozenset(), frozenset(v for v in get_args(annotation) if type(v) is str)
+    if origin is Union or origin is types.UnionType:
+        kinds: set[type] = set()
+        literals: set[str] = set()
+        for member in get_args(annotation):
+            accepted = _accepted_as_is(member)
+            if accepted is not None:
+                kinds |= accepted[0]
+                literals |= accepted[1]
+        return frozenset(kinds), frozenset(literals)
+    return frozenset(), frozenset()
+
+
+class _Binder:
+    """Binds and checks the arguments of one decorated function.
+
+    Built once at decoration time so calls skip ``Signature.bind`` and
+    ``apply_defaults``. Only the arguments actually passed are checked;
+    defaults are left for the function to fill in. Each call also reports
+    whether every argument already has a type pydantic would return
+    unchanged, in which case ``validate_call`` can be skipped.
+    """
+
+    __slots__ = ("accepted", "checks", "names", "positional", "required", "sig", "simple")
+
+    def __init__(self, sig: inspect.Signature):
+        params = list(sig.parameters.values())
+        self.sig = sig
+        self.simple = all(
+            p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY) for p in params
+        )
+        self.names = frozenset(p.name for p in params)
+        self.positional = tuple(p.name for p in params if p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        self.required = tuple(p.name for p in params if p.default is inspect.Parameter.empty)
+        self.checks = {p.name: check for p in params if (check := _check_for(p.name)) is not None}
+        self.accepted = {p.name: _accepted_as_is(p.annotation) for p in params}
+
+    def __call__(self, args: tuple, kwargs: dict) -> tuple[tuple, dict[str, Any], bool]:
+        """Return ``(args, kwargs, trusted)`` to call the function with.
+
+        Raises:
+            TypeError: If the arguments do not match the signature.
+            ValidationError: If any argument fails validation checks.
+
+        """
+        if not self.simple:
+            bound = _validate_bound_args(self.sig, args, kwargs)
+            return bound.args, bound.kwargs, False
+
+        if len(args) > len(self.positional):
+            msg = "too many positional arguments"
+            raise TypeError(msg)
+        values = dict(zip(self.positional, args, strict=False))
+        for name, value in kwargs.items():
+            if name in values:
+                msg = f"multiple values for argument '{name}'"
+                raise TypeError(msg)
+            if name not in self.names:
+                msg = f"got an unexpected keyword argument '{name}'"
+                raise TypeError(msg)
+            values[name] = value
+        for name in self.required:
+            if name not in values:
+                msg = f"missing a required argument: '{name}'"
+                raise TypeError(msg)
+
+        trusted = True
+        checks, accepted = self.checks, self.accepted
+        for name, value in values.items():
+            check = checks.get(name)
+            if check is not None:
+                check(name, value)
+            if isinstance(value, str):
+                value = values[name] = value.strip()
+            if trusted:
+                allowed = accepted[name]
+                if allowed is not None and type(value) not in allowed[0] and not (type(value) is str and value in allowed[1]):
+                    trusted = False
+        return (), values, trusted
+
+
+def _returns_slots(args: tuple) -> bool:
+    """Return whether this call should convert its result to slots dataclasses.
+
+    Only the outermost call on a namespace with its own client converts;
+    namespace calls made while it runs keep returning pydantic models.
+    Curried namespaces have no client and leave it to the call they wrap.
+    """
+    if not args or converting.get():
+        return False
+    sync = getattr(args[0], "_sync", None)
+    return sync is not None and get_model_backend(sync._client) == "slots"
+
+
 def sanitize_and_validate(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorate a function to validate its arguments via Pydantic type hints and positive-ID checks.
 
+    Arguments that already have the annotated type are passed straight
+    through; pydantic's ``validate_call`` only runs when one needs coercing
+    or rejecting, and is built on the first such call rather than at import.
+
     Args:
         func: The function to wrap with validation.
 
@@ -83,13 +215,50 @@ def sanitize_and_validate(func: Callable[..., Any]) -> Callable[..., Any]:
         Callable[..., Any]: The wrapped function with input validation applied.
 
     """
-    pydantic_validated = validate_call(validate_return=False)(func)
+    validated: Callable[..., Any] | None = None
     sig = inspect.signature(func)
+    try:
+        # String annotations resolved, so they can be trusted like any other.
+        bind = _Binder(inspect.signature(func, eval_str=True))
+    except (NameError, SyntaxError):
+        bind = _Binder(sig)
 
     @wraps(func)
     def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-        bound = _validate_bound_args(sig, args, kwargs)
-        return pydantic_validated(*bound.args, **bound.kwargs)
+        nonlocal validated
+        call_args, call_kwargs, trusted = bind(args, kwargs)
+        if trusted:
+            call = func
+        else:
+            if validated is None:
+                validated = validate_call(validate_return=False)(func)
+            call = validated
+        if not _returns_slots(args):
+            return call(*call_args, **call_kwargs)
+        token = converting.set(True)
+        try:
+            result = call(*call_args, **call_kwargs)
+        finally:
+            converting.reset(token)
+        if isinstance(result, Iterator):
+            return map(to_slots, result)
+        return to_slots(result)
 
     sync_wrapper.__signature__ = sig  # type: ignore
     return sync_wrapper
+
+
+def forwarded(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark a curried method that only forwards to a validated namespace call.
+
+    The namespace method it calls validates the arguments, so the method
+    is returned unchanged rather than validating them a second time.
+
+    Args:
+        func: The forwarding method.
+
+    Returns:
+        Callable[..., Any]: ``func`` itself.
+
+    """
+    return func
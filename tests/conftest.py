@@ -5,6 +5,7 @@ import respx
 
 import vlrdevapi
 from vlrdevapi import VLRClient
+from vlrdevapi._memo import clear_parse_memo
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "test_html"
 
@@ -58,3 +59,10 @@ def mock_vlr():
 def _reset_module_client():
     yield
     vlrdevapi._default_client = None
+    vlrdevapi._default_options.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_parse_memo():
+    yield
+    clear_parse_memo()
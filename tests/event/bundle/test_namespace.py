@@ -0,0 +1,48 @@
+from selectolax.parser import HTMLParser
+
+from tests.conftest import load_fixture
+from tests.conftest import mock_vlr  # noqa: F401
+import vlrdevapi
+from vlrdevapi._event.standings.parser import parse_subnav
+
+_EVENT_DIR = "2863_vct-2026-emea-stage-1"
+
+
+def _mock_event(mock_vlr):
+    overview = load_fixture("event", _EVENT_DIR, "overview.html")
+    main = mock_vlr.get("/event/2863").respond(200, text=overview)
+    matches = mock_vlr.get("/event/matches/2863").respond(200, text=load_fixture("event", _EVENT_DIR, "matches_all.html"))
+    stage_pages = mock_vlr.get(path__regex=r"^/event/2863/.+").respond(200, text=overview)
+    return main, matches, stage_pages, len(parse_subnav(HTMLParser(overview)))
+
+
+class TestSyncModuleLevel:
+    def test_bundle_fetches_each_page_once(self, mock_vlr):
+        main, matches, stage_pages, stage_count = _mock_event(mock_vlr)
+
+        result = vlrdevapi.event.bundle(2863)
+        assert main.call_count == 1
+        assert matches.call_count == 1
+        assert stage_pages.call_count == stage_count
+        assert result.event_id == 2863
+        assert result.info.name == "VCT 2026: EMEA Stage 1"
+        assert len(result.stages) > 0
+
+    def test_bundle_matches_individual_calls(self, mock_vlr):
+        _mock_event(mock_vlr)
+
+        result = vlrdevapi.event.bundle(2863)
+        assert result.info == vlrdevapi.event.info(2863)
+        assert result.stages == vlrdevapi.event.stages(2863)
+        assert result.standings == vlrdevapi.event.standings(2863)
+        assert result.teams == vlrdevapi.event.teams(2863)
+
+
+class TestSyncWithClient:
+    def test_curried_bundle(self, mock_vlr):
+        _mock_event(mock_vlr)
+
+        with vlrdevapi.VLRClient() as client:
+            result = client.event(2863).bundle()
+        assert result.info.id == 2863
+        assert result.standings == client.event(2863).standings()
@@ -1,3 +1,4 @@
+import re
 from unittest.mock import patch
 
 import pytest
@@ -40,6 +41,18 @@ def _make_page(page: int, total: int, events_per_page: int = 2, status: str = "u
     """)
 
 
+def _serve_pages(pages: list[HTMLParser]):
+    """Return a ``fetch_sync`` side effect that serves pages by their ``page=`` param.
+
+    Pages after the first are fetched concurrently, so the mock must key on
+    the requested path rather than on call order.
+    """
+    def _fetch(client, path: str, timeout, retry_config=None, rate_limiter=None) -> HTMLParser:
+        match = re.search(r"page=(\d+)", path)
+        return pages[int(match.group(1)) - 1 if match else 0]
+    return _fetch
+
+
 class TestSyncModuleLevel:
     def test_event_list_default(self):
         with patch("vlrdevapi._base.fetch_sync", return_value=_EVENTS_FIXTURE):
@@ -197,7 +210,7 @@ class TestEventListReturnAll:
     def test_return_all_combines_pages(self):
         """Test return_all=True combines events from all pages."""
         pages = [_make_page(1, 3), _make_page(2, 3), _make_page(3, 3)]
-        with patch("vlrdevapi._base.fetch_sync", side_effect=pages):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)):
             result = vlrdevapi.event.list(return_all=True)
         assert len(result.events) == 6
         assert result.events[0].id == 1
@@ -206,7 +219,7 @@ class TestEventListReturnAll:
     def test_return_all_with_status_filter(self):
         """Test return_all=True with status filter."""
         pages = [_make_page(1, 2, status="ongoing"), _make_page(2, 2, status="completed")]
-        with patch("vlrdevapi._base.fetch_sync", side_effect=pages):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)):
             result = vlrdevapi.event.list(return_all=True, status="ongoing")
         assert len(result.events) == 2
         assert all(e.status == "ongoing" for e in result.events)
@@ -214,7 +227,7 @@ class TestEventListReturnAll:
     def test_return_all_max_page(self):
         """Test max_page limits pages fetched."""
         pages = [_make_page(1, 5), _make_page(2, 5)]
-        with patch("vlrdevapi._base.fetch_sync", side_effect=pages):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)):
             result = vlrdevapi.event.list(return_all=True, max_page=1)
         assert len(result.events) == 2
         assert all(e.id in (1, 2) for e in result.events)
@@ -222,7 +235,7 @@ class TestEventListReturnAll:
     def test_return_all_with_tier_and_region(self):
         """Test return_all=True with tier and region filters."""
         pages = [_make_page(1, 1), _make_page(1, 1)]
-        with patch("vlrdevapi._base.fetch_sync", side_effect=pages):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)):
             result = vlrdevapi.event.list(return_all=True, tier="vct", region="emea")
         assert result.filters.tier == "vct"
         assert result.filters.region == "emea"
@@ -230,7 +243,7 @@ class TestEventListReturnAll:
     def test_return_all_single_page(self):
         """Test return_all=True with a single page of results."""
         pages = [_make_page(1, 1)]
-        with patch("vlrdevapi._base.fetch_sync", side_effect=pages):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)):
             result = vlrdevapi.event.list(return_all=True)
         assert len(result.events) == 2
         assert result.has_next_page is False
@@ -238,6 +251,54 @@ class TestEventListReturnAll:
     def test_return_all_respects_max_page_zero(self):
         """Test max_page=0 means no limit (fetch all pages)."""
         pages = [_make_page(1, 3), _make_page(2, 3), _make_page(3, 3)]
-        with patch("vlrdevapi._base.fetch_sync", side_effect=pages):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)):
             result = vlrdevapi.event.list(return_all=True, max_page=0)
         assert len(result.events) == 6
+
+    def test_return_all_preserves_page_order(self):
+        """Test concurrently fetched pages are combined in page order."""
+        pages = [_make_page(p, 6) for p in range(1, 7)]
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)) as mock_fetch:
+            result = vlrdevapi.event.list(return_all=True, max_page=4)
+        assert mock_fetch.call_count == 4
+        assert [e.id for e in result.events] == list(range(1, 9))
+
+
+class TestEventListIterEvents:
+    def test_iter_events_yields_all_pages(self):
+        """Test iter_events streams events across every page in order."""
+        pages = [_make_page(p, 3) for p in range(1, 4)]
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)):
+            ids = [e.id for e in vlrdevapi.event.list.iter_events()]
+        assert ids == list(range(1, 7))
+
+    def test_iter_events_is_lazy(self):
+        """Test nothing is fetched until the iterator is consumed."""
+        pages = [_make_page(p, 3) for p in range(1, 4)]
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)) as mock_fetch:
+            events = vlrdevapi.event.list.iter_events()
+            assert mock_fetch.call_count == 0
+            first = next(events)
+        assert first.id == 1
+
+    def test_iter_events_early_break_stops_fetching(self):
+        """Test breaking out early leaves later pages unfetched."""
+        pages = [_make_page(p, 6) for p in range(1, 7)]
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)) as mock_fetch:
+            for event in vlrdevapi.event.list.iter_events():
+                if event.id == 1:
+                    break
+        assert mock_fetch.call_count <= 2
+
+    def test_iter_events_max_page(self):
+        """Test max_page bounds the pages streamed."""
+        pages = [_make_page(p, 5) for p in range(1, 6)]
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve_pages(pages)) as mock_fetch:
+            ids = [e.id for e in vlrdevapi.event.list.iter_events(page=2, max_page=3)]
+        assert ids == [3, 4, 5, 6]
+        assert mock_fetch.call_count == 2
+
+    def test_iter_events_validates_eagerly(self):
+        """Test invalid filters raise before iteration starts."""
+        with pytest.raises(ValueError):
+            vlrdevapi.event.list.iter_events(tier="invalid")  # type: ignore
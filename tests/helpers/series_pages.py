@@ -0,0 +1,23 @@
+"""Synthetic series pages for tests that mock vlr.gg without fixtures."""
+
+from __future__ import annotations
+
+
+def series_overview_html(games: list[tuple[int, str, bool]]) -> str:
+    """Return a minimal FNATIC vs Team Vitality series page.
+
+    ``games`` lists ``(game_id, map_name, played)`` in map order; unplayed
+    maps are marked disabled in the game navigation.
+    """
+    nav = "".join(
+        f'<div class="vm-stats-gamesnav-item js-map-switch" data-game-id="{gid}" data-disabled="{0 if played else 1}">'
+        f'<div style="text-align: center"><span>{order}</span>{name}</div></div>'
+        for order, (gid, name, played) in enumerate(games, start=1)
+    )
+    return (
+        '<div class="match-header">'
+        '<a class="match-header-link mod-1" href="/team/2593/fnatic"><div class="wf-title-med">FNATIC</div></a>'
+        '<a class="match-header-link mod-2" href="/team/2059/vitality"><div class="wf-title-med">Team Vitality</div></a>'
+        '<div class="match-header-note">FNC ban Bind; VIT ban Lotus; FNC pick Haven; VIT pick Split; Ascent remains</div>'
+        f'</div><div class="vm-stats-gamesnav">{nav}</div>'
+    )
@@ -1,7 +1,13 @@
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
+import httpx
+import pytest
+
 from tests.conftest import load_fixture
 import vlrdevapi
+from vlrdevapi._matches.completed.models import CompletedMatchEntry, CompletedMatchesPage
+from vlrdevapi.commons.checkpoint import Checkpoint, JSONFileCheckpointStore, MemoryCheckpointStore
 
 
 class TestSyncCompletedMatches:
@@ -80,3 +86,128 @@ class TestSyncWithClient:
 
 
 
+
+
+_NS = "vlrdevapi._matches.completed.namespace"
+
+
+def _results_site(mock_vlr, pages: list[list[int]]):
+    """Serve results pages whose matches carry the given ids, newest first."""
+    route = mock_vlr.get(path__regex=r"^/matches/results").respond(200, text="<html></html>")
+    served: list[int] = []
+
+    def parse(html, *args, **kwargs):
+        page = len(served) + 1
+        served.append(page)
+        return CompletedMatchesPage(matches=[
+            CompletedMatchEntry(match_id=mid, datetime=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=mid))
+            for mid in pages[page - 1]
+        ])
+
+    patches = (
+        patch(f"{_NS}.parse_completed_listing", side_effect=parse),
+        patch(f"{_NS}.parse_last_page", return_value=len(pages)),
+        patch(f"{_NS}.enrich_matches_sync"),
+    )
+    return route, patches
+
+
+def _results_item(match_id: int, minute: int) -> str:
+    team = (
+        '<div class="match-item-vs-team"><div class="match-item-vs-team-name"><div class="text-of">{}</div></div>'
+        '<div class="match-item-vs-team-score">1</div></div>'
+    )
+    return (
+        f'<a class="match-item" href="/{match_id}/nrg-vs-fnatic"><div class="match-item-time">5:{minute:02d} PM</div>'
+        f'<div class="match-item-vs">{team.format("NRG")}{team.format("FNATIC")}</div>'
+        '<div class="match-item-eta"><div class="ml"><div class="ml-status">Completed</div></div></div>'
+        '<div class="match-item-event">Final<div class="match-item-event-series">Playoffs</div></div></a>'
+    )
+
+
+def _results_page(items: list[tuple[int, int]]) -> str:
+    cards = "".join(_results_item(match_id, minute) for match_id, minute in items)
+    return (
+        '<html><body><div class="wf-label mod-large">Mon, January 5, 2026</div>'
+        f'<div class="wf-card">{cards}</div></body></html>'
+    )
+
+
+def _series_page(series_id: int) -> str:
+    return (
+        f'<div class="match-header"><a class="match-header-event" href="/event/{series_id}/x"></a>'
+        '<a class="match-header-link mod-1" href="/team/1034/nrg"><div class="wf-title-med">NRG</div></a>'
+        '<a class="match-header-link mod-2" href="/team/2593/fnatic"><div class="wf-title-med">FNATIC</div></a></div>'
+    )
+
+
+class TestSyncCompletedSince:
+    def test_stops_at_seen_match_id(self, mock_vlr):
+        route, (p1, p2, p3) = _results_site(mock_vlr, [[10, 9, 8], [7, 6, 5], [4, 3, 2]])
+        with p1, p2, p3:
+            result = vlrdevapi.matches.completed.since(match_id=6)
+        assert [m.match_id for m in result.matches] == [10, 9, 8, 7]
+        assert route.call_count == 2
+        assert result.has_next_page is False
+
+    def test_stops_at_datetime(self, mock_vlr):
+        route, (p1, p2, p3) = _results_site(mock_vlr, [[10, 9, 8], [7, 6, 5]])
+        with p1, p2, p3:
+            result = vlrdevapi.matches.completed.since(datetime=datetime(2026, 1, 1, 0, 9))
+        assert [m.match_id for m in result.matches] == [10, 9]
+        assert route.call_count == 1
+
+    def test_checkpoint_store_round_trip(self, mock_vlr, tmp_path):
+        store = JSONFileCheckpointStore(tmp_path / "checkpoints.json")
+        store.save("matches.completed", Checkpoint(match_id=8))
+        route, (p1, p2, p3) = _results_site(mock_vlr, [[10, 9, 8], [7, 6, 5]])
+        with p1, p2, p3:
+            result = vlrdevapi.matches.completed.since(store=store)
+        assert [m.match_id for m in result.matches] == [10, 9]
+        assert route.call_count == 1
+        assert store.load("matches.completed").match_id == 10
+
+    def test_without_watermark_returns_first_page(self, mock_vlr):
+        store = MemoryCheckpointStore()
+        route, (p1, p2, p3) = _results_site(mock_vlr, [[10, 9, 8], [7, 6, 5]])
+        with p1, p2, p3:
+            result = vlrdevapi.matches.completed.since(store=store)
+        assert [m.match_id for m in result.matches] == [10, 9, 8]
+        assert route.call_count == 1
+        assert store.load("matches.completed").match_id == 10
+
+    def test_max_page_reports_gap(self, mock_vlr):
+        _, (p1, p2, p3) = _results_site(mock_vlr, [[10, 9], [8, 7], [6, 5]])
+        with p1, p2, p3:
+            result = vlrdevapi.matches.completed.since(match_id=5, max_page=2)
+        assert [m.match_id for m in result.matches] == [10, 9, 8, 7]
+        assert result.has_next_page is True
+
+    def test_same_minute_as_watermark_is_new(self, mock_vlr):
+        _, (p1, p2, p3) = _results_site(mock_vlr, [[10, 9, 8]])
+        with p1, p2, p3:
+            result = vlrdevapi.matches.completed.since(match_id=8, datetime=datetime(2026, 1, 1, 0, 9, tzinfo=UTC))
+        assert [m.match_id for m in result.matches] == [10, 9]
+
+    def test_entries_shifted_to_next_page_are_not_repeated(self, mock_vlr):
+        _, (p1, p2, p3) = _results_site(mock_vlr, [[10, 9], [9, 8]])
+        with p1, p2, p3:
+            result = vlrdevapi.matches.completed.since(match_id=8)
+        assert [m.match_id for m in result.matches] == [10, 9]
+
+    def test_enriches_only_new_matches(self, mock_vlr):
+        mock_vlr.get("/matches/results").respond(200, text=_results_page([(103, 6), (102, 5), (101, 5), (100, 4)]))
+        series = mock_vlr.get(path__regex=r"^/\d+$").mock(
+            side_effect=lambda request: httpx.Response(200, text=_series_page(int(request.url.path.strip("/")))),
+        )
+        mock_vlr.get(path__regex=r"^/team/").respond(200, text="<title>NRG - VLR.gg</title>")
+
+        result = vlrdevapi.matches.completed.since(match_id=101)
+
+        assert [m.match_id for m in result.matches] == [103, 102]
+        assert sorted(str(call.request.url.path) for call in series.calls) == ["/102", "/103"]
+        assert result.matches[0].team1.id == 1034
+
+    def test_rejects_non_store(self):
+        with pytest.raises(ValueError):
+            vlrdevapi.matches.completed.since(store="not-a-store")  # type: ignore
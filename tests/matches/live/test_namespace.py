@@ -1,7 +1,11 @@
 from unittest.mock import patch
 
+import httpx
+import pytest
+
 from tests.conftest import load_fixture
 import vlrdevapi
+from vlrdevapi.exceptions import VlrdevapiException
 
 
 class TestSyncLiveMatches:
@@ -58,3 +62,36 @@ class TestSyncWithClient:
 
 
 
+
+
+_LISTING = (
+    '<html><body><div class="wf-label mod-large">Mon, June 1, 2026</div><div class="wf-card">'
+    '<a class="match-item" href="/7/nrg-vs-fnatic"><div class="match-item-time">3:00 PM</div>'
+    '<div class="match-item-vs-team"><div class="match-item-vs-team-name"><div class="text-of">NRG</div></div>'
+    '<div class="match-item-vs-team-score">1</div></div>'
+    '<div class="match-item-vs-team"><div class="match-item-vs-team-name"><div class="text-of">FNATIC</div></div>'
+    '<div class="match-item-vs-team-score">0</div></div>'
+    '<div class="match-item-eta"><div class="ml"><div class="ml-status">LIVE</div></div></div></a>'
+    "</div></body></html>"
+)
+
+_SERIES = (
+    '<div class="match-header"><a class="match-header-event" href="/event/1/x"></a>'
+    '<a class="match-header-link mod-1" href="/team/1034/nrg"><div class="wf-title-med">NRG</div></a>'
+    '<a class="match-header-link mod-2" href="/team/2593/fnatic"><div class="wf-title-med">FNATIC</div></a></div>'
+)
+
+
+class TestLiveEnrichment:
+    def test_unchanged_listing_is_enriched_on_every_call(self, mock_vlr):
+        mock_vlr.get("/matches").respond(200, text=_LISTING)
+        series = mock_vlr.get("/7").mock(side_effect=[httpx.Response(200, text=_SERIES), httpx.Response(500)])
+        mock_vlr.get(path__regex=r"^/team/").respond(200, text="<title>NRG - VLR.gg</title>")
+
+        with vlrdevapi.VLRClient(max_retries=0) as client:
+            result = client.matches.live()
+            with pytest.raises(VlrdevapiException):
+                client.matches.live()
+
+        assert series.call_count == 2
+        assert result.matches[0].team1.id == 1034
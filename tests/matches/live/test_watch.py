@@ -0,0 +1,101 @@
+from unittest.mock import patch
+
+from selectolax.parser import HTMLParser
+
+import vlrdevapi
+from vlrdevapi._series.info.models import SeriesGame, SeriesInfo
+
+
+def _listing(matches: list[tuple[int, int, int]]) -> HTMLParser:
+    """Build a matches page with live items given as ``(match_id, score1, score2)``."""
+    items = "".join(
+        f'<a class="match-item" href="/{mid}/a-vs-b">'
+        f'<div class="match-item-time">3:00 PM</div>'
+        f'<div class="match-item-vs-team"><div class="match-item-vs-team-name"><div class="text-of">Team A{mid}</div></div>'
+        f'<div class="match-item-vs-team-score">{s1}</div></div>'
+        f'<div class="match-item-vs-team"><div class="match-item-vs-team-name"><div class="text-of">Team B{mid}</div></div>'
+        f'<div class="match-item-vs-team-score">{s2}</div></div>'
+        f'<div class="match-item-eta"><div class="ml"><div class="ml-status">LIVE</div></div></div>'
+        f"</a>"
+        for mid, s1, s2 in matches
+    )
+    return HTMLParser(
+        f'<html><body><div class="wf-label mod-large">Mon, June 1, 2026</div>'
+        f'<div class="wf-card">{items}</div></body></html>',
+    )
+
+
+def _serve(*ticks: HTMLParser):
+    pages = iter(ticks)
+    return lambda client, path, timeout, retry_config=None, rate_limiter=None: next(pages)
+
+
+class TestLiveWatcherPoll:
+    def test_first_poll_reports_live_matches(self):
+        watcher = vlrdevapi.matches.live.watch()
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve(_listing([(1, 0, 0), (2, 1, 0)]))):
+            events = watcher.poll()
+        assert [(e.type, e.match_id) for e in events] == [("match_started", 1), ("match_started", 2)]
+        assert events[1].match.team1.score == 1
+        assert watcher.next_interval == watcher.interval
+
+    def test_score_change_and_finish(self):
+        watcher = vlrdevapi.matches.live.watch()
+        ticks = _serve(_listing([(1, 0, 0), (2, 1, 0)]), _listing([(1, 1, 0)]), _listing([]))
+        with patch("vlrdevapi._base.fetch_sync", side_effect=ticks):
+            watcher.poll()
+            second = watcher.poll()
+            third = watcher.poll()
+        assert [(e.type, e.match_id) for e in second] == [("score_changed", 1), ("match_finished", 2)]
+        assert (second[0].previous_score1, second[0].score1) == (0, 1)
+        assert second[0].scope == "series"
+        assert [(e.type, e.match_id) for e in third] == [("match_finished", 1)]
+        assert watcher.next_interval == watcher.idle_interval
+
+    def test_unchanged_listing_emits_nothing(self):
+        watcher = vlrdevapi.matches.live.watch()
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve(_listing([(1, 0, 0)]), _listing([(1, 0, 0)]))):
+            watcher.poll()
+            assert watcher.poll() == []
+
+    def test_series_pages_report_maps(self):
+        watcher = vlrdevapi.matches.live.watch(series_pages=True)
+        infos = iter([
+            SeriesInfo(games=[SeriesGame(order=1, map_name="Bind", team1_score=3, team2_score=2)]),
+            SeriesInfo(games=[
+                SeriesGame(order=1, map_name="Bind", team1_score=13, team2_score=9),
+                SeriesGame(order=2, map_name="Haven", team1_score=0, team2_score=0),
+            ]),
+        ])
+        with (
+            patch("vlrdevapi._base.fetch_sync", side_effect=_serve(_listing([(1, 0, 0)]), _listing([(1, 1, 0)]))),
+            patch.object(watcher, "_series_info", side_effect=lambda match_id: next(infos)),
+        ):
+            first = watcher.poll()
+            second = watcher.poll()
+        assert [e.type for e in first] == ["match_started", "map_started"]
+        assert [e.type for e in second] == ["score_changed", "score_changed", "map_started"]
+        assert (second[1].scope, second[1].map_name, second[1].score1) == ("map", "Bind", 13)
+        assert (second[2].map_name, second[2].order) == ("Haven", 2)
+
+
+class TestLiveWatcherDelivery:
+    def test_run_stops_from_callback(self):
+        watcher = vlrdevapi.matches.live.watch(interval=0, idle_interval=0)
+        seen = []
+
+        def on_event(event):
+            seen.append(event.type)
+            if event.type == "match_finished":
+                watcher.stop()
+
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve(_listing([(1, 0, 0)]), _listing([]))):
+            watcher.run(on_event)
+        assert seen == ["match_started", "match_finished"]
+
+    def test_iterates_events(self):
+        watcher = vlrdevapi.matches.live.watch(interval=0, idle_interval=0)
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_serve(_listing([(1, 0, 0)]), _listing([(1, 0, 1)]))):
+            events = iter(watcher)
+            assert next(events).type == "match_started"
+            assert next(events).type == "score_changed"
@@ -0,0 +1,61 @@
+import pytest
+
+from tests.conftest import load_fixture
+import vlrdevapi
+
+
+class TestSyncModuleLevel:
+    def test_ethan_bundle_default_timespans(self, mock_vlr):
+        html = load_fixture("player", "11225_ethan", "overview.html")
+        route_30d = mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=html)
+        route_all = mock_vlr.get("/player/11225/?timespan=all").respond(200, text=html)
+
+        result = vlrdevapi.player.bundle(11225)
+        assert route_30d.call_count == 1
+        assert route_all.call_count == 1
+        assert result.player_id == 11225
+        assert result.info.player_id == 11225
+        assert result.info.name == "Ethan"
+        assert result.teams.current_teams[0].name == "NRG"
+        assert set(result.agents) == {"30d", "all"}
+        assert result.agents["all"].timespan == "all"
+        assert result.profile.player_id == 11225
+        assert result.profile.stats_timespan == "30d"
+        assert len(result.profile.top_agents) > 0
+
+    def test_ethan_bundle_deduplicates_timespans(self, mock_vlr):
+        html = load_fixture("player", "11225_ethan", "overview.html")
+        route = mock_vlr.get("/player/11225/?timespan=60d").respond(200, text=html)
+
+        result = vlrdevapi.player(11225).bundle(timespans=["60d", "60d"])
+        assert route.call_count == 1
+        assert list(result.agents) == ["60d"]
+        assert result.profile.stats_timespan == "60d"
+
+    def test_matches_individual_calls(self, mock_vlr):
+        html = load_fixture("player", "11225_ethan", "overview.html")
+        mock_vlr.get("/player/11225").respond(200, text=html)
+        mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=html)
+        mock_vlr.get("/player/11225/?timespan=all").respond(200, text=html)
+
+        result = vlrdevapi.player.bundle(11225)
+        assert result.info == vlrdevapi.player.info(11225)
+        assert result.teams == vlrdevapi.player.teams(11225)
+        assert result.agents["all"] == vlrdevapi.player.agents(11225, timespan="all")
+        assert result.profile == vlrdevapi.player.profile(11225)
+
+    def test_invalid_timespan(self):
+        with pytest.raises(ValueError):
+            vlrdevapi.player.bundle(11225, timespans=["1y"])  # type: ignore
+
+
+class TestSyncWithClient:
+    def test_ethan_bundle(self, mock_vlr):
+        html = load_fixture("player", "11225_ethan", "overview.html")
+        mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=html)
+        mock_vlr.get("/player/11225/?timespan=all").respond(200, text=html)
+
+        with vlrdevapi.VLRClient() as client:
+            result = client.player.bundle(11225)
+        assert result.info.name == "Ethan"
+        assert len(result.agents["30d"].agents) > 0
@@ -53,5 +53,24 @@ class TestSyncEthan:
         assert len(result) == 16
         assert result[0].match_id != result[15].match_id
 
+    def test_iter_streams_across_pages(self, client):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_fetch_side_effect):
+            streamed = list(client.player.matches.iter(11225, max_page=2))
+            result = client.player.matches(11225, limit=len(streamed))
+        assert [m.match_id for m in streamed] == [m.match_id for m in result]
 
+    def test_iter_early_break(self, client):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_fetch_side_effect) as mock_fetch:
+            first = next(client.player.matches.iter(11225))
+        assert isinstance(first.match_id, int)
+        assert mock_fetch.call_count <= 2
 
+    def test_matches_since_stops_paging(self, client):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_fetch_side_effect):
+            full = client.player.matches(11225, limit=100)
+        since = full[5].date
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_fetch_side_effect) as mock_fetch:
+            result = client.player.matches(11225, limit=100, since=since)
+        assert mock_fetch.call_count == 1
+        assert all(m.date is None or m.date >= since for m in result)
+        assert len(result) >= 6
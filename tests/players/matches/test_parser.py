@@ -144,3 +144,35 @@ class TestParseEthanPage2(_TestParseBase):
             _load_html("11225_ethan", "matches_page2.html")
         )
 
+
+
+def _history(items: list[tuple[int, str]], has_next: bool = True) -> HTMLParser:
+    body = "".join(
+        f'<a class="m-item" href="/{mid}/x"><div class="m-item-date"><div></div><div>{d}</div>3:00 pm</div></a>'
+        for mid, d in items
+    )
+    link = '<link rel="next" href="?page=2">' if has_next else ""
+    return HTMLParser(f"<html><head>{link}</head><body>{body}</body></html>")
+
+
+class TestParseDateWindow:
+    def test_since_stops_at_older_match(self):
+        html = _history([(5, "2026/06/10"), (4, "2026/06/05"), (3, "2026/05/01"), (2, "2026/04/01")])
+        page = parse_player_matches(html, since=date(2026, 5, 1))
+
+        assert [m.match_id for m in page.matches] == [5, 4, 3]
+        assert page.has_next_page is False
+
+    def test_until_skips_newer_matches(self):
+        html = _history([(5, "2026/06/10"), (4, "2026/06/05"), (3, "2026/05/01")])
+        page = parse_player_matches(html, until=date(2026, 6, 5))
+
+        assert [m.match_id for m in page.matches] == [4, 3]
+        assert page.has_next_page is True
+
+    def test_window_inside_page_keeps_paging(self):
+        html = _history([(5, "2026/06/10"), (4, "2026/06/05")])
+        page = parse_player_matches(html, since=date(2026, 6, 1), until=date(2026, 6, 30))
+
+        assert len(page.matches) == 2
+        assert page.has_next_page is True
@@ -1,3 +1,5 @@
+import pytest
+
 from tests.conftest import load_fixture
 import vlrdevapi
 
@@ -26,6 +28,53 @@ class TestSyncModuleLevel:
         assert result.stats_timespan in ("30d", "all")
 
 
+class TestFallbackStrategies:
+    _INACTIVE_30D = "<html><body><div class='player-header'><h1 class='wf-title'>Ethan</h1></div></body></html>"
+
+    def test_sequential_fallback_to_all(self, mock_vlr):
+        mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=self._INACTIVE_30D)
+        route_all = mock_vlr.get("/player/11225/?timespan=all").respond(200, text=load_fixture("player", "11225_ethan", "overview.html"))
+
+        result = vlrdevapi.player.profile(11225)
+        assert route_all.call_count == 1
+        assert result.stats_timespan == "all"
+        assert len(result.top_agents) > 0
+
+    def test_speculative_fetches_both(self, mock_vlr):
+        route_30d = mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=self._INACTIVE_30D)
+        route_all = mock_vlr.get("/player/11225/?timespan=all").respond(200, text=load_fixture("player", "11225_ethan", "overview.html"))
+
+        result = vlrdevapi.player.profile(11225, strategy="speculative")
+        assert route_30d.call_count == 1
+        assert route_all.call_count == 1
+        assert result.player_id == 11225
+        assert result.stats_timespan == "all"
+        assert len(result.top_agents) > 0
+
+    def test_speculative_prefers_30d(self, mock_vlr):
+        html = load_fixture("player", "11225_ethan", "overview.html")
+        mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=html)
+        mock_vlr.get("/player/11225/?timespan=all").respond(200, text=html)
+
+        result = vlrdevapi.player(11225).profile(strategy="speculative")
+        assert result.stats_timespan == "30d"
+
+    def test_adaptive_remembers_fallback(self, mock_vlr):
+        route_30d = mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=self._INACTIVE_30D)
+        route_all = mock_vlr.get("/player/11225/?timespan=all").respond(200, text=load_fixture("player", "11225_ethan", "overview.html"))
+
+        with vlrdevapi.VLRClient() as client:
+            first = client.player.profile(11225, strategy="adaptive")
+            second = client.player.profile(11225, strategy="adaptive")
+        assert first.stats_timespan == second.stats_timespan == "all"
+        assert route_30d.call_count == 2
+        assert route_all.call_count == 2
+
+    def test_invalid_strategy(self):
+        with pytest.raises(ValueError):
+            vlrdevapi.player.profile(11225, strategy="eager")  # type: ignore
+
+
 class TestSyncWithClient:
     def test_ethan_profile(self, mock_vlr):
         mock_vlr.get("/player/11225/?timespan=30d").respond(200, text=load_fixture("player", "11225_ethan", "overview.html"))
@@ -0,0 +1,41 @@
+from vlrdevapi._series.economy import (
+    ECONOMY_COLUMNS,
+    BuyType,
+    EconomyData,
+    RoundEconomyData,
+    RoundWinner,
+    economy_columns,
+)
+
+
+class TestEconomyColumns:
+    def test_columns_follow_models(self):
+        game = EconomyData(
+            series_id=1,
+            game_id=100,
+            rounds=[
+                RoundEconomyData(
+                    round_number=1, bank_team1=800.0, bank_team2=800.0, spent_team1=3900, spent_team2=4100,
+                    winner=RoundWinner(name="A", id=10), buy_type_team1=BuyType.ECO, buy_type_team2=BuyType.SEMI_ECO,
+                    is_pistol_round=True,
+                ),
+                # Default buy types are enum members rather than values.
+                RoundEconomyData(round_number=2, bank_team1=4100.0, spent_team1=20000, winner=RoundWinner(name="B", id=20)),
+            ],
+        )
+        table = economy_columns([game, EconomyData(game_id=101)])
+        assert tuple(table) == ECONOMY_COLUMNS
+        assert table == {
+            "series_id": [1, 1],
+            "game_id": [100, 100],
+            "round_number": [1, 2],
+            "winner_id": [10, 20],
+            "winner_name": ["A", "B"],
+            "bank_team1": [800.0, 4100.0],
+            "bank_team2": [800.0, 0.0],
+            "spent_team1": [3900, 20000],
+            "spent_team2": [4100, 0],
+            "buy_type_team1": ["Eco", "Eco"],
+            "buy_type_team2": ["Semi-eco", "Eco"],
+            "is_pistol_round": [True, False],
+        }
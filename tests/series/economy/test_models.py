@@ -1,5 +1,6 @@
 from tests.conftest import load_fixture
 from tests.conftest import mock_vlr  # noqa: F401
+from tests.helpers.series_pages import series_overview_html
 import vlrdevapi
 
 SERIES_ID = 644718
@@ -82,3 +83,29 @@ class TestSyncWithClient:
             result = match.economy(game_id=GAME_ID)
         assert result.series_id == SERIES_ID
         assert len(result.rounds) == 24
+
+
+class TestSyncAllGames:
+    def test_economy_all(self, mock_vlr):
+        from unittest.mock import patch
+
+        from vlrdevapi._series.economy.models import EconomyData
+
+        tabs = [
+            mock_vlr.get(f"/{SERIES_ID}?game={gid}&tab=economy").respond(200, text=f"<p>{gid}</p>")
+            for gid in (21, 22, 23)
+        ]
+        overview = mock_vlr.get(f"/{SERIES_ID}").respond(
+            200, text=series_overview_html([(21, "Haven", True), (22, "Split", True), (23, "Ascent", True)]),
+        )
+
+        def fake_parse(html):
+            return EconomyData(team1="FNC", team2="VIT", team1_id=int(html.css_first("p").text()))
+
+        with patch("vlrdevapi._series.economy.namespace.parse_economy_data", side_effect=fake_parse):
+            result = vlrdevapi.series.economy.all(SERIES_ID)
+
+        assert overview.call_count == 1
+        assert all(tab.call_count == 1 for tab in tabs)
+        assert [r.game_id for r in result] == [21, 22, 23]
+        assert all((r.team1_id, r.team2_id) == (2593, 2059) for r in result)
@@ -50,3 +50,13 @@ class TestSyncWithClient:
         assert result.score1 == 3
         assert result.score2 == 2
 
+
+    def test_series_info_fields(self, mock_vlr):
+        mock_vlr.get(f"/{SERIES_ID}").respond(200, text=load_fixture("series", _SERIES_DIR, "overview.html"))
+
+        with vlrdevapi.VLRClient() as client:
+            result = client.series.info(SERIES_ID, fields={"teams"})
+        assert result.team1.id == 1034
+        assert result.team2.tag == "FNC"
+        assert result.games == []
+        assert result.event_name == ""
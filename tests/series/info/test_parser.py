@@ -102,3 +102,30 @@ class TestParseSeriesInfo:
         assert game5.team2_defense_rounds == 3
         assert game5.duration_seconds == 2538
 
+
+
+class TestParseSeriesInfoFields:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.html = _load_html("overview.html")
+        self.full = parse_series_info(self.html)
+
+    def test_teams_and_event_match_full_parse(self):
+        result = parse_series_info(self.html, fields={"teams", "event"})
+        assert result.team1 == self.full.team1
+        assert result.team2 == self.full.team2
+        assert result.event_id == self.full.event_id
+        assert result.event_name == self.full.event_name
+        assert result.stage == self.full.stage
+        assert result.bracket == self.full.bracket
+
+    def test_skipped_sections_keep_defaults(self):
+        result = parse_series_info(self.html, fields={"teams"})
+        assert result.games == []
+        assert result.event_name == ""
+        assert result.datetime is None
+        assert result.score1 == 0
+
+    def test_all_fields_is_full_parse(self):
+        fields = {"event", "date", "teams", "status", "veto", "games"}
+        assert parse_series_info(self.html, fields=fields) == self.full
@@ -0,0 +1,92 @@
+import pytest
+
+from vlrdevapi._series.performance import (
+    KillEntry,
+    KillMatrix,
+    KillMatrixAggregate,
+    PerformanceData,
+)
+
+
+def _entry(killer_id: int, victim_id: int, kills: int | None, deaths: int | None) -> KillEntry:
+    return KillEntry(
+        killer=f"p{killer_id}", killer_id=killer_id,
+        victim=f"p{victim_id}", victim_id=victim_id,
+        kills=kills, deaths=deaths,
+    )
+
+
+def _perf(series_id: int, game_id: str = "all", entries=(), first=(), op=()) -> PerformanceData:
+    return PerformanceData(
+        series_id=series_id,
+        game_id=game_id,
+        all_kills_matrix=KillMatrix(entries=list(entries)),
+        first_kills_matrix=KillMatrix(entries=list(first)),
+        op_kills_matrix=KillMatrix(entries=list(op)),
+    )
+
+
+class TestKillMatrixAggregate:
+    def test_accumulates_both_directions(self):
+        agg = KillMatrixAggregate([
+            _perf(1, entries=[_entry(1, 10, 5, 3), _entry(2, 10, 2, None)]),
+            _perf(2, entries=[_entry(10, 1, 4, 6)]),
+        ])
+        assert len(agg) == 2
+        assert agg.kills(1, 10) == 5 + 6
+        assert agg.kills(10, 1) == 3 + 4
+        assert agg.duel(2, 10) == (2, 0)
+        assert agg.kills(1, 99) == 0
+
+    def test_kinds_are_separate(self):
+        agg = KillMatrixAggregate([_perf(1, entries=[_entry(1, 10, 5, 3)], first=[_entry(1, 10, 1, 2)], op=[_entry(1, 10, None, 1)])])
+        assert agg.duel(1, 10) == (5, 3)
+        assert agg.duel(1, 10, "first") == (1, 2)
+        assert agg.duel(1, 10, "op") == (0, 1)
+
+    def test_incremental_matches_batch(self):
+        perfs = [_perf(i, entries=[_entry(1, 10 + i % 3, i, i + 1)]) for i in range(1, 20)]
+        batch = KillMatrixAggregate(perfs)
+        incremental = KillMatrixAggregate()
+        for perf in perfs:
+            incremental.add(perf)
+        assert incremental.to_tensor() == batch.to_tensor()
+
+    def test_duplicate_series_game_ignored(self):
+        agg = KillMatrixAggregate()
+        perf = _perf(1, entries=[_entry(1, 10, 5, 3)])
+        assert agg.add(perf) is True
+        assert agg.add(perf) is False
+        assert agg.update([perf, _perf(2)]) == 1
+        assert agg.kills(1, 10) == 5
+
+    def test_games_and_all_of_same_series_rejected(self):
+        agg = KillMatrixAggregate([_perf(1, "100"), _perf(1, "101")])
+        with pytest.raises(ValueError, match="series 1"):
+            agg.add(_perf(1, "all"))
+        agg = KillMatrixAggregate([_perf(1, "all")])
+        with pytest.raises(ValueError, match="series 1"):
+            agg.add(_perf(1, "100"))
+
+    def test_entries_without_ids_skipped(self):
+        agg = KillMatrixAggregate([_perf(1, entries=[_entry(0, 10, 5, 3), _entry(1, 0, 5, 3)])])
+        assert agg.player_ids == []
+
+    def test_latest_name_kept(self):
+        renamed = _entry(1, 10, 1, 1).model_copy(update={"killer": "new"})
+        agg = KillMatrixAggregate([_perf(1, entries=[_entry(1, 10, 1, 1)]), _perf(2, entries=[renamed])])
+        assert agg.name(1) == "new"
+        assert agg.name(10) == "p10"
+        assert agg.name(2) is None
+
+    def test_to_tensor(self):
+        agg = KillMatrixAggregate([_perf(1, entries=[_entry(1, 10, 5, 3)], first=[_entry(1, 10, 1, 0)])])
+        tensor = agg.to_tensor()
+        assert tensor.player_ids == [1, 10]
+        assert tensor.names == ["p1", "p10"]
+        assert tensor.kinds == ("all", "first", "op")
+        assert [[list(row) for row in grid] for grid in tensor.values] == [
+            [[0, 5], [3, 0]],
+            [[0, 1], [0, 0]],
+            [[0, 0], [0, 0]],
+        ]
@@ -0,0 +1,102 @@
+import copy
+import pickle
+
+from vlrdevapi._series.performance.models import DenseKillMatrix, KillEntry, KillMatrix
+
+
+def _matrix() -> KillMatrix:
+    return KillMatrix(entries=[
+        KillEntry(killer="a", killer_team="T1", victim="x", victim_team="T2", kills=3, deaths=1, diff=2),
+        KillEntry(killer="a", killer_team="T1", victim="y", victim_team="T2", kills=None, deaths=None, diff=None),
+        KillEntry(killer="b", killer_team="T1", victim="x", victim_team="T2", kills=0, deaths=4, diff=-4),
+        KillEntry(killer="x", killer_team="T2", victim="a", victim_team="T2", kills=2, deaths=2, diff=0),
+    ])
+
+
+class TestKillMatrixIndex:
+    def test_lookup(self):
+        m = _matrix()
+        assert m.lookup("a", "x").kills == 3
+        assert m.lookup("b", "x").deaths == 4
+        assert m.lookup("x", "b") is None
+
+    def test_lookup_returns_first_duplicate(self):
+        m = _matrix()
+        m.entries.append(KillEntry(killer="a", victim="x", kills=99))
+        assert m.lookup("a", "x").kills == 3
+
+    def test_by_killer_victim_team(self):
+        m = _matrix()
+        assert [e.victim for e in m.by_killer("a")] == ["x", "y"]
+        assert [e.killer for e in m.by_victim("x")] == ["a", "b"]
+        assert len(m.by_team("T1")) == 3
+        assert len(m.by_team("T2")) == 4
+        assert m.by_killer("nobody") == []
+
+    def test_returned_lists_are_copies(self):
+        m = _matrix()
+        m.by_killer("a").clear()
+        m.killers().clear()
+        assert len(m.by_killer("a")) == 2
+        assert m.killers() == ["a", "b", "x"]
+
+    def test_killers_and_victims_order(self):
+        m = _matrix()
+        assert m.killers() == ["a", "b", "x"]
+        assert m.victims() == ["x", "y", "a"]
+
+    def test_index_follows_appends_and_replacement(self):
+        m = _matrix()
+        assert m.lookup("c", "z") is None
+        m.entries.append(KillEntry(killer="c", victim="z", kills=1))
+        assert m.lookup("c", "z").kills == 1
+        m.entries = [KillEntry(killer="d", victim="w")]
+        assert m.killers() == ["d"]
+        assert m.lookup("a", "x") is None
+
+    def test_index_follows_removal_and_new_list_after_item_assignment(self):
+        m = _matrix()
+        assert m.lookup("a", "x").kills == 3
+        m.entries.pop(0)
+        assert m.lookup("a", "x") is None
+        m.entries[0] = KillEntry(killer="z", victim="x", kills=7)
+        m.entries = list(m.entries)
+        assert m.lookup("z", "x").kills == 7
+        assert m.lookup("a", "y") is None
+
+    def test_index_not_pickled(self):
+        m = _matrix()
+        m.lookup("a", "x")
+        assert pickle.loads(pickle.dumps(m)).__pydantic_private__["_kill_index"] is None
+        assert m.__pydantic_private__["_kill_index"] is not None
+
+    def test_index_not_part_of_model(self):
+        m, fresh = _matrix(), _matrix()
+        m.lookup("a", "x")
+        assert m == fresh
+        assert m.model_dump() == fresh.model_dump()
+        assert "_kill_index" not in m.model_dump_json()
+        for clone in (pickle.loads(pickle.dumps(m)), m.model_copy(deep=True), copy.deepcopy(m)):
+            assert clone == fresh
+            clone.entries.append(KillEntry(killer="c", victim="z"))
+            assert clone.lookup("c", "z") is not None
+        assert m.lookup("c", "z") is None
+
+
+class TestKillMatrixToMatrix:
+    def test_shape_and_order(self):
+        dense = _matrix().to_matrix()
+        assert isinstance(dense, DenseKillMatrix)
+        assert dense.killers == ["a", "b", "x"]
+        assert dense.victims == ["x", "y", "a"]
+        assert [list(row) for row in dense.values] == [[3, 0, 0], [0, 0, 0], [0, 0, 2]]
+
+    def test_value_and_fill(self):
+        dense = _matrix().to_matrix("diff", fill=-1)
+        assert [list(row) for row in dense.values] == [[2, -1, -1], [-4, -1, -1], [-1, -1, 0]]
+
+    def test_empty(self):
+        dense = KillMatrix().to_matrix()
+        assert dense.killers == []
+        assert dense.victims == []
+        assert len(dense.values) == 0
@@ -0,0 +1,45 @@
+from vlrdevapi._series.rounds import (
+    ROUNDS_COLUMNS,
+    RoundData,
+    RoundsData,
+    rounds_columns,
+)
+
+
+def _game(game_id: int, rounds: int) -> RoundsData:
+    return RoundsData(
+        series_id=1,
+        game_id=game_id,
+        rounds=[
+            RoundData(
+                round_number=n,
+                winner_team_name="A" if n % 2 else "B",
+                winner_team_id=10 if n % 2 else 20,
+                win_type="Elimination",
+                side="Attack",
+                team1_score=(n + 1) // 2,
+                team2_score=n // 2,
+            )
+            for n in range(1, rounds + 1)
+        ],
+    )
+
+
+class TestRoundsColumns:
+    def test_columns_follow_models(self):
+        games = [_game(100, 3), _game(101, 2)]
+        table = rounds_columns(games)
+        assert tuple(table) == ROUNDS_COLUMNS
+        assert table.num_rows == 5
+        assert table["game_id"] == [100, 100, 100, 101, 101]
+        assert table["series_id"] == [1] * 5
+        assert table["round_number"] == [1, 2, 3, 1, 2]
+        assert table["winner_team_id"] == [10, 20, 10, 10, 20]
+        rows = [r for g in games for r in g.rounds]
+        for name in ROUNDS_COLUMNS[2:]:
+            assert table[name] == [getattr(r, name) for r in rows]
+
+    def test_empty(self):
+        table = rounds_columns([])
+        assert tuple(table) == ROUNDS_COLUMNS
+        assert table.num_rows == 0
@@ -1,5 +1,6 @@
 from tests.conftest import load_fixture
 from tests.conftest import mock_vlr  # noqa: F401
+from tests.helpers.series_pages import series_overview_html
 import vlrdevapi
 
 SERIES_ID = 644718
@@ -67,3 +68,32 @@ class TestSyncWithClient:
             result = match.rounds(game_id=GAME_ID)
         assert result.series_id == SERIES_ID
         assert len(result.rounds) == 24
+
+
+class TestSyncAllGames:
+    def test_rounds_all(self, mock_vlr):
+        from unittest.mock import patch
+
+        from vlrdevapi._series.rounds.models import RoundData, RoundsData
+
+        tabs = [
+            mock_vlr.get(f"/{SERIES_ID}?game={gid}&tab=overview").respond(200, text=f"<p>{gid}</p>")
+            for gid in (11, 12)
+        ]
+        overview = mock_vlr.get(f"/{SERIES_ID}").respond(
+            200, text=series_overview_html([(11, "Haven", True), (12, "Split", True), (13, "Ascent", False)]),
+        )
+
+        def fake_parse(html):
+            rounds = [RoundData(round_number=1, winner_team_name="VIT")]
+            return RoundsData(team1="FNC", team2="VIT", rounds=rounds * int(html.css_first("p").text()))
+
+        with patch("vlrdevapi._series.rounds.namespace.parse_rounds_data", side_effect=fake_parse):
+            result = vlrdevapi.series.rounds.all(SERIES_ID)
+
+        assert overview.call_count == 1
+        assert all(tab.call_count == 1 for tab in tabs)
+        assert [(r.game_id, len(r.rounds)) for r in result] == [(11, 11), (12, 12)]
+        assert all(r.series_id == SERIES_ID for r in result)
+        assert (result[0].team1_id, result[0].team2_id) == (2593, 2059)
+        assert result[1].rounds[0].winner_team_id == 2059
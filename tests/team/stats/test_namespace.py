@@ -124,3 +124,53 @@ class TestSyncWithClient:
                         break
                 break
 
+
+
+def _stats_page(games: list[tuple[str, int]]) -> str:
+    numbers = "".join(f"<td>{v}</td>" for v in ("50%", 1, 1, 1, 1, "50%", 10, 10, "50%", 10, 10))
+    rows = []
+    for map_name in dict.fromkeys(name for name, _ in games):
+        comp = '<div class="agent-comp-agg" data-agent-comp-hash="aaaaaaaaaaaa"><span>(1)</span><img src="/a/jett.png"></div>'
+        rows.append(f"<tr><td>{map_name} (1)</td><td></td>{numbers}<td>{comp}</td></tr>")
+    for map_name, series_id in games:
+        rows.append(
+            f'<tr class="mod-toggle mod-{map_name}"><td class="mod-win"><a href="/{series_id}/x">'
+            f'<div>2025/01/01</div><div class="text-of">FNATIC</div><div class="game-score">13/5</div>'
+            f'</a></td><td class="aaaaaaaaaaaa"></td><td></td></tr>'
+        )
+    return f'<table class="wf-table mod-team-maps"><tbody>{"".join(rows)}</tbody></table>'
+
+
+def _series_page(series_id: int) -> str:
+    return (
+        f'<div class="match-header"><a class="match-header-event" href="/event/{series_id}/x">'
+        f'<div style="font-weight: 700;">Event {series_id}</div></a>'
+        '<a class="match-header-link mod-1" href="/team/1034/nrg"><div class="wf-title-med">NRG</div></a>'
+        '<a class="match-header-link mod-2" href="/team/2593/fnatic"><div class="wf-title-med">FNATIC</div></a></div>'
+    )
+
+
+class TestDetailedSeriesLookups:
+    def test_each_series_fetched_once(self):
+        fetched: list[str] = []
+        stats = _stats_page([("Ascent", 101), ("Bind", 101), ("Ascent", 102), ("Bind", 102), ("Split", 101)])
+
+        def fake_fetch(client, path, timeout, retry_config=None, rate_limiter=None):
+            fetched.append(path)
+            if path.startswith("/team/stats/"):
+                return HTMLParser(stats)
+            return HTMLParser(_series_page(int(path.strip("/"))))
+
+        with patch("vlrdevapi._base.fetch_sync", side_effect=fake_fetch), vlrdevapi.VLRClient() as client:
+            result = client.team(1034).stats(agent_composition="detailed")
+            again = client.team.stats(1034, agent_composition="detailed")
+
+        series_paths = [p for p in fetched if not p.startswith("/team/stats/")]
+        assert sorted(series_paths) == ["/101", "/102"]
+        assert again == result
+        details = [d for m in result.maps for d in m.compositions[0].matches]
+        assert [(d.series_id, d.event_name, d.opponent_id) for d in details] == [
+            (101, "Event 101", 2593), (102, "Event 102", 2593),
+            (101, "Event 101", 2593), (102, "Event 102", 2593),
+            (101, "Event 101", 2593),
+        ]
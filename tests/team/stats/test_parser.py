@@ -243,3 +243,51 @@ class TestParseAgentCompositionDetailed:
             assert match.team_score >= 0
             assert match.opponent_score >= 0
 
+
+
+def _game_row(map_name: str, series_id: int, result: str, comp_hash: str, halves: str) -> str:
+    return (
+        f'<tr class="mod-toggle mod-{map_name}"><td class="{result}"><a href="/{series_id}/a-vs-b">'
+        f'<div>2024/05/01</div><div class="text-of">Opp {series_id}</div><div class="game-score">13/{series_id % 10}</div>'
+        f'{halves}</a></td><td class="{comp_hash}"></td><td></td></tr>'
+    )
+
+
+def _map_row(map_name: str, games: int, comp_hash: str) -> str:
+    numbers = "".join(f"<td>{v}</td>" for v in ("50%", 1, 1, 1, 1, "50%", 10, 10, "50%", 10, 10))
+    comp = f'<div class="agent-comp-agg" data-agent-comp-hash="{comp_hash}"><span>({games})</span><img src="/a/jett.png"></div>'
+    return f"<tr><td>{map_name} ({games})</td><td></td>{numbers}<td>{comp}</td></tr>"
+
+
+class TestParseGameRowGrouping:
+    HALVES = (
+        '<div class="game-half"><div class="game-half-label">atk</div><div>7/5</div></div>'
+        '<div class="game-half"><span><div class="game-half-label">def</div></span><div>6/2</div></div>'
+    )
+
+    def _html(self) -> HTMLParser:
+        rows = [
+            _map_row("Ascent", 2, "aaaaaaaaaaaa"),
+            _game_row("Ascent", 101, "mod-win", "aaaaaaaaaaaa", self.HALVES),
+            _map_row("Bind", 1, "bbbbbbbbbbbb"),
+            _game_row("Bind", 201, "mod-loss", "bbbbbbbbbbbb", self.HALVES),
+            _game_row("Ascent", 102, "mod-loss", "aaaaaaaaaaaa", self.HALVES),
+        ]
+        return HTMLParser(f'<table class="wf-table mod-team-maps"><tbody>{"".join(rows)}</tbody></table>')
+
+    def test_games_attached_to_their_map(self):
+        mock_fn = MagicMock(return_value=None)
+        result = parse_team_stats(self._html(), 1, agent_composition="detailed", series_info_fn=mock_fn)
+        matches = {m.map_name: [d.series_id for d in m.compositions[0].matches] for m in result.maps}
+        assert matches == {"Ascent": [101, 102], "Bind": [201]}
+        assert [call.args[0] for call in mock_fn.call_args_list] == [101, 102, 201]
+
+    def test_game_fields(self):
+        result = parse_team_stats(self._html(), 1, agent_composition="detailed", series_info_fn=None)
+        ascent = next(m for m in result.maps if m.map_name == "Ascent")
+        game = ascent.compositions[0].matches[0]
+        assert (game.opponent_name, game.team_score, game.opponent_score) == ("Opp 101", 13, 1)
+        assert (game.attack_rounds_won, game.attack_rounds_lost) == (7, 5)
+        assert (game.defense_rounds_won, game.defense_rounds_lost) == (6, 2)
+        assert ascent.compositions[0].wins == 1
+        assert ascent.compositions[0].losses == 1
@@ -1,4 +1,5 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from unittest.mock import patch
 
 import pytest
 from selectolax.parser import HTMLParser, Node
@@ -200,3 +201,44 @@ class TestParseTeamTransactions:
         assert txn.player.ign == "Ry"
         assert txn.position == "Manager"
 
+
+
+def _txn_table(dates: list[str]) -> HTMLParser:
+    rows = "".join(
+        f'<tr class="txn-item"><td>{d}</td><td>join</td><td><i class="flag mod-us"></i></td>'
+        f'<td><a href="/player/{i}/p{i}">p{i}</a></td><td>Player</td><td></td></tr>'
+        for i, d in enumerate(dates, start=1)
+    )
+    return HTMLParser(f"<table class='wf-faux-table'>{rows}</table>")
+
+
+class TestParseTeamTransactionsWindow:
+    def test_window_newest_first(self):
+        html = _txn_table(["2026/06/10", "2026/06/05", "2026/05/01", "2026/04/01"])
+        result = parse_team_transactions(html, 1, since=date(2026, 5, 1), until=date(2026, 6, 6))
+
+        assert [t.player.id for t in result.transactions] == [2, 3]
+
+    def test_window_oldest_first(self):
+        html = _txn_table(["2026/04/01", "2026/05/01", "2026/06/05", "2026/06/10"])
+        result = parse_team_transactions(html, 1, since=date(2026, 5, 1), until=date(2026, 6, 6))
+
+        assert [t.player.id for t in result.transactions] == [2, 3]
+
+    def test_stops_parsing_past_window(self):
+        html = _txn_table(["2026/06/10", "2026/06/05", "2026/05/01", "2026/04/01"])
+        with patch(
+            "vlrdevapi._team.transactions.parser._parse_transaction_row",
+            wraps=_parse_transaction_row,
+        ) as parse_row:
+            parse_team_transactions(html, 1, since=date(2026, 6, 1))
+
+        assert parse_row.call_count == 2
+
+    def test_nrg_since_matches_full_parse(self):
+        html = _load_html(1034, "transactions.html")
+        full = parse_team_transactions(html, 1034)
+        since = date(2024, 1, 1)
+        windowed = parse_team_transactions(html, 1034, since=since)
+
+        assert windowed.transactions == [t for t in full.transactions if t.date is None or t.date.date() >= since]
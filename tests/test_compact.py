@@ -0,0 +1,112 @@
+import dataclasses
+import pickle
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+from selectolax.parser import HTMLParser
+
+import vlrdevapi
+from vlrdevapi._compact import slots_class, to_slots
+from vlrdevapi._event.list.models import EventListPagination
+from vlrdevapi._player.teams.models import PlayerPastTeams, PlayerTeam
+from vlrdevapi._series.performance.models import KillEntry, KillMatrix
+from vlrdevapi._series.players.models import PlayerGameStats, PlayerStats, SideStats
+from vlrdevapi.validators import sanitize_and_validate
+
+
+def _player() -> PlayerGameStats:
+    side = SideStats(rating=1.1, kills=17, deaths=12)
+    return PlayerGameStats(player_id=9, name="Boaster", agents=["Astra"], stats=PlayerStats(overall=side, attack=side, defend=side))
+
+
+def _empty_page(client, path, timeout, retry_config=None, rate_limiter=None) -> HTMLParser:
+    return HTMLParser("<html><body></body></html>")
+
+
+class TestToSlots:
+    def test_same_name_and_fields(self):
+        compact = to_slots(_player())
+        assert type(compact).__name__ == "PlayerGameStats"
+        assert not isinstance(compact, BaseModel)
+        assert not hasattr(compact, "__dict__")
+        assert [f.name for f in dataclasses.fields(compact)] == list(PlayerGameStats.model_fields)
+        assert compact.stats.attack.kills == 17
+        assert dataclasses.asdict(compact) == _player().model_dump()
+
+    def test_containers_and_plain_values(self):
+        value = {"a": [_player(), (1, "x")], "b": None}
+        compact = to_slots(value)
+        assert type(compact["a"][0]) is slots_class(PlayerGameStats)
+        assert compact["a"][1] == (1, "x")
+        assert compact["b"] is None
+
+    def test_class_created_once(self):
+        assert slots_class(SideStats) is slots_class(SideStats)
+        assert type(to_slots(SideStats())) is slots_class(SideStats)
+
+    def test_pickle(self):
+        compact = to_slots(_player())
+        assert pickle.loads(pickle.dumps(compact)) == compact
+
+    def test_properties_and_methods_kept(self):
+        assert to_slots(EventListPagination(current_page=2, total_pages=3)).has_next is True
+        matrix = to_slots(KillMatrix(entries=[KillEntry(killer="a", victim="b", kills=3)]))
+        assert matrix.lookup("a", "b").kills == 3
+        assert matrix.killers() == ["a"]
+
+    def test_container_dunders_kept(self):
+        teams = [PlayerTeam(team_id=i, name=f"T{i}", slug=f"t{i}") for i in (1, 2)]
+        compact = to_slots(PlayerPastTeams(past_teams=teams))
+        assert len(compact) == 2
+        assert [t.team_id for t in compact] == [1, 2]
+        assert compact[1].name == "T2"
+        assert compact[-1] is compact.past_teams[-1]
+        assert pickle.loads(pickle.dumps(compact)) == compact
+
+
+class TestModelBackend:
+    def test_default_returns_models(self):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_empty_page), vlrdevapi.VLRClient() as client:
+            assert isinstance(client.series.vods(1), BaseModel)
+
+    def test_slots(self):
+        with patch("vlrdevapi._base.fetch_sync", side_effect=_empty_page), vlrdevapi.VLRClient(model_backend="slots") as client:
+            info = client.series.info(1)
+            curried = client.series(1).vods()
+        assert not isinstance(info, BaseModel)
+        assert type(info).__name__ == "SeriesInfo"
+        assert not isinstance(info.team1, BaseModel)
+        assert type(curried).__name__ == "SeriesVods"
+        assert not isinstance(curried, BaseModel)
+
+    def test_nested_namespace_calls_see_models(self):
+        class Namespace:
+            def __init__(self, sync):
+                self._sync = sync
+
+            @sanitize_and_validate
+            def inner(self) -> SideStats:
+                return SideStats(kills=1)
+
+            @sanitize_and_validate
+            def outer(self) -> list[SideStats]:
+                inner = self.inner()
+                assert isinstance(inner, BaseModel)
+                return [inner]
+
+            @sanitize_and_validate
+            def pages(self) -> Iterator[SideStats]:
+                return (SideStats(kills=n) for n in range(2))
+
+        with vlrdevapi.VLRClient(model_backend="slots") as client:
+            ns = Namespace(client.series.info._sync)
+            assert not isinstance(ns.inner(), BaseModel)
+            assert not isinstance(ns.outer()[0], BaseModel)
+            assert [type(p).__name__ for p in ns.pages()] == ["SideStats", "SideStats"]
+            assert not any(isinstance(p, BaseModel) for p in ns.pages())
+
+    def test_invalid_backend_rejected(self):
+        with pytest.raises(ValueError, match="model_backend"):
+            vlrdevapi.VLRClient(model_backend="tuples")
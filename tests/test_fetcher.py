@@ -0,0 +1,96 @@
+from unittest.mock import PropertyMock, patch
+
+import httpx
+import pytest
+
+import vlrdevapi
+from vlrdevapi.fetcher import FetchedHTML, FetchedLexborHTML
+
+
+class TestFetchSyncDecoding:
+    def test_utf8_bytes_parsed_directly(self, mock_vlr):
+        body = "<p>Kovács – ✓</p>".encode()
+        mock_vlr.get("/u").respond(200, content=body, headers={"Content-Type": "text/html; charset=utf-8"})
+
+        with vlrdevapi.VLRClient() as client, patch.object(httpx.Response, "text", new_callable=PropertyMock) as text:
+            html = client.event.standings._sync._fetch("/u")
+        text.assert_not_called()
+        assert html.css_first("p").text() == "Kovács – ✓"
+
+    def test_other_charsets_decoded_via_text(self, mock_vlr):
+        body = "<p>Kovács</p>".encode("latin-1")
+        mock_vlr.get("/l").respond(200, content=body, headers={"Content-Type": "text/html; charset=iso-8859-1"})
+
+        with vlrdevapi.VLRClient() as client:
+            html = client.event.standings._sync._fetch("/l")
+        assert html.css_first("p").text() == "Kovács"
+
+
+class TestHTMLBackend:
+    BODY = '<div class="match-item"><span class="a">Sentinels</span><span class="a">FNATIC</span></div>'
+
+    def test_default_is_modest(self, mock_vlr):
+        mock_vlr.get("/m").respond(200, text=self.BODY)
+
+        with vlrdevapi.VLRClient() as client:
+            html = client.event.standings._sync._fetch("/m")
+        assert isinstance(html, FetchedHTML)
+
+    def test_lexbor_backend(self, mock_vlr):
+        mock_vlr.get("/x").respond(200, text=self.BODY)
+
+        with vlrdevapi.VLRClient(html_backend="lexbor") as client:
+            sync = client.event.standings._sync
+            html = sync._fetch("/x")
+            isolated = sync._fetch_isolated("/x")
+        assert isinstance(html, FetchedLexborHTML)
+        assert isinstance(isolated, FetchedLexborHTML)
+        assert [node.text() for node in html.css("span.a")] == ["Sentinels", "FNATIC"]
+
+    def test_backends_cached_separately(self, mock_vlr):
+        mock_vlr.get("/s").respond(200, text=self.BODY)
+
+        with vlrdevapi.VLRClient() as modest, vlrdevapi.VLRClient(html_backend="lexbor") as lexbor:
+            first = modest.event.standings._sync._fetch("/s")
+            second = lexbor.event.standings._sync._fetch("/s")
+        assert first.content_hash == second.content_hash
+        assert type(first) is not type(second)
+
+    def test_invalid_backend_rejected(self):
+        with pytest.raises(ValueError, match="html_backend"):
+            vlrdevapi.VLRClient(html_backend="html5lib")
+
+
+class TestHTMLTrimming:
+    SERIES = (
+        '<html><head><title>Series</title><script>var s = 1;</script></head><body>'
+        '<div class="header">nav</div><div class="wf-card match-header">A vs B</div>'
+        '<div class="vm-stats">stats</div></body></html>'
+    )
+
+    def test_series_pages_sliced(self, mock_vlr):
+        mock_vlr.get("/42/").respond(200, text=self.SERIES)
+
+        with vlrdevapi.VLRClient(trim_html=True) as client:
+            html = client.series.info._sync._fetch("/42/")
+        assert html.css_first("title") is None
+        assert html.css_first("script") is None
+        assert html.css_first(".header") is None
+        assert html.css_first(".match-header").text() == "A vs B"
+
+    def test_other_pages_keep_head(self, mock_vlr):
+        mock_vlr.get("/team/7").respond(200, text=self.SERIES)
+
+        with vlrdevapi.VLRClient(trim_html=True) as client:
+            html = client.team.roster._sync._fetch_isolated("/team/7")
+        assert html.css_first("title").text() == "Series"
+        assert html.css_first("script") is None
+
+    def test_disabled_by_default(self, mock_vlr):
+        mock_vlr.get("/43/").respond(200, text=self.SERIES)
+
+        with vlrdevapi.VLRClient() as client:
+            html = client.series.info._sync._fetch("/43/")
+            isolated = client.series.info._sync._fetch_isolated("/43/")
+        assert html.css_first("script") is not None
+        assert isolated.css_first(".header") is not None
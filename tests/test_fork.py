@@ -0,0 +1,177 @@
+"""Tests for the default client's locking, ``configure`` and fork resets."""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import httpx
+import pytest
+
+import vlrdevapi
+from vlrdevapi import _client, _fork
+from vlrdevapi._cache import LRUCache
+from vlrdevapi._memo import _PARSE_MEMO
+from vlrdevapi.fetcher import (
+    _DOCUMENTS,
+    RateLimiter,
+    get_html_backend,
+    get_model_backend,
+)
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+class TestDefaultClient:
+    def test_concurrent_first_use_creates_one_client(self, monkeypatch):
+        created = []
+
+        class SlowClient(_client.VLRClient):
+            def __init__(self, **kwargs):
+                time.sleep(0.05)
+                super().__init__(**kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(_client, "VLRClient", SlowClient)
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(vlrdevapi._get_default_client())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(created) == 1
+        assert all(c is created[0] for c in seen)
+
+
+class TestConfigure:
+    def test_replaces_default_client_with_merged_options(self):
+        vlrdevapi.configure(requests_per_second=0, max_retries=5)
+        vlrdevapi.configure(model_backend="slots")
+        client = vlrdevapi._get_default_client()
+
+        assert client._rate_limiter is None
+        assert client.retry_config.max_retries == 5
+        assert get_model_backend(client._client) == "slots"
+
+    def test_previous_client_closed_once_unused(self):
+        closed = []
+        before = vlrdevapi._get_default_client()
+        transport = before._client._transport
+        transport.close = lambda: closed.append(True)
+        team = before.team
+        del before
+        vlrdevapi.configure(timeout=5)
+        gc.collect()
+        assert closed == []
+
+        del team
+        gc.collect()
+        assert closed == [True]
+
+    def test_invalid_option_keeps_previous_client(self):
+        before = vlrdevapi._get_default_client()
+        with pytest.raises(ValueError, match="html_backend"):
+            vlrdevapi.configure(html_backend="nope")
+
+        assert vlrdevapi._get_default_client() is before
+        assert vlrdevapi._default_options == {}
+
+    def test_resizes_shared_caches(self):
+        for i in range(4):
+            _PARSE_MEMO.put(i, i)
+        try:
+            vlrdevapi.configure(parse_memo_size=2, document_cache_size=0)
+            assert len(_PARSE_MEMO) == 2
+            assert 3 in _PARSE_MEMO
+            _DOCUMENTS.put("key", None)
+            assert len(_DOCUMENTS) == 0
+        finally:
+            _PARSE_MEMO.resize(128)
+            _DOCUMENTS.resize(16)
+
+    def test_rejects_negative_cache_size(self):
+        with pytest.raises(ValueError, match="parse_memo_size"):
+            vlrdevapi.configure(parse_memo_size=-1)
+
+
+class TestResetAfterFork:
+    def test_client_gets_new_pool_and_namespaces(self):
+        with vlrdevapi.VLRClient(html_backend="lexbor", model_backend="slots") as client:
+            old_http, old_team = client._client, client.team
+            client._reset_after_fork()
+
+            assert client._client is not old_http
+            assert not old_http.is_closed
+            assert get_html_backend(client._client) == "lexbor"
+            assert get_model_backend(client._client) == "slots"
+            assert client.team is not old_team
+            assert client.team._info._sync._client is client._client
+            old_http.close()
+
+    def test_closed_client_stays_closed(self):
+        client = vlrdevapi.VLRClient()
+        client.close()
+        old_http = client._client
+        client._reset_after_fork()
+        assert client._client is old_http
+
+    def test_cache_is_emptied(self):
+        cache = LRUCache[int, int](maxsize=4)
+        cache.put(1, 1)
+        cache._lock.acquire()
+        cache._reset_after_fork()
+
+        assert len(cache) == 0
+
+    def test_rate_limiter_starts_fresh(self):
+        limiter = RateLimiter(1.0)
+        limiter.acquire()
+        limiter._lock.acquire()
+        limiter._reset_after_fork()
+
+        assert limiter._last_request_time == 0.0
+        assert not limiter._lock.locked()
+
+    def test_tracking_does_not_keep_objects_alive(self):
+        cache = LRUCache[int, int]()
+        ref = weakref.ref(cache)
+        assert cache in _fork._TRACKED
+        del cache
+        gc.collect()
+        assert ref() is None
+
+    def test_http_client_keeps_httpx_options(self):
+        with vlrdevapi.VLRClient(limits=httpx.Limits(max_connections=3)) as client:
+            client._reset_after_fork()
+            assert client._client._transport._pool._max_connections == 3
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is unavailable")
+def test_forked_child_uses_own_pool():
+    code = (
+        "import json, os, vlrdevapi\n"
+        "client = vlrdevapi._get_default_client()\n"
+        "parent_pool = id(client._client)\n"
+        "client.team\n"
+        "vlrdevapi._default_client_lock.acquire()\n"
+        "r, w = os.pipe()\n"
+        "if os.fork() == 0:\n"
+        "    from vlrdevapi import fetcher\n"
+        "    state = [id(client._client) != parent_pool, 'team' not in vars(client),\n"
+        "             vlrdevapi._default_client_lock.acquire(timeout=1), fetcher._CLIENT_OPTIONS_LOCK.acquire(timeout=1)]\n"
+        "    os.write(w, json.dumps(state).encode())\n"
+        "    os._exit(0)\n"
+        "os.wait()\n"
+        "vlrdevapi._default_client_lock.release()\n"
+        "print(os.read(r, 1024).decode())\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=SRC_DIR,
+    ).stdout
+    assert json.loads(out.splitlines()[-1]) == [True, True, True, True]
@@ -0,0 +1,78 @@
+"""Tests that importing vlrdevapi defers namespaces, models and their schemas."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def _probe(code: str) -> object:
+    """Run ``code`` in a fresh interpreter and return the JSON it prints."""
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, cwd=SRC_DIR,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+class TestLazyImports:
+    def test_import_loads_no_dependencies(self):
+        loaded = _probe(
+            "import json, sys, vlrdevapi\n"
+            "print(json.dumps(sorted(m for m in sys.modules if m.startswith(('vlrdevapi', 'pydantic', 'httpx')))))",
+        )
+        assert loaded == ["vlrdevapi"]
+
+    def test_client_loads_namespaces_on_first_access(self):
+        loaded = _probe(
+            "import json, sys, vlrdevapi\n"
+            "c = vlrdevapi.VLRClient()\n"
+            "before = '_team.namespace' in str(sorted(sys.modules))\n"
+            "team = c.team\n"
+            "mods = sorted(sys.modules)\n"
+            "print(json.dumps([before, 'vlrdevapi._team.namespace' in mods,"
+            " 'vlrdevapi._player.namespace' in mods, c.team is team]))",
+        )
+        assert loaded == [False, True, False, True]
+
+    def test_models_build_schemas_on_first_use(self):
+        complete = _probe(
+            "import json\n"
+            "from vlrdevapi._team.info.models import TeamInfo\n"
+            "before = TeamInfo.__pydantic_complete__\n"
+            "TeamInfo()\n"
+            "print(json.dumps([before, TeamInfo.__pydantic_complete__]))",
+        )
+        assert complete == [False, True]
+
+    def test_exports_resolve(self):
+        names = _probe(
+            "import json, vlrdevapi\n"
+            "from vlrdevapi import VLRClient\n"
+            "print(json.dumps([VLRClient.__name__, vlrdevapi.client is VLRClient]))",
+        )
+        assert names == ["VLRClient", True]
+
+    def test_submodules_resolve_as_attributes(self):
+        names = _probe(
+            "import json, vlrdevapi\n"
+            "print(json.dumps([vlrdevapi.exceptions.ValidationError.__name__,"
+            " vlrdevapi.fetcher.__name__, vlrdevapi.commons.__name__, vlrdevapi.validators.__name__]))",
+        )
+        assert names == ["ValidationError", "vlrdevapi.fetcher", "vlrdevapi.commons", "vlrdevapi.validators"]
+
+    def test_import_time_within_bound(self):
+        # A generous bound that only a heavy eager import would cross; see
+        # scripts/bench_import_time.py for the measured numbers.
+        elapsed = min(
+            _probe(
+                "import json, time\n"
+                "start = time.perf_counter()\n"
+                "import vlrdevapi\n"
+                "print(json.dumps((time.perf_counter() - start) * 1000))",
+            )
+            for _ in range(3)
+        )
+        assert elapsed < 200
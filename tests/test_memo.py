@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import httpx
+from selectolax.parser import HTMLParser
+
+import vlrdevapi
+from vlrdevapi._event.standings.parser import parse_standings
+from vlrdevapi._memo import _PARSE_MEMO, memoize_parse
+
+_STANDINGS = """
+<html><body><div class="wf-label mod-large">Prize Distribution</div>
+<div class="wf-ptable--standings">
+<div class="row"><div class="cell">Place</div><div class="cell">Prize</div><div class="cell">Team</div></div>
+<div class="row"><div class="cell">1st</div><div class="cell">$1,000</div>
+<div class="cell"><a href="/team/2/team-a"><div class="standing-item-team-name">Team A</div></a></div></div>
+</div></body></html>
+"""
+
+
+@memoize_parse()
+def _count_nodes(html, tag):
+    return len(html.css(tag))
+
+
+class TestFetchSyncDocuments:
+    def test_identical_bodies_share_document(self, mock_vlr):
+        mock_vlr.get("/event/1").respond(200, text=_STANDINGS)
+
+        with vlrdevapi.VLRClient() as client:
+            first = client.event.standings._sync._fetch("/event/1")
+            second = client.event.standings._sync._fetch("/event/1")
+        assert first is second
+        assert len(first.content_hash) == 16
+
+    def test_changed_body_builds_new_document(self, mock_vlr):
+        route = mock_vlr.get("/event/1")
+        route.side_effect = [
+            httpx.Response(200, text=_STANDINGS),
+            httpx.Response(200, text=_STANDINGS.replace("Team A", "Team B")),
+        ]
+
+        with vlrdevapi.VLRClient() as client:
+            first = client.event.standings._sync._fetch("/event/1")
+            second = client.event.standings._sync._fetch("/event/1")
+        assert first.content_hash != second.content_hash
+
+
+class TestMemoizeParse:
+    def test_unhashed_documents_always_parse(self):
+        html = HTMLParser("<p>a</p><p>b</p>")
+        assert _count_nodes(html, "p") == 2
+        assert len(_PARSE_MEMO) == 0
+
+    def test_memo_hit_skips_parser(self, mock_vlr):
+        mock_vlr.get("/event/1").respond(200, text=_STANDINGS)
+
+        with vlrdevapi.VLRClient() as client:
+            html = client.event.standings._sync._fetch("/event/1")
+        first = parse_standings(html)
+        with patch("vlrdevapi._event.standings.parser._parse_standing_row") as parse_row:
+            second = parse_standings(html)
+        parse_row.assert_not_called()
+        assert len(first) == 1
+        assert first == second
+        assert first is not second
+
+    def test_results_are_copies(self, mock_vlr):
+        mock_vlr.get("/event/1").respond(200, text=_STANDINGS)
+
+        with vlrdevapi.VLRClient() as client:
+            html = client.event.standings._sync._fetch("/event/1")
+        first = parse_standings(html)
+        first[0].place = "mutated"
+        assert parse_standings(html)[0].place == "1st"
+
+    def test_arguments_are_part_of_key(self, mock_vlr):
+        mock_vlr.get("/x").respond(200, text="<p>a</p><div>b</div><div>c</div>")
+
+        with vlrdevapi.VLRClient() as client:
+            html = client.event.standings._sync._fetch("/x")
+        assert _count_nodes(html, "p") == 1
+        assert _count_nodes(html, "div") == 2
@@ -1,4 +1,7 @@
-"""Tests verifying that every namespace with @sanitize_and_validate has a .pyi type stub."""
+"""Tests verifying that every namespace with @sanitize_and_validate has a .pyi type stub.
+
+Curried methods marked @forwarded are public API too and held to the same rule.
+"""
 
 import ast
 from pathlib import Path
@@ -7,13 +10,15 @@ import pytest
 
 SRC_DIR = Path(__file__).resolve().parent.parent / "src" / "vlrdevapi"
 
+PUBLIC_DECORATORS = frozenset({"sanitize_and_validate", "forwarded"})
+
 
 def _find_namespace_files() -> list[Path]:
     """Return all namespace.py files that use @sanitize_and_validate."""
     result = []
     for py_file in SRC_DIR.rglob("namespace.py"):
         content = py_file.read_text(encoding="utf-8")
-        if "@sanitize_and_validate" in content:
+        if any(f"@{name}" in content for name in PUBLIC_DECORATORS):
             result.append(py_file)
     return sorted(result)
 
@@ -31,7 +36,7 @@ def _get_decorated_methods(py_file: Path) -> list[tuple[str, int]]:
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             has_decorator = any(
-                isinstance(d, ast.Name) and d.id == "sanitize_and_validate"
+                isinstance(d, ast.Name) and d.id in PUBLIC_DECORATORS
                 for d in node.decorator_list
             )
             if has_decorator:
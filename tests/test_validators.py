@@ -0,0 +1,95 @@
+from datetime import date
+from typing import Literal
+
+import pytest
+
+from vlrdevapi.exceptions import ValidationError
+from vlrdevapi.validators import forwarded, sanitize_and_validate
+
+
+class _Namespace:
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    @sanitize_and_validate
+    def fetch(
+        self,
+        team_id: int,
+        game_id: int | str = "all",
+        since: date | None = None,
+        region: str | None = None,
+        state: Literal["all", "live"] = "all",
+        interval: float = 15.0,
+    ) -> tuple:
+        args = (team_id, game_id, since, region, state, interval)
+        self.calls.append(args)
+        return args
+
+
+class _Curried:
+    def __init__(self, ns: _Namespace):
+        self._ns = ns
+
+    @forwarded
+    def fetch(self, region: str | None = None) -> tuple:
+        return self._ns.fetch(7, region=region)
+
+
+class TestSanitizeAndValidate:
+    def test_passes_typed_arguments_through(self):
+        ns = _Namespace()
+        assert ns.fetch(1, game_id=2, since=date(2025, 1, 1), state="live", interval=2.5) == (
+            1, 2, date(2025, 1, 1), None, "live", 2.5,
+        )
+
+    def test_coerces_arguments(self):
+        ns = _Namespace()
+        team_id, game_id, since, region, state, interval = ns.fetch(1, since="2025-01-01", state=" live ", interval=3)
+        assert (team_id, game_id, region) == (1, "all", None)
+        assert since == date(2025, 1, 1)
+        assert state == "live"
+        assert interval == 3.0
+        assert type(interval) is float
+
+    def test_strips_strings(self):
+        _, game_id, _, region, _, _ = _Namespace().fetch(1, region=" eu ", game_id=" 3 ")
+        assert game_id == "3"
+        assert region == "eu"
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"team_id": 0}, {"team_id": "1"}, {"team_id": 1, "game_id": 0}, {"team_id": 1, "game_id": None}],
+    )
+    def test_rejects_invalid_ids(self, kwargs):
+        with pytest.raises(ValidationError):
+            _Namespace().fetch(**kwargs)
+
+    def test_rejects_invalid_types(self):
+        with pytest.raises(Exception, match="validation error"):
+            _Namespace().fetch(1, state="bad")
+
+    @pytest.mark.parametrize(
+        ("args", "kwargs", "message"),
+        [
+            ((), {}, "missing a required argument: 'team_id'"),
+            ((1,), {"team_id": 1}, "multiple values for argument 'team_id'"),
+            ((1,), {"nope": 1}, "unexpected keyword argument 'nope'"),
+            ((1, 2, None, None, "all", 1.0, 9), {}, "too many positional arguments"),
+        ],
+    )
+    def test_rejects_mismatched_arguments(self, args, kwargs, message):
+        with pytest.raises(TypeError, match=message):
+            _Namespace().fetch(*args, **kwargs)
+
+
+class TestForwarded:
+    def test_returns_method_unchanged(self):
+        def method(self):
+            return None
+
+        assert forwarded(method) is method
+
+    def test_forwarded_call_is_validated_once_downstream(self):
+        ns = _Namespace()
+        assert _Curried(ns).fetch(region=" na ") == (7, "all", None, "na", "all", 15.0)
+        assert len(ns.calls) == 1
@@ -0,0 +1,64 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from vlrdevapi._utils.columnar import Columns, collect_columns
+
+
+def _table() -> Columns:
+    table = Columns({"a": int, "b": str, "c": float, "d": bool})
+    for name, values in {"a": [1, 2], "b": ["x", "long"], "c": [0.5, 1.0], "d": [True, False]}.items():
+        table[name] += values
+    return table
+
+
+class TestColumns:
+    def test_is_a_dict_of_lists(self):
+        table = _table()
+        assert dict(table) == {"a": [1, 2], "b": ["x", "long"], "c": [0.5, 1.0], "d": [True, False]}
+        assert table.num_rows == 2
+        assert Columns({}).num_rows == 0
+
+    def test_extend(self):
+        table = _table()
+        table.extend(_table())
+        assert table.num_rows == 4
+        assert table["b"] == ["x", "long", "x", "long"]
+
+    def test_extend_rejects_other_columns(self):
+        with pytest.raises(ValueError, match="cannot extend"):
+            _table().extend(Columns({"a": int}))
+
+    def test_collect_columns_repeats_parent_values(self):
+        parents = [{"id": 1, "rows": [10, 20]}, {"id": 2, "rows": []}, {"id": 3, "rows": [30]}]
+        table = collect_columns(
+            parents,
+            lambda p: p["rows"],
+            [("id", int, lambda p: p["id"])],
+            [("value", int, lambda r: r), ("double", int, lambda r: r * 2)],
+        )
+        assert list(table) == ["id", "value", "double"]
+        assert table == {"id": [1, 1, 3], "value": [10, 20, 30], "double": [20, 40, 60]}
+
+    def test_missing_numpy(self):
+        with patch.dict(sys.modules, {"numpy": None}), pytest.raises(ImportError, match="vlrdevapi\\[numpy\\]"):
+            _table().to_numpy()
+
+    def test_missing_pyarrow(self):
+        with patch.dict(sys.modules, {"pyarrow": None}), pytest.raises(ImportError, match="vlrdevapi\\[arrow\\]"):
+            _table().to_arrow()
+
+    def test_to_numpy(self):
+        pytest.importorskip("numpy")
+        array = _table().to_numpy()
+        assert array.dtype.names == ("a", "b", "c", "d")
+        assert array["a"].tolist() == [1, 2]
+        assert array["b"].tolist() == ["x", "long"]
+        assert array["d"].tolist() == [True, False]
+
+    def test_to_arrow(self):
+        pytest.importorskip("pyarrow")
+        batch = _table().to_arrow()
+        assert batch.num_rows == 2
+        assert batch.to_pydict() == dict(_table())
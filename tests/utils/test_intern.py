@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from selectolax.parser import HTMLParser
+
+from vlrdevapi._team.completed_matches.parser import parse_team_completed_matches
+from vlrdevapi._team.stats.parser import _normalize_agent_name
+from vlrdevapi._utils import intern
+from vlrdevapi._utils.intern import clear_interned, intern_text
+
+
+def _fresh(text: str) -> str:
+    # Built at runtime so it is never the same object as a literal.
+    return "".join(list(text))
+
+
+class TestInternText:
+    def setup_method(self):
+        clear_interned()
+
+    def teardown_method(self):
+        clear_interned()
+
+    def test_equal_values_share_one_object(self):
+        first = intern_text(_fresh("Ascent"))
+        second = intern_text(_fresh("Ascent"))
+        assert first == second == "Ascent"
+        assert first is second
+
+    def test_clear_forgets_values(self):
+        first = intern_text(_fresh("Bind"))
+        clear_interned()
+        assert intern_text(_fresh("Bind")) is not first
+
+    def test_table_is_bounded(self):
+        with patch.object(intern, "MAX_INTERNED", 1):
+            intern_text(_fresh("Haven"))
+            value = _fresh("Split")
+            assert intern_text(value) is value
+            assert intern_text(_fresh("Split")) is not value
+
+
+class TestParsersIntern:
+    def test_agent_names_are_shared(self):
+        a = _normalize_agent_name("/img/vlr/game/agents/sova.png")
+        b = _normalize_agent_name("/img/vlr/game/agents/sova.png")
+        assert a is b
+
+    def test_match_events_and_stages_are_shared(self):
+        item = (
+            '<a class="wf-card fc-flex m-item" href="/{id}/a-vs-b"><div class="m-item-event">'
+            '<div style="font-weight: 700">Valorant Champions 2025</div>Playoffs</div></a>'
+        )
+        html = HTMLParser(f"<html><body>{item.format(id=1)}{item.format(id=2)}</body></html>")
+        first, second = parse_team_completed_matches(html, team_id=1).matches
+        assert first.event == "Valorant Champions 2025"
+        assert first.event is second.event
+        assert first.stage == "Playoffs"
+        assert first.stage is second.stage
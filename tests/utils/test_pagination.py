@@ -0,0 +1,133 @@
+import threading
+from dataclasses import dataclass, field
+
+import pytest
+
+from vlrdevapi._utils.pagination import collect_all_pages_concurrent, iter_pages_sync
+
+
+@dataclass
+class _Page:
+    matches: list = field(default_factory=list)
+    has_next_page: bool = True
+
+
+def _site(last_page: int, window: int | None = None):
+    """Build fetch/parse/last-page callables for a fake paginated listing.
+
+    With ``window`` set, each page only links up to ``page + window``,
+    like a windowed pagination bar.
+    """
+    fetched: list[str] = []
+    lock = threading.Lock()
+
+    def fetch(url: str) -> int:
+        with lock:
+            fetched.append(url)
+        return int(url.rsplit("=", 1)[1])
+
+    def parse(page: int) -> _Page:
+        return _Page(matches=[f"p{page}-a", f"p{page}-b"])
+
+    def last(page: int) -> int:
+        return last_page if window is None else min(last_page, page + window)
+
+    return fetch, parse, last, fetched
+
+
+class TestCollectAllPagesConcurrent:
+    def test_combines_pages_in_order(self):
+        fetch, parse, last, fetched = _site(6)
+        result = collect_all_pages_concurrent(
+            fetch_fn=fetch, fetch_page_fn=fetch, build_url=lambda p: f"/x?page={p}",
+            parse_fn=parse, last_page_fn=last, max_page=0,
+        )
+        assert result.matches == [f"p{p}-{s}" for p in range(1, 7) for s in "ab"]
+        assert result.has_next_page is False
+        assert sorted(fetched) == sorted(f"/x?page={p}" for p in range(1, 7))
+
+    def test_respects_max_page(self):
+        fetch, parse, last, fetched = _site(10)
+        result = collect_all_pages_concurrent(
+            fetch_fn=fetch, fetch_page_fn=fetch, build_url=lambda p: f"/x?page={p}",
+            parse_fn=parse, last_page_fn=last, max_page=3,
+        )
+        assert len(fetched) == 3
+        assert result.matches[-1] == "p3-b"
+
+    def test_single_page(self):
+        fetch, parse, last, fetched = _site(1)
+        result = collect_all_pages_concurrent(
+            fetch_fn=fetch, fetch_page_fn=fetch, build_url=lambda p: f"/x?page={p}",
+            parse_fn=parse, last_page_fn=last, max_page=0,
+        )
+        assert fetched == ["/x?page=1"]
+        assert result.matches == ["p1-a", "p1-b"]
+
+    def test_follows_windowed_pagination(self):
+        fetch, parse, last, fetched = _site(9, window=2)
+        result = collect_all_pages_concurrent(
+            fetch_fn=fetch, fetch_page_fn=fetch, build_url=lambda p: f"/x?page={p}",
+            parse_fn=parse, last_page_fn=last, max_page=0,
+        )
+        assert len(fetched) == 9
+        assert result.matches == [f"p{p}-{s}" for p in range(1, 10) for s in "ab"]
+
+    def test_propagates_fetch_errors(self):
+        fetch, parse, last, _ = _site(4)
+
+        def failing(url: str) -> int:
+            if url.endswith("=3"):
+                raise RuntimeError("boom")
+            return fetch(url)
+
+        with pytest.raises(RuntimeError):
+            collect_all_pages_concurrent(
+                fetch_fn=fetch, fetch_page_fn=failing, build_url=lambda p: f"/x?page={p}",
+                parse_fn=parse, last_page_fn=last, max_page=0,
+            )
+
+
+class TestIterPagesSync:
+    def _iter(self, last_page: int, **kwargs):
+        fetch, parse, last, fetched = _site(last_page)
+        pages = iter_pages_sync(
+            fetch_fn=fetch, fetch_page_fn=fetch, build_url=lambda p: f"/x?page={p}",
+            parse_fn=parse, has_next_fn=lambda html, p: p < last(html), **kwargs,
+        )
+        return pages, fetched
+
+    def test_yields_pages_in_order(self):
+        pages, fetched = self._iter(4)
+        assert [page.matches[0] for page in pages] == ["p1-a", "p2-a", "p3-a", "p4-a"]
+        assert fetched == [f"/x?page={p}" for p in range(1, 5)]
+
+    def test_prefetches_one_page_ahead(self):
+        pages, fetched = self._iter(5)
+        assert fetched == []
+        next(pages)
+        next(pages)
+        pages.close()
+        assert fetched[:2] == ["/x?page=1", "/x?page=2"]
+        assert len(fetched) <= 3
+
+    def test_start_and_max_page(self):
+        pages, fetched = self._iter(10, start_page=3, max_page=5)
+        assert [page.matches[0] for page in pages] == ["p3-a", "p4-a", "p5-a"]
+        assert fetched == ["/x?page=3", "/x?page=4", "/x?page=5"]
+
+    def test_propagates_prefetch_errors(self):
+        fetch, parse, last, _ = _site(3)
+
+        def failing(url: str) -> int:
+            if url.endswith("=2"):
+                raise RuntimeError("boom")
+            return fetch(url)
+
+        pages = iter_pages_sync(
+            fetch_fn=fetch, fetch_page_fn=failing, build_url=lambda p: f"/x?page={p}",
+            parse_fn=parse, has_next_fn=lambda html, p: p < last(html),
+        )
+        assert next(pages).matches[0] == "p1-a"
+        with pytest.raises(RuntimeError):
+            next(pages)
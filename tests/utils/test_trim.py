@@ -0,0 +1,48 @@
+from selectolax.parser import HTMLParser
+
+from vlrdevapi._utils.trim import SERIES, STRIP_ONLY, Trim, trim_for, trim_html
+
+PAGE = (
+    b"<html><head><title>T</title><script>var a = '<div class=\"match-header\">';</script>"
+    b"<STYLE type='text/css'>.x{}</STYLE></head><body><div class=\"nav\">nav</div>"
+    b"<!-- <div class=\"match-header\"> -->"
+    b"<div class=\"wf-card match-header\"><div class=\"match-header-event\">Event</div></div>"
+    b"<noscript><img src=\"/px\"></noscript><div class=\"vm-stats\">stats</div></body></html>"
+)
+
+
+class TestTrimFor:
+    def test_series_routes(self):
+        assert trim_for("/12345") is SERIES
+        assert trim_for("/12345/") is SERIES
+        assert trim_for("/12345/team-a-vs-team-b") is SERIES
+
+    def test_other_routes_only_strip(self):
+        for path in ("/matches", "/team/2", "/event/matches/1", "/player/9/"):
+            assert trim_for(path) is STRIP_ONLY
+
+
+class TestTrimHtml:
+    def test_strip_removes_scripts_styles_and_comments(self):
+        trimmed = trim_html(PAGE, STRIP_ONLY)
+        assert b"<title>T</title>" in trimmed
+        for gone in (b"var a", b".x{}", b"<!--", b"/px"):
+            assert gone not in trimmed
+        html = HTMLParser(trimmed)
+        assert [n.text() for n in html.css(".match-header")] == ["Event"]
+        assert html.css_first(".vm-stats").text() == "stats"
+
+    def test_series_starts_at_match_header(self):
+        trimmed = trim_html(PAGE, SERIES)
+        assert trimmed.startswith(b'<div class="wf-card match-header">')
+        assert HTMLParser(trimmed).css_first(".vm-stats").text() == "stats"
+
+    def test_missing_marker_keeps_page(self):
+        page = b"<html><body><div class=\"match-header-event\">x</div></body></html>"
+        assert trim_html(page, SERIES) == page
+
+    def test_unclosed_script_drops_rest(self):
+        assert trim_html(b"<p>a</p><script>var b", STRIP_ONLY) == b"<p>a</p>"
+
+    def test_noop_trim(self):
+        assert trim_html(PAGE, Trim(strip=False)) == PAGE